@@ -0,0 +1,68 @@
+"""Create order number counter
+
+Revision ID: 3c8a1f5d92b6
+Revises: 9b3e6c1d2a47
+Create Date: 2026-10-17 15:20:44.218306
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8a1f5d92b6'
+down_revision: Union[str, None] = '9b3e6c1d2a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ORDER_NUMBER_RE = re.compile(r"^(\d{6})-(\d+)$")
+
+
+def upgrade() -> None:
+    op.create_table('order_number_counter',
+    sa.Column('day', sa.String(length=6), nullable=False),
+    sa.Column('last_value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+
+    bind = op.get_bind()
+    order = sa.table('order', sa.column('id', sa.Integer), sa.column('orderNumber', sa.String))
+    counter = sa.table('order_number_counter', sa.column('day', sa.String), sa.column('last_value', sa.Integer))
+    rows = bind.execute(
+        sa.select(order.c.id, order.c.orderNumber).where(order.c.orderNumber.isnot(None)).order_by(order.c.id)
+    ).all()
+
+    # 날짜별 최대 일련번호 (문자열 정렬이 아닌 숫자 기준)
+    last_values = {}
+    for _, number in rows:
+        match = ORDER_NUMBER_RE.match(number)
+        if match:
+            day, sequence = match.group(1), int(match.group(2))
+            last_values[day] = max(last_values.get(day, 0), sequence)
+
+    # 동시 저장으로 중복 발급된 번호는 먼저 생성된 주문서만 유지하고 나머지는 같은 날짜의 다음 번호로 재발급
+    seen = set()
+    for order_id, number in rows:
+        if number not in seen:
+            seen.add(number)
+            continue
+        match = ORDER_NUMBER_RE.match(number)
+        day = match.group(1) if match else number[:6]
+        last_values[day] = last_values.get(day, 0) + 1
+        new_number = f"{day}-{last_values[day]:03d}"
+        seen.add(new_number)
+        bind.execute(order.update().where(order.c.id == order_id).values(orderNumber=new_number))
+
+    if last_values:
+        bind.execute(counter.insert(), [{"day": day, "last_value": value} for day, value in last_values.items()])
+
+    op.create_index('ux_order_orderNumber', 'order', ['orderNumber'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ux_order_orderNumber', table_name='order')
+    op.drop_table('order_number_counter')
@@ -0,0 +1,34 @@
+"""Create order filter indexes
+
+Revision ID: 5d1f0e2b7c94
+Revises: ac7fb9b8624c
+Create Date: 2026-10-17 11:02:17.884120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f0e2b7c94'
+down_revision: Union[str, None] = 'ac7fb9b8624c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_order_created_at_id', 'order', ['created_at', 'id'], unique=False)
+    op.create_index('ix_order_isTemporary_created_at_id', 'order', ['isTemporary', 'created_at', 'id'], unique=False)
+    op.create_index('ix_order_event_id_created_at_id', 'order', ['event_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_order_event_id_status_created_at', 'order', ['event_id', 'status', 'created_at'], unique=False)
+    op.create_index(op.f('ix_event_name'), 'event', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_event_name'), table_name='event')
+    op.drop_index('ix_order_event_id_status_created_at', table_name='order')
+    op.drop_index('ix_order_event_id_created_at_id', table_name='order')
+    op.drop_index('ix_order_isTemporary_created_at_id', table_name='order')
+    op.drop_index('ix_order_created_at_id', table_name='order')
@@ -0,0 +1,54 @@
+"""Create order status history
+
+Revision ID: 7e2b4d9a1c38
+Revises: 3c8a1f5d92b6
+Create Date: 2026-10-17 18:05:12.640931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e2b4d9a1c38'
+down_revision: Union[str, None] = '3c8a1f5d92b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 기존 주문서의 현재 상태를 마지막 수정 시각 기준 이력으로 등록 (이후 변경부터 체류 시간 계산 가능)
+BACKFILL_SQL = """
+INSERT INTO order_status_history (order_id, status, changed_at)
+SELECT id, status, COALESCE(updated_at, created_at)
+FROM "order"
+WHERE status IS NOT NULL AND COALESCE(updated_at, created_at) IS NOT NULL
+"""
+
+
+def upgrade() -> None:
+    # order 테이블에서 만든 orderstatus 타입을 그대로 사용
+    status_type = postgresql.ENUM(
+        'Order_Completed', 'Packaging_Completed', 'Repair_Received', 'Repair_Completed', 'In_delivery',
+        'Delivery_completed', 'Receipt_completed', 'Accommodation', 'Counsel',
+        name='orderstatus', create_type=False,
+    )
+    op.create_table('order_status_history',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('order_id', sa.Integer(), nullable=False),
+    sa.Column('status', status_type, nullable=False),
+    sa.Column('changed_at', sa.TIMESTAMP(), nullable=False),
+    sa.ForeignKeyConstraint(['order_id'], ['order.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_order_status_history_order_id_changed_at', 'order_status_history', ['order_id', 'changed_at'], unique=False)
+    op.create_index('ix_order_status_history_status_changed_at', 'order_status_history', ['status', 'changed_at'], unique=False)
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_order_status_history_status_changed_at', table_name='order_status_history')
+    op.drop_index('ix_order_status_history_order_id_changed_at', table_name='order_status_history')
+    op.drop_table('order_status_history')
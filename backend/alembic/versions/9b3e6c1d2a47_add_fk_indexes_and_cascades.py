@@ -0,0 +1,74 @@
+"""Add foreign key indexes and cascades
+
+Revision ID: 9b3e6c1d2a47
+Revises: 5d1f0e2b7c94
+Create Date: 2026-10-17 13:25:40.116583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e6c1d2a47'
+down_revision: Union[str, None] = '5d1f0e2b7c94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 이름 없이 생성된 외래 키를 PostgreSQL 기본 이름(<table>_<column>_fkey)으로 참조
+# (SQLite는 batch 모드에서 반영된 제약에 같은 이름을 부여)
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+# ON DELETE CASCADE 로 변경할 외래 키: (테이블, 컬럼, 참조 테이블)
+CASCADE_FOREIGN_KEYS = [
+    ('orderItems', 'order_id', 'order'),
+    ('payments', 'order_id', 'order'),
+    ('alterationDetails', 'order_id', 'order'),
+    ('form_repair', 'form_id', 'form'),
+    ('form_category', 'form_id', 'form'),
+    ('form_category', 'category_id', 'category'),
+    ('product', 'category_id', 'category'),
+    ('product_attributes', 'product_id', 'product'),
+]
+
+# 조인/삭제에 사용되는 외래 키 인덱스: (테이블, 컬럼)
+FOREIGN_KEY_INDEXES = [
+    ('orderItems', 'order_id'),
+    ('orderItems', 'product_id'),
+    ('orderItems', 'attribute_id'),
+    ('payments', 'order_id'),
+    ('alterationDetails', 'order_id'),
+    ('alterationDetails', 'form_repair_id'),
+    ('form_repair', 'form_id'),
+    ('form_category', 'form_id'),
+    ('form_category', 'category_id'),
+    ('product', 'category_id'),
+    ('product_attributes', 'product_id'),
+    ('product_attributes', 'attribute_id'),
+    ('event', 'form_id'),
+    ('order', 'author_id'),
+    ('order', 'affiliation_id'),
+]
+
+
+def _replace_foreign_keys(ondelete) -> None:
+    for table, column, referent in CASCADE_FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            batch_op.drop_constraint(name, type_='foreignkey')
+            batch_op.create_foreign_key(name, referent, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    for table, column in FOREIGN_KEY_INDEXES:
+        op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False)
+    _replace_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    _replace_foreign_keys(None)
+    for table, column in reversed(FOREIGN_KEY_INDEXES):
+        op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table)
@@ -0,0 +1,85 @@
+"""Create order search index
+
+Revision ID: ac7fb9b8624c
+Revises: a8f7bf144469
+Create Date: 2026-10-17 10:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ac7fb9b8624c'
+down_revision: Union[str, None] = 'a8f7bf144469'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 기존 주문서의 검색 문서 생성 (services/order_search.search_document_expression 과 동일한 구성)
+BACKFILL_SQL = """
+INSERT INTO order_search (order_id, document)
+SELECT o.id,
+       COALESCE(o."groomName", '') || char_nl || COALESCE(o."brideName", '') || char_nl ||
+       COALESCE(o.address, '') || char_nl || COALESCE(o.contact, '') || char_nl ||
+       COALESCE(o.notes, '') || char_nl || COALESCE(o.alter_notes, '') || char_nl ||
+       COALESCE(a.name, '') || char_nl || COALESCE(af.name, '')
+FROM "order" o
+LEFT OUTER JOIN author a ON o.author_id = a.id
+LEFT OUTER JOIN affiliation af ON o.affiliation_id = af.id
+"""
+
+
+def upgrade() -> None:
+    op.create_table('order_search',
+    sa.Column('order_id', sa.Integer(), nullable=False),
+    sa.Column('document', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['order_id'], ['order.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('order_id')
+    )
+
+    dialect = op.get_bind().dialect.name
+    newline = "chr(10)" if dialect == "postgresql" else "char(10)"
+    op.execute(BACKFILL_SQL.replace("char_nl", newline))
+
+    if dialect == "postgresql":
+        # ILIKE '%검색어%' 를 인덱스로 처리하기 위한 trigram GIN 인덱스
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX ix_order_search_document_trgm ON order_search USING gin (document gin_trgm_ops)")
+    elif dialect == "sqlite":
+        # order_search 를 원본으로 하는 FTS5 trigram 인덱스와 동기화 트리거
+        op.execute(
+            "CREATE VIRTUAL TABLE order_search_fts USING fts5("
+            "document, content='order_search', content_rowid='order_id', tokenize='trigram')"
+        )
+        op.execute("""
+            CREATE TRIGGER order_search_ai AFTER INSERT ON order_search BEGIN
+                INSERT INTO order_search_fts(rowid, document) VALUES (new.order_id, new.document);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER order_search_ad AFTER DELETE ON order_search BEGIN
+                INSERT INTO order_search_fts(order_search_fts, rowid, document) VALUES ('delete', old.order_id, old.document);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER order_search_au AFTER UPDATE ON order_search BEGIN
+                INSERT INTO order_search_fts(order_search_fts, rowid, document) VALUES ('delete', old.order_id, old.document);
+                INSERT INTO order_search_fts(rowid, document) VALUES (new.order_id, new.document);
+            END
+        """)
+        op.execute("INSERT INTO order_search_fts(order_search_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_order_search_document_trgm")
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS order_search_au")
+        op.execute("DROP TRIGGER IF EXISTS order_search_ad")
+        op.execute("DROP TRIGGER IF EXISTS order_search_ai")
+        op.execute("DROP TABLE IF EXISTS order_search_fts")
+    op.drop_table('order_search')
@@ -0,0 +1,48 @@
+"""Create order daily rollup
+
+Revision ID: b4f19c7e2d05
+Revises: 7e2b4d9a1c38
+Create Date: 2026-10-17 20:41:37.918254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4f19c7e2d05'
+down_revision: Union[str, None] = '7e2b4d9a1c38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 기존 주문서 집계 (services/order_rollup.rollup_source 와 동일한 구성)
+BACKFILL_SQL = """
+INSERT INTO order_daily_rollup (event_id, day, status, order_count, "totalPrice", "advancePayment", "balancePayment")
+SELECT event_id, date(created_at), COALESCE(CAST(status AS VARCHAR), ''), count(*),
+       COALESCE(sum("totalPrice"), 0), COALESCE(sum("advancePayment"), 0), COALESCE(sum("balancePayment"), 0)
+FROM "order"
+WHERE "isTemporary" = false
+GROUP BY event_id, date(created_at), COALESCE(CAST(status AS VARCHAR), '')
+"""
+
+
+def upgrade() -> None:
+    op.create_table('order_daily_rollup',
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=32), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('totalPrice', sa.DECIMAL(precision=14, scale=2), nullable=False),
+    sa.Column('advancePayment', sa.DECIMAL(precision=14, scale=2), nullable=False),
+    sa.Column('balancePayment', sa.DECIMAL(precision=14, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['event.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('event_id', 'day', 'status')
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_table('order_daily_rollup')
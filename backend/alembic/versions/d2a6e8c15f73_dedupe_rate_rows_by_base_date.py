@@ -0,0 +1,37 @@
+"""Dedupe rate rows by base date
+
+Revision ID: d2a6e8c15f73
+Revises: b4f19c7e2d05
+Create Date: 2026-10-18 00:12:08.411527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a6e8c15f73'
+down_revision: Union[str, None] = 'b4f19c7e2d05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 기준일이 모두 없는 행 삭제, 같은 기준일 조합은 마지막에 저장된 행만 남김
+DEDUPE_SQL = """
+DELETE FROM rate
+WHERE (gold_bas_dt IS NULL AND exchange_bas_dt IS NULL)
+   OR id NOT IN (SELECT max(id) FROM rate GROUP BY gold_bas_dt, exchange_bas_dt)
+"""
+
+
+def upgrade() -> None:
+    op.execute(DEDUPE_SQL)
+    op.create_index('uq_rate_gold_bas_dt_exchange_bas_dt', 'rate', ['gold_bas_dt', 'exchange_bas_dt'], unique=True)
+    op.create_index('ix_rate_exchange_bas_dt', 'rate', ['exchange_bas_dt'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rate_exchange_bas_dt', table_name='rate')
+    op.drop_index('uq_rate_gold_bas_dt_exchange_bas_dt', table_name='rate')
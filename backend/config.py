@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from typing import Optional
 from dotenv import load_dotenv
 import os
 
@@ -8,4 +9,41 @@ load_dotenv()
 class Settings(BaseSettings):
     DATABASE_URL: str
 
+    # 커넥션 풀 설정 (워커 프로세스당 적용)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800  # 호스팅 DB의 유휴 연결 종료 전에 재연결 (초)
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 연결 상태 확인
+
+    # 읽기 전용 복제본 (설정 시 조회 API는 복제본에서 처리)
+    READ_DATABASE_URL: Optional[str] = None
+    READ_YOUR_WRITES_SECONDS: int = 10  # 쓰기 후 해당 클라이언트의 조회를 primary로 보내는 시간 (초)
+
+    # 주문서 내보내기 작업 (/exports)
+    EXPORT_DIR: Optional[str] = None  # 결과 파일 저장 경로 (미설정 시 임시 디렉터리)
+    EXPORT_WORKERS: int = 2
+    EXPORT_TTL_SECONDS: int = 3600  # 완료된 결과 파일 보관 시간 (초)
+    EVENT_WORKBOOK_PROCESSES: int = 4  # 이벤트 통합 워크북 시트 생성 프로세스 수
+
+    # 오래된 임시 주문서 정리
+    TEMP_ORDER_PURGE_ENABLED: bool = True
+    TEMP_ORDER_MAX_AGE_DAYS: int = 30  # 마지막 수정 후 이 기간이 지난 임시 주문서를 삭제 (일)
+    TEMP_ORDER_PURGE_INTERVAL_SECONDS: int = 3600
+    TEMP_ORDER_PURGE_BATCH_SIZE: int = 200  # 한 트랜잭션에서 삭제할 주문서 수
+    TEMP_ORDER_PURGE_PAUSE_SECONDS: float = 0.2  # 배치 사이 대기 시간 (초)
+
+    # 금 시세/환율 백그라운드 갱신 (워커가 여러 개면 한 워커에서만 켜도 됨)
+    RATE_REFRESH_ENABLED: bool = True
+    RATE_REFRESH_DELAY_SECONDS: int = 60  # 고시 시각(11시) 이후 갱신까지 대기 시간 (초)
+    RATE_REFRESH_RETRY_SECONDS: int = 600  # 갱신 실패 시 재시도 간격 (초)
+    RATE_CACHE_TTL_SECONDS: int = 300  # 최신 시세 프로세스 내 캐시 유지 시간 (초), 응답 Cache-Control max-age
+    RATE_GOLD_ENDPOINT: str = "https://apis.data.go.kr/1160100/service/GetGeneralProductInfoService/getGoldPriceInfo"
+    RATE_EXCHANGE_ENDPOINT: str = "https://www.koreaexim.go.kr/site/program/financial/exchangeJSON"
+    RATE_LOOKBACK_DAYS: int = 5  # 오늘 데이터가 없을 때 거슬러 올라가 조회할 일수
+    RATE_HTTP_TIMEOUT: float = 5.0  # 외부 API 요청 타임아웃 (초)
+    RATE_HTTP_CONNECT_TIMEOUT: float = 3.0
+    RATE_HTTP_RETRIES: int = 2  # 연결 오류/타임아웃/5xx 재시도 횟수
+    RATE_HTTP_BACKOFF_SECONDS: float = 0.2  # 첫 재시도 대기 시간 (이후 2배씩 증가)
+
 settings = Settings()
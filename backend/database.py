@@ -1,25 +1,103 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from fastapi import Request
 from config import settings
+from services.db_pool import pool_options
+from services.db_routing import prefers_primary
 import os
+from datetime import datetime, timezone
 
-# 데이터베이스 URL 설정
-database_url = settings.DATABASE_URL
 
 # 만약 'postgres://'로 시작하면 'postgresql://'로 변경
-if database_url.startswith("postgres://"):
-    database_url = database_url.replace("postgres://", "postgresql://", 1)
+def normalize_url(url: str) -> str:
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+# 데이터베이스 URL 설정
+database_url = normalize_url(settings.DATABASE_URL)
+read_database_url = normalize_url(settings.READ_DATABASE_URL) if settings.READ_DATABASE_URL else None
+
+
+# 비동기 드라이버 URL로 변환 (postgresql -> asyncpg, sqlite -> aiosqlite)
+def to_async_url(url: str) -> str:
+    if url.startswith("postgresql://"):
+        # asyncpg는 sslmode 대신 ssl 파라미터를 사용
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1).replace("sslmode=", "ssl=")
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+# SQLite는 연결마다 외래 키 제약(ON DELETE CASCADE 포함)을 켜야 함
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+# SQLAlchemy 엔진 생성 (스크립트/백그라운드 작업용 동기 엔진)
+engine = create_engine(database_url, **pool_options(database_url, settings))
+
+# 라우터용 비동기 엔진
+async_engine = create_async_engine(
+    to_async_url(database_url), **pool_options(database_url, settings, is_async=True)
+)
+
+# 조회 API용 복제본 엔진 (READ_DATABASE_URL 미설정 시 primary 공유)
+if read_database_url:
+    read_async_engine = create_async_engine(
+        to_async_url(read_database_url), **pool_options(read_database_url, settings, is_async=True)
+    )
+else:
+    read_async_engine = async_engine
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(database_url)
+REPLICA_ENABLED = read_async_engine is not async_engine
+
+# 풀 상태 조회 대상 엔진 (/internal/db-pool)
+POOL_ENGINES = {
+    "primary": async_engine.sync_engine,
+    "primary_sync": engine,
+}
+if REPLICA_ENABLED:
+    POOL_ENGINES["replica"] = read_async_engine.sync_engine
+
+for _engine in POOL_ENGINES.values():
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine, "connect", _enable_sqlite_foreign_keys)
 
 # 세션 로컬 정의
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 세션 로컬 정의 (커밋 후에도 로드된 값을 그대로 사용)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+ReadAsyncSessionLocal = async_sessionmaker(bind=read_async_engine, autoflush=False, expire_on_commit=False)
+
 # 베이스 클래스 생성
 Base = declarative_base()
 
+# DB 시각 컬럼(TIMESTAMP, 타임존 없음)에 저장할 현재 UTC 시각
+# asyncpg는 타임존 없는 컬럼에 aware datetime을 바인딩하면 오류가 나므로 tzinfo 제거
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+# INSERT ... ON CONFLICT DO UPDATE(upsert)를 지원하는 DB별 insert 구문
+DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+def dialect_insert(db, table):
+    """세션이 연결된 DB의 insert 구문 (on_conflict_do_update 사용 가능)"""
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name not in DIALECT_INSERTS:
+        raise RuntimeError(f"{dialect_name} 은(는) upsert(INSERT ... ON CONFLICT)를 지원하지 않습니다.")
+    return DIALECT_INSERTS[dialect_name](table)
+
 # 데이터베이스 세션 종속성
 def get_db():
     db = SessionLocal()
@@ -27,3 +105,17 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# 비동기 데이터베이스 세션 종속성
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 조회 전용 비동기 세션 종속성
+# 복제본을 사용하되, 최근에 쓰기를 한 클라이언트는 복제 지연 동안 primary에서 조회 (read-your-writes)
+def read_session_factory(request: Request):
+    return AsyncSessionLocal if prefers_primary(request) else ReadAsyncSessionLocal
+
+async def get_read_db(request: Request):
+    async with read_session_factory(request)() as db:
+        yield db
@@ -1,10 +1,17 @@
 import os
 import json
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from database import get_db
+from config import settings
+from database import async_engine, read_async_engine, REPLICA_ENABLED
+from services.db_routing import PRIMARY_STICKY_HEADER, SAFE_METHODS, mark_primary_sticky
+from services.export_jobs import export_jobs
+from services.event_workbook import shutdown_process_pool
+from services.temp_order_purge import purge_periodically as purge_temporary_orders_periodically
+from services.rate_refresher import rate_refresher
+from services.rates import close_http_clients
 from models import *
 from routes import *
 
@@ -15,7 +22,25 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 주석 처리된 데이터 초기화 로직
+    # 내보내기 작업 풀 시작 및 만료 파일 주기적 정리
+    export_jobs.start()
+    export_cleanup = asyncio.create_task(export_jobs.purge_periodically())
+    # 오래된 임시 주문서 주기적 삭제
+    temp_order_purge = asyncio.create_task(purge_temporary_orders_periodically()) if settings.TEMP_ORDER_PURGE_ENABLED else None
+    # 금 시세/환율 갱신 (시작 시 1회, 이후 매일 고시 시각 직후)
+    rate_refresher.start()
     yield
+    rate_refresher.stop()
+    await close_http_clients()
+    export_cleanup.cancel()
+    if temp_order_purge:
+        temp_order_purge.cancel()
+    export_jobs.shutdown()
+    shutdown_process_pool()
+    # 종료 시 비동기 엔진의 커넥션 풀 정리
+    await async_engine.dispose()
+    if REPLICA_ENABLED:
+        await read_async_engine.dispose()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -38,8 +63,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # 모든 HTTP 메서드 허용
     allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=[PRIMARY_STICKY_HEADER],  # 프론트엔드가 읽어서 다음 요청에 다시 보냄 (read-your-writes)
 )
 
+# 쓰기 요청 이후 일정 시간 동안 해당 클라이언트의 조회를 primary로 고정 (복제 지연 대응)
+@app.middleware("http")
+async def read_your_writes(request, call_next):
+    response = await call_next(request)
+    if REPLICA_ENABLED and request.method not in SAFE_METHODS and response.status_code < 400:
+        mark_primary_sticky(response, settings.READ_YOUR_WRITES_SECONDS)
+    return response
+
 # 라우트 등록
 app.include_router(auth_routes.router)
 app.include_router(event_routes.router)
@@ -49,6 +83,8 @@ app.include_router(affiliation_routes.router)
 app.include_router(category_routes.router)
 app.include_router(form_routes.router)
 app.include_router(rates_routes.router)
+app.include_router(internal_routes.router)
+app.include_router(export_routes.router)
 
 # 기본 엔드포인트
 @app.get("/")
@@ -14,5 +14,9 @@ from .orderItems import OrderItems
 from .payments import Payments
 from .alterationDetails import AlterationDetails
 from .rate import Rate
+from .order_search import OrderSearch
+from .order_number_counter import OrderNumberCounter
+from .order_status_history import OrderStatusHistory
+from .order_daily_rollup import OrderDailyRollup
 
 from database import Base
\ No newline at end of file
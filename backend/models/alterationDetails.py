@@ -6,8 +6,8 @@ class AlterationDetails(Base):
     __tablename__ = 'alterationDetails'
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
-    order_id = Column(Integer, ForeignKey('order.id'), nullable=False)
-    form_repair_id = Column(Integer, ForeignKey('form_repair.id'), nullable=False)
+    order_id = Column(Integer, ForeignKey('order.id', ondelete='CASCADE'), nullable=False, index=True)
+    form_repair_id = Column(Integer, ForeignKey('form_repair.id'), nullable=False, index=True)
     figure = Column(Float, nullable=True)
     alterationFigure = Column(Float, nullable=True)
 
@@ -10,5 +10,5 @@ class Category(Base):
     name = Column(String(255), nullable=True)
     created_at = Column(TIMESTAMP, default=func.now(), nullable=False)
     
-    form_categories = relationship('FormCategory', back_populates='category')
-    products = relationship('Product', back_populates="category")
\ No newline at end of file
+    form_categories = relationship('FormCategory', back_populates='category', cascade='all, delete', passive_deletes=True)
+    products = relationship('Product', back_populates="category", cascade='all, delete', passive_deletes=True)
\ No newline at end of file
@@ -6,8 +6,8 @@ class Event(Base):
     __tablename__ = 'event'
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
-    name = Column(String(255), nullable=True)
-    form_id = Column(Integer, ForeignKey('form.id'), nullable=False)
+    name = Column(String(255), nullable=True, index=True)
+    form_id = Column(Integer, ForeignKey('form.id'), nullable=False, index=True)
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
     inProgress = Column(Boolean, nullable=True)
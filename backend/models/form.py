@@ -12,5 +12,5 @@ class Form(Base):
 
     # Relationships
     events = relationship('Event', back_populates='form')
-    form_categories = relationship('FormCategory', back_populates="form")
-    form_repairs = relationship("FormRepair", back_populates="form")
\ No newline at end of file
+    form_categories = relationship('FormCategory', back_populates="form", cascade='all, delete', passive_deletes=True)
+    form_repairs = relationship("FormRepair", back_populates="form", cascade='all, delete', passive_deletes=True)
\ No newline at end of file
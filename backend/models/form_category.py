@@ -6,8 +6,8 @@ class FormCategory(Base):
     __tablename__ = 'form_category'
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
-    form_id = Column(Integer, ForeignKey('form.id'), nullable=False)
-    category_id = Column(Integer, ForeignKey('category.id'), nullable=False)
+    form_id = Column(Integer, ForeignKey('form.id', ondelete='CASCADE'), nullable=False, index=True)
+    category_id = Column(Integer, ForeignKey('category.id', ondelete='CASCADE'), nullable=False, index=True)
 
     form = relationship('Form', back_populates='form_categories')
     category = relationship('Category', back_populates='form_categories')
\ No newline at end of file
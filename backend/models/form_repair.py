@@ -13,7 +13,7 @@ class FormRepair(Base):
     __tablename__ = 'form_repair'
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
-    form_id = Column(Integer, ForeignKey('form.id'), nullable=False)
+    form_id = Column(Integer, ForeignKey('form.id', ondelete='CASCADE'), nullable=False, index=True)
     information = Column(String(255), nullable=True)
     unit = Column(SQLAlchemyEnum(UnitType), nullable=True)
     isAlterable = Column(Boolean, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, TIMESTAMP, Boolean, Enum as SQLAlchemyEnum, DECIMAL, Integer, func
+from sqlalchemy import Column, String, ForeignKey, TIMESTAMP, Boolean, Enum as SQLAlchemyEnum, DECIMAL, Integer, Index, func
 from enum import Enum
 from database import Base
 from sqlalchemy.orm import relationship
@@ -16,12 +16,21 @@ class OrderStatus(str, Enum):
 
 class Order(Base):
     __tablename__ = 'order'
+    __table_args__ = (
+        # /orders, /orders/download 의 필터/정렬 경로용 복합 인덱스
+        Index('ix_order_created_at_id', 'created_at', 'id'),
+        Index('ix_order_isTemporary_created_at_id', 'isTemporary', 'created_at', 'id'),
+        Index('ix_order_event_id_created_at_id', 'event_id', 'created_at', 'id'),
+        Index('ix_order_event_id_status_created_at', 'event_id', 'status', 'created_at'),
+        # 주문번호 중복 방지 (임시 주문서의 NULL은 여러 개 허용)
+        Index('ux_order_orderNumber', 'orderNumber', unique=True),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
     event_id = Column(Integer, ForeignKey('event.id'), nullable=False)
-    author_id = Column(Integer, ForeignKey('author.id'), nullable=True)
+    author_id = Column(Integer, ForeignKey('author.id'), nullable=True, index=True)
     modifier_id = Column(Integer, ForeignKey('author.id'), nullable=True)
-    affiliation_id = Column(Integer, ForeignKey('affiliation.id'), nullable=True)
+    affiliation_id = Column(Integer, ForeignKey('affiliation.id'), nullable=True, index=True)
     orderNumber = Column(String(255), nullable=True)
     created_at = Column(TIMESTAMP, default=func.now(), nullable=False)
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -39,9 +48,10 @@ class Order(Base):
     isTemporary = Column(Boolean, nullable=True, default=False) 
 
     event = relationship('Event', back_populates='orders')
-    order_items = relationship('OrderItems', back_populates='orders')
-    payments = relationship('Payments', back_populates='orders')
-    alteration_details = relationship('AlterationDetails', back_populates='orders')
+    # 하위 데이터는 DB의 ON DELETE CASCADE로 함께 삭제
+    order_items = relationship('OrderItems', back_populates='orders', cascade='all, delete', passive_deletes=True)
+    payments = relationship('Payments', back_populates='orders', cascade='all, delete', passive_deletes=True)
+    alteration_details = relationship('AlterationDetails', back_populates='orders', cascade='all, delete', passive_deletes=True)
 
     author = relationship("Author", foreign_keys=[author_id], back_populates="authored_orders")
     modifier = relationship("Author", foreign_keys=[modifier_id], back_populates="modified_orders")
@@ -6,9 +6,9 @@ class OrderItems(Base):
     __tablename__ = 'orderItems'
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
-    order_id = Column(Integer, ForeignKey('order.id'), nullable=False)
-    product_id = Column(Integer, ForeignKey('product.id'), nullable=False)
-    attribute_id = Column(Integer, ForeignKey('attributes.id'), nullable=True)
+    order_id = Column(Integer, ForeignKey('order.id', ondelete='CASCADE'), nullable=False, index=True)
+    product_id = Column(Integer, ForeignKey('product.id'), nullable=False, index=True)
+    attribute_id = Column(Integer, ForeignKey('attributes.id'), nullable=True, index=True)
     quantity = Column(Integer, nullable=True)
     price = Column(DECIMAL(10, 2), nullable=True)
 
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, ForeignKey, Integer, String, Date, DECIMAL
+from database import Base
+
+# 행사/일자/주문 상태별 주문서 집계 (임시 주문서 제외, 주문서 저장/수정/삭제 시 같은 트랜잭션에서 증감)
+class OrderDailyRollup(Base):
+    __tablename__ = 'order_daily_rollup'
+
+    event_id = Column(Integer, ForeignKey('event.id', ondelete='CASCADE'), primary_key=True)
+    day = Column(Date, primary_key=True)  # 주문서 생성일 (UTC, 주문번호 날짜와 같은 기준)
+    status = Column(String(32), primary_key=True)  # OrderStatus 이름, 상태가 없으면 ''
+    order_count = Column(Integer, nullable=False, default=0)
+    totalPrice = Column(DECIMAL(14, 2), nullable=False, default=0)
+    advancePayment = Column(DECIMAL(14, 2), nullable=False, default=0)
+    balancePayment = Column(DECIMAL(14, 2), nullable=False, default=0)
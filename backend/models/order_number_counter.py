@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, String
+from database import Base
+
+# 날짜별 주문번호 카운터 (yymmdd 당 1행, 마지막으로 발급한 일련번호)
+class OrderNumberCounter(Base):
+    __tablename__ = 'order_number_counter'
+
+    day = Column(String(6), primary_key=True)
+    last_value = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,36 @@
+from sqlalchemy import DDL, Column, ForeignKey, Integer, Text, event
+from database import Base
+
+# SQLite FTS5(trigram) 가상 테이블 이름 (order_search 를 원본으로 하는 외부 콘텐츠 인덱스)
+SQLITE_FTS_TABLE = "order_search_fts"
+
+# 주문서 검색 문서 (주문서당 1행, 검색 인덱스의 원본)
+class OrderSearch(Base):
+    __tablename__ = 'order_search'
+
+    order_id = Column(Integer, ForeignKey('order.id', ondelete='CASCADE'), primary_key=True)
+    document = Column(Text, nullable=False, default='')
+
+
+# SQLite에서 create_all 로 만든 DB에도 FTS5 인덱스와 동기화 트리거 생성 (마이그레이션 ac7fb9b8624c 와 동일)
+SQLITE_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    "document, content='order_search', content_rowid='order_id', tokenize='trigram')",
+    f"""CREATE TRIGGER IF NOT EXISTS order_search_ai AFTER INSERT ON order_search BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, document) VALUES (new.order_id, new.document);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS order_search_ad AFTER DELETE ON order_search BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, document) VALUES ('delete', old.order_id, old.document);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS order_search_au AFTER UPDATE ON order_search BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, document) VALUES ('delete', old.order_id, old.document);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, document) VALUES (new.order_id, new.document);
+    END""",
+]
+for statement in SQLITE_FTS_DDL:
+    event.listen(OrderSearch.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+# 트리거는 원본 테이블과 함께 삭제되므로 가상 테이블만 삭제
+event.listen(
+    OrderSearch.__table__, "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, ForeignKey, Integer, TIMESTAMP, Enum as SQLAlchemyEnum, Index
+from database import Base
+from models.order import OrderStatus
+
+# 주문 상태 변경 이력 (추가만 하는 테이블, 상태가 바뀔 때마다 1행)
+class OrderStatusHistory(Base):
+    __tablename__ = 'order_status_history'
+    __table_args__ = (
+        # 주문서별 타임라인 조회 / 상태별 체류 시간 집계용
+        Index('ix_order_status_history_order_id_changed_at', 'order_id', 'changed_at'),
+        Index('ix_order_status_history_status_changed_at', 'status', 'changed_at'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    order_id = Column(Integer, ForeignKey('order.id', ondelete='CASCADE'), nullable=False)
+    status = Column(SQLAlchemyEnum(OrderStatus), nullable=False)
+    changed_at = Column(TIMESTAMP, nullable=False)
@@ -22,7 +22,7 @@ class Payments(Base):
     __tablename__ = 'payments'
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
-    order_id = Column(Integer, ForeignKey('order.id'), nullable=False)
+    order_id = Column(Integer, ForeignKey('order.id', ondelete='CASCADE'), nullable=False, index=True)
     payer =  Column(String(255), nullable=True)
     payment_date = Column(TIMESTAMP, nullable=True)
     cashAmount = Column(DECIMAL(10, 2), nullable=True)
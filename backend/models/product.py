@@ -8,10 +8,10 @@ class Product(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
     name = Column(String(255), nullable=True)
-    category_id = Column(Integer, ForeignKey('category.id'), nullable=False)
+    category_id = Column(Integer, ForeignKey('category.id', ondelete='CASCADE'), nullable=False, index=True)
     price = Column(DECIMAL(10, 2), nullable=True)
 
     category = relationship('Category', back_populates='products')
     order_items = relationship('OrderItems', back_populates='product')
-    product_attributes = relationship('ProductAttributes', back_populates='product')
-    attributes = relationship('Attributes', secondary='product_attributes', back_populates='products', overlaps="product_attributes")
+    product_attributes = relationship('ProductAttributes', back_populates='product', cascade='all, delete', passive_deletes=True)
+    attributes = relationship('Attributes', secondary='product_attributes', back_populates='products', overlaps="product_attributes", passive_deletes=True)
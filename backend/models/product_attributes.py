@@ -7,8 +7,8 @@ class ProductAttributes(Base):
     __tablename__ = 'product_attributes'
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
-    product_id = Column(Integer, ForeignKey('product.id'), nullable=False)
-    attribute_id = Column(Integer, ForeignKey('attributes.id'), nullable=False)
+    product_id = Column(Integer, ForeignKey('product.id', ondelete='CASCADE'), nullable=False, index=True)
+    attribute_id = Column(Integer, ForeignKey('attributes.id'), nullable=False, index=True)
     indexNumber = Column(Integer, nullable=True)
 
     product = relationship('Product', back_populates='product_attributes', overlaps="attributes,products")
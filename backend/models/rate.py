@@ -1,8 +1,13 @@
-from sqlalchemy import TIMESTAMP, Column, Float, Date, Integer
+from sqlalchemy import TIMESTAMP, Column, Float, Date, Integer, Index
 from database import Base
 
 class Rate(Base):
     __tablename__ = "rate"
+    __table_args__ = (
+        # 기준일 조합당 1행 (갱신 시 upsert), 금 시세 기준일 조회에도 사용
+        Index('uq_rate_gold_bas_dt_exchange_bas_dt', 'gold_bas_dt', 'exchange_bas_dt', unique=True),
+        Index('ix_rate_exchange_bas_dt', 'exchange_bas_dt'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True) 
 
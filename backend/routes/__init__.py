@@ -9,6 +9,8 @@ from .author_routes import router as author_router
 from .category_routes import router as category_router
 from .form_routes import router as form_router
 from .rates_routes import router as rates_router
+from .internal_routes import router as internal_router
+from .export_routes import router as export_router
 
 router = APIRouter()
 
@@ -21,4 +23,6 @@ router.include_router(author_router)
 router.include_router(category_router)
 router.include_router(form_router)
 router.include_router(rates_router)
+router.include_router(internal_router)
+router.include_router(export_router)
 
@@ -1,54 +1,58 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from database import get_db
-from models import Affiliation
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, get_read_db
+from sqlalchemy import select
+from models import Affiliation, Order
+from services.order_search import refresh_order_search
 from schemas.affiliation_schema import AffiliationResponse, AffiliationCreate, AffiliationUpdate
 
 router = APIRouter()
 
 # 소속 리스트 조회 API
 @router.get("/affiliations", response_model=list[AffiliationResponse], summary="소속 리스트 조회", tags=["소속 API"])
-async def get_affiliations(db: Session = Depends(get_db)):
+async def get_affiliations(db: AsyncSession = Depends(get_read_db)):
     """
     소속 리스트를 조회합니다.
     """
-    return db.query(Affiliation).all()
+    return (await db.scalars(select(Affiliation))).all()
 
 # 소속 생성 API
 @router.post("/affiliations", response_model=AffiliationResponse, status_code=status.HTTP_201_CREATED, summary="소속 생성", tags=["소속 API"])
-async def create_affiliation(affiliation: AffiliationCreate, db: Session = Depends(get_db)):
+async def create_affiliation(affiliation: AffiliationCreate, db: AsyncSession = Depends(get_async_db)):
     """
     새로운 소속을 생성합니다.
     """
     new_affiliation = Affiliation(**affiliation.model_dump())
     db.add(new_affiliation)
-    db.commit()
-    db.refresh(new_affiliation)
+    await db.commit()
+    await db.refresh(new_affiliation)
     return new_affiliation
 
 # 소속 수정 API
 @router.put("/affiliations/{affiliationID}", response_model=AffiliationResponse, summary="소속 수정", tags=["소속 API"])
-async def update_affiliation(affiliationID: int, affiliation: AffiliationUpdate, db: Session = Depends(get_db)):
+async def update_affiliation(affiliationID: int, affiliation: AffiliationUpdate, db: AsyncSession = Depends(get_async_db)):
     """
     기존 소속 정보를 수정합니다.
     """
-    db_affiliation = db.query(Affiliation).filter(Affiliation.id == affiliationID).first()
+    db_affiliation = await db.scalar(select(Affiliation).where(Affiliation.id == affiliationID))
     if not db_affiliation:
         raise HTTPException(status_code=404, detail="Affiliation not found")
     db_affiliation.name = affiliation.name
-    db.commit()
-    db.refresh(db_affiliation)
+    # 해당 소속의 주문서 검색 문서 갱신
+    await refresh_order_search(db, select(Order.id).where(Order.affiliation_id == affiliationID))
+    await db.commit()
+    await db.refresh(db_affiliation)
     return db_affiliation
 
 # 소속 삭제 API
 @router.delete("/affiliations/{affiliationID}", status_code=status.HTTP_204_NO_CONTENT, summary="소속 삭제", tags=["소속 API"])
-async def delete_affiliation(affiliationID: int, db: Session = Depends(get_db)):
+async def delete_affiliation(affiliationID: int, db: AsyncSession = Depends(get_async_db)):
     """
     소속 정보를 삭제합니다.
     """
-    db_affiliation = db.query(Affiliation).filter(Affiliation.id == affiliationID).first()
+    db_affiliation = await db.scalar(select(Affiliation).where(Affiliation.id == affiliationID))
     if not db_affiliation:
         raise HTTPException(status_code=404, detail="Affiliation not found")
-    db.delete(db_affiliation)
-    db.commit()
+    await db.delete(db_affiliation)
+    await db.commit()
     return {"detail": "Affiliation deleted"}
@@ -2,10 +2,11 @@ import jwt
 import os
 from fastapi import APIRouter, Depends, HTTPException, status, Form
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
-from database import get_db
+from database import get_async_db
 from passlib.context import CryptContext
 from models import User
 from schemas.user_schema import TokenResponse, UserRole, PasswordChangeRequest
@@ -55,11 +56,11 @@ class OAuth2PasswordRequestFormCustom:
         self.password = password
 
 # 일반 사용자 JWT에서 현재 사용자 가져오기
-async def get_current_user(token: str = Depends(user_oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(user_oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id = payload.get("sub")
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.scalar(select(User).where(User.id == user_id))
         if not user:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="인증 자격 증명이 잘못되었습니다.")
         return user
@@ -69,11 +70,11 @@ async def get_current_user(token: str = Depends(user_oauth2_scheme), db: Session
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다.")
 
 # 관리자 JWT에서 현재 사용자 가져오기
-async def get_current_admin(token: str = Depends(admin_oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_admin(token: str = Depends(admin_oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id = payload.get("sub")
-        user = db.query(User).filter(User.id == user_id, User.role == UserRole.admin).first()
+        user = await db.scalar(select(User).where(User.id == user_id, User.role == UserRole.admin))
         if not user:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="인증 자격 증명이 잘못되었습니다.")
         return user
@@ -84,8 +85,8 @@ async def get_current_admin(token: str = Depends(admin_oauth2_scheme), db: Sessi
 
 # 일반 사용자 로그인 엔드포인트 수정: 커스텀 폼 사용
 @router.post("/login", response_model=TokenResponse, status_code=status.HTTP_201_CREATED, summary="일반 사용자 로그인", tags=["인증 API"])
-async def user_login(form_data: OAuth2PasswordRequestFormCustom = Depends(), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.id == form_data.id, User.role == UserRole.user).first()
+async def user_login(form_data: OAuth2PasswordRequestFormCustom = Depends(), db: AsyncSession = Depends(get_async_db)):
+    user = await db.scalar(select(User).where(User.id == form_data.id, User.role == UserRole.user))
     if not user or not verify_password(form_data.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="ID 또는 비밀번호가 올바르지 않습니다.")
 
@@ -95,8 +96,8 @@ async def user_login(form_data: OAuth2PasswordRequestFormCustom = Depends(), db:
 
 # 관리자 로그인 엔드포인트 수정: 커스텀 폼 사용
 @router.post("/admin/login", response_model=TokenResponse, status_code=status.HTTP_201_CREATED, summary="관리자 로그인", tags=["인증 API"])
-async def admin_login(form_data: OAuth2PasswordRequestFormCustom = Depends(), db: Session = Depends(get_db)):
-    admin = db.query(User).filter(User.id == form_data.id, User.role == UserRole.admin).first()
+async def admin_login(form_data: OAuth2PasswordRequestFormCustom = Depends(), db: AsyncSession = Depends(get_async_db)):
+    admin = await db.scalar(select(User).where(User.id == form_data.id, User.role == UserRole.admin))
     if not admin or not verify_password(form_data.password, admin.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="ID 또는 비밀번호가 올바르지 않습니다.")
 
@@ -110,12 +111,12 @@ async def change_user_password(
     user_id: int,  # 변경할 유저의 ID를 입력 받습니다.
     password_data: PasswordChangeRequest,
     current_admin: User = Depends(get_current_admin),  # 어드민 권한으로 접근
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     어드민 토큰을 사용하여 일반 사용자의 비밀번호를 변경합니다.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 사용자를 찾을 수 없습니다.")
     
@@ -125,7 +126,7 @@ async def change_user_password(
     # 새 비밀번호 저장
     hashed_new_password = hash_password(password_data.new_password)
     user.password = hashed_new_password
-    db.commit()
+    await db.commit()
     return {"message": "사용자 비밀번호가 성공적으로 변경되었습니다."}
 
 # 관리자 비밀번호 변경 엔드포인트
@@ -133,7 +134,7 @@ async def change_user_password(
 async def change_admin_password(
     password_data: PasswordChangeRequest,
     current_admin: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     if not verify_password(password_data.old_password, current_admin.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="기존 비밀번호가 올바르지 않습니다.")
@@ -141,5 +142,5 @@ async def change_admin_password(
     # 새 비밀번호 저장
     hashed_new_password = hash_password(password_data.new_password)
     current_admin.password = hashed_new_password
-    db.commit()
+    await db.commit()
     return {"message": "관리자 비밀번호가 성공적으로 변경되었습니다."}
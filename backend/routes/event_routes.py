@@ -1,17 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-from database import get_db
-from models import Event, Form, Category, Product, FormCategory, Order
-from schemas.event_schema import EventDetailResponse, EventResponse, EventCreate, EventUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from datetime import date
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, get_read_db
+from models import Event, Form, FormCategory, Order
+from schemas.event_schema import EventDetailResponse, EventResponse, EventCreate, EventUpdate, EventDashboardResponse, EventValuationResponse
 from schemas.category_schema import CategoryResponse
 from schemas.form_schema import FormResponse, FormRepairResponse
+from schemas.order_schema import EventStatusDwellResponse
+from services.order_status import InvalidPercentilesError, parse_percentiles, event_status_dwell_times
+from services.order_rollup import event_dashboard
+from services.payment_valuation import event_valuation
 
 router = APIRouter()
 
 # 1. 진행 중인 이벤트 조회
 @router.get("/event/current", response_model=list[EventResponse], summary="진행 중인 이벤트 조회", tags=["이벤트 API"])
-async def get_current_events(db: Session = Depends(get_db)):
-    events = db.query(Event).filter(Event.inProgress == True).all()
+async def get_current_events(db: AsyncSession = Depends(get_read_db)):
+    events = (await db.scalars(
+        select(Event).options(selectinload(Event.form)).where(Event.inProgress == True)
+    )).all()
 
     return [
         EventResponse(
@@ -28,17 +38,15 @@ async def get_current_events(db: Session = Depends(get_db)):
 
 # 2. 특정 이벤트 상세 조회
 @router.get("/event/{event_id}", response_model=EventDetailResponse, summary="이벤트 상세 조회", tags=["이벤트 API"])
-async def get_event_details(event_id: int, db: Session = Depends(get_db)):
+async def get_event_details(event_id: int, db: AsyncSession = Depends(get_read_db)):
     # 이벤트와 관련된 데이터를 조인하여 가져오기
-    event = db.query(Event).options(
-        joinedload(Event.form)
-        .joinedload(Form.form_repairs),
-        joinedload(Event.form)  
-        .joinedload(Form.form_categories) 
-        .joinedload(FormCategory.category)  
-        .joinedload(Category.products)  
-        .joinedload(Product.attributes)  
-    ).filter(Event.id == event_id).first()
+    event = await db.scalar(select(Event).options(
+        selectinload(Event.form)
+        .selectinload(Form.form_repairs),
+        selectinload(Event.form)
+        .selectinload(Form.form_categories)
+        .selectinload(FormCategory.category)
+    ).where(Event.id == event_id))
 
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -75,8 +83,8 @@ async def get_event_details(event_id: int, db: Session = Depends(get_db)):
 
 # 3. 모든 이벤트 조회
 @router.get("/events", response_model=list[EventResponse], summary="모든 이벤트 조회", tags=["이벤트 API"])
-async def get_all_events(db: Session = Depends(get_db)):
-    events = db.query(Event).options(joinedload(Event.form)).all()
+async def get_all_events(db: AsyncSession = Depends(get_read_db)):
+    events = (await db.scalars(select(Event).options(selectinload(Event.form)))).all()
     return [ 
         EventResponse(
             id=event.id,
@@ -91,8 +99,8 @@ async def get_all_events(db: Session = Depends(get_db)):
 
 # 4. 이벤트 생성
 @router.post("/event", response_model=EventResponse, status_code=status.HTTP_201_CREATED, summary="이벤트 생성", tags=["이벤트 API"])
-async def create_event(event: EventCreate, db: Session = Depends(get_db)):
-    form = db.query(Form).filter(Form.id == event.form_id).first()
+async def create_event(event: EventCreate, db: AsyncSession = Depends(get_async_db)):
+    form = await db.scalar(select(Form).where(Form.id == event.form_id))
     if not form:
         raise HTTPException(status_code=404, detail="Form not found")
 
@@ -104,27 +112,27 @@ async def create_event(event: EventCreate, db: Session = Depends(get_db)):
         inProgress=event.inProgress
     )
     db.add(new_event)
-    db.commit()
-    db.refresh(new_event)
+    await db.commit()
+    await db.refresh(new_event)
     return new_event
 
 # 5. 이벤트 업데이트
 @router.put("/event/{event_id}", response_model=EventResponse, summary="이벤트 업데이트", tags=["이벤트 API"])
-async def update_event(event_id: int, event: EventUpdate, db: Session = Depends(get_db)):
+async def update_event(event_id: int, event: EventUpdate, db: AsyncSession = Depends(get_async_db)):
     # 1. 기존 이벤트 조회
-    existing_event = db.query(Event).filter(Event.id == event_id).first()
+    existing_event = await db.scalar(select(Event).where(Event.id == event_id))
     if not existing_event:
         raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
 
     # 2. 새로운 양식(Form) 유효성 확인
-    form = db.query(Form).filter(Form.id == event.form_id).first()
+    form = await db.scalar(select(Form).where(Form.id == event.form_id))
     if not form:
         raise HTTPException(status_code=404, detail="양식을 찾을 수 없습니다.")
 
     # 3. 기존 이벤트와 연결된 주문서 확인
     if existing_event.form_id != event.form_id:  # 새로운 양식으로 변경 요청 시
-        related_orders = db.query(Order).filter(Order.event_id == event_id).all()
-        if related_orders:
+        related_order = await db.scalar(select(Order.id).where(Order.event_id == event_id).limit(1))
+        if related_order:
             raise HTTPException(
                 status_code=400,
                 detail="현재 이벤트와 연결된 주문서가 있어 양식을 변경할 수 없습니다."
@@ -138,30 +146,91 @@ async def update_event(event_id: int, event: EventUpdate, db: Session = Depends(
     existing_event.inProgress = event.inProgress
 
     # 5. 데이터베이스 저장 및 반환
-    db.commit()
-    db.refresh(existing_event)
+    await db.commit()
+    await db.refresh(existing_event)
     return existing_event
 
 
 # 6. 이벤트 삭제
 @router.delete("/event/{event_id}", status_code=status.HTTP_204_NO_CONTENT, summary="이벤트 삭제", tags=["이벤트 API"])
-async def delete_event(event_id: int, db: Session = Depends(get_db)):
-    event = db.query(Event).filter(Event.id == event_id).first()
+async def delete_event(event_id: int, db: AsyncSession = Depends(get_async_db)):
+    event = await db.scalar(select(Event).where(Event.id == event_id))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    db.delete(event)
-    db.commit()
+    await db.delete(event)
+    await db.commit()
     return {"message": "Event deleted successfully"}
 
 # 7. 이벤트 진행 여부 수정
 @router.put("/event/{event_id}/{in_progress}", response_model=EventResponse, summary="이벤트 진행 여부 수정", tags=["이벤트 API"])
-async def update_event_progress(event_id: int, in_progress: bool, db: Session = Depends(get_db)):
-    event = db.query(Event).filter(Event.id == event_id).first()
+async def update_event_progress(event_id: int, in_progress: bool, db: AsyncSession = Depends(get_async_db)):
+    event = await db.scalar(select(Event).where(Event.id == event_id))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
     event.inProgress = in_progress
-    db.commit()
-    db.refresh(event)
-    return event
\ No newline at end of file
+    await db.commit()
+    await db.refresh(event)
+    return event
+
+# 8. 이벤트 주문 상태별 체류 시간
+@router.get("/events/{event_id}/status-dwell", response_model=EventStatusDwellResponse, summary="주문 상태별 체류 시간", tags=["이벤트 API"])
+async def get_event_status_dwell(
+    event_id: int,
+    percentiles: Optional[str] = "50,90,95",
+    is_temp: Optional[bool] = False,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    이벤트 주문서들이 상태별로 머문 시간(초) 통계 (주문 상태 변경 이력 기준, SQL에서 집계)\n
+    - percentiles: 계산할 백분위 (쉼표 구분, 1~100, nearest-rank 방식)\n
+    - 아직 다음 상태로 바뀌지 않은 현재 상태는 집계에서 제외\n
+    사용법: /events/1/status-dwell?percentiles=50,90,99
+    """
+    try:
+        requested = parse_percentiles(percentiles)
+    except InvalidPercentilesError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not await db.scalar(select(Event.id).where(Event.id == event_id)):
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    statuses = await event_status_dwell_times(db, event_id, requested, is_temp=is_temp)
+    return EventStatusDwellResponse(event_id=event_id, statuses=statuses)
+
+# 9. 이벤트 매출 대시보드
+@router.get("/events/{event_id}/dashboard", response_model=EventDashboardResponse, summary="이벤트 매출 대시보드", tags=["이벤트 API"])
+async def get_event_dashboard(
+    event_id: int,
+    day_from: Optional[date] = None,
+    day_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    이벤트 주문서 합계 (주문서 수, 총 주문 금액, 선금, 잔금)\n
+    - 전체 합계, 주문 상태별(by_status), 주문 생성일별(by_day) 합계\n
+    - 주문서 저장 시 함께 갱신되는 집계 테이블만 읽음 (임시 주문서 제외, 날짜는 UTC 기준)\n
+    사용법: /events/1/dashboard?day_from=2024-01-01&day_to=2024-01-31
+    """
+    if not await db.scalar(select(Event.id).where(Event.id == event_id)):
+        raise HTTPException(status_code=404, detail="Event not found")
+    return await event_dashboard(db, event_id, day_from, day_to)
+
+
+# 10. 이벤트 결제 원화 재평가
+@router.get("/events/{event_id}/valuation", response_model=EventValuationResponse, summary="이벤트 결제 원화 재평가", tags=["이벤트 API"])
+async def get_event_valuation(
+    event_id: int,
+    limit: int = Query(10, ge=0, le=100),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    이벤트 결제 내역(현금/카드/보상판매)을 결제일 기준 시세로 원화 환산한 합계와 입력된 환산액 대비 차이\n
+    - 결제일(없으면 주문서 작성일) 이전의 가장 최근 시세 적용, 임시 주문서 제외\n
+    - 결제 항목/통화별 합계(by_currency), 차이가 큰 항목 limit 개(largest_drifts)\n
+    사용법: /events/1/valuation?limit=20
+    """
+    if not await db.scalar(select(Event.id).where(Event.id == event_id)):
+        raise HTTPException(status_code=404, detail="Event not found")
+    return await event_valuation(db, event_id, limit)
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import urllib.parse
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+from database import get_read_db
+from models import Event
+from schemas.export_schema import ExportCreate, ExportJobResponse
+from services.export_jobs import export_jobs, COMPLETED
+from services.export_writers import get_export_format
+from services.order_export import export_columns
+from services.event_workbook import EVENT_SHEETS, render_event_sheet, get_process_pool
+from services.xlsx_stream import write_workbook
+
+router = APIRouter()
+
+
+def _job_response(job, request: Request) -> ExportJobResponse:
+    return ExportJobResponse(
+        id=job.id,
+        status=job.status,
+        progress=round(job.progress, 4),
+        rows_written=job.rows_written,
+        total_rows=job.total_rows,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        expires_at=job.expires_at,
+        download_url=str(request.url_for("download_export", job_id=job.id)) if job.status == COMPLETED else None
+    )
+
+
+# 내보내기 작업 생성 API
+@router.post("/exports", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED, summary="주문서 Excel 내보내기 작업 생성", tags=["내보내기 API"])
+async def create_export(export: ExportCreate, request: Request):
+    """
+    주문서 Excel 파일을 백그라운드에서 생성하는 작업을 등록합니다.\n
+    필터는 /orders/download 와 같습니다 (event_name, order_date_from, order_date_to, sort, search, status, is_temp).\n
+    format(xlsx, csv, ndjson, parquet)과 dataset(payments, items, alterations)도 /orders/download 와 같습니다.\n
+    같은 필터의 작업이 이미 대기/진행 중이면 새 작업을 만들지 않고 기존 작업을 반환합니다. (완료된 작업이 있으면 최신 데이터로 새 작업 생성)\n
+    GET /exports/{id} 로 진행 상태를 확인하고, 완료되면 download_url 에서 파일을 받습니다.
+    """
+    try:
+        get_export_format(export.format)
+        export_columns(export.dataset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    export_jobs.purge_expired()
+    job = export_jobs.submit(export.model_dump())
+    return _job_response(job, request)
+
+
+# 내보내기 작업 상태 조회 API
+@router.get("/exports/{job_id}", response_model=ExportJobResponse, summary="주문서 Excel 내보내기 작업 조회", tags=["내보내기 API"])
+async def get_export(job_id: str, request: Request):
+    export_jobs.purge_expired()
+    job = export_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="내보내기 작업을 찾을 수 없습니다.")
+    return _job_response(job, request)
+
+
+# 내보내기 결과 파일 다운로드 API
+@router.get("/exports/{job_id}/download", name="download_export", summary="주문서 Excel 내보내기 파일 다운로드", tags=["내보내기 API"])
+async def download_export(job_id: str):
+    export_jobs.purge_expired()
+    job = export_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="내보내기 작업을 찾을 수 없습니다.")
+    if job.status != COMPLETED:
+        raise HTTPException(status_code=409, detail="내보내기 작업이 아직 완료되지 않았습니다.")
+
+    return FileResponse(
+        job.path,
+        media_type=job.media_type,
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{job.file_name}"}
+    )
+
+
+# 이벤트 통합 워크북 다운로드 API
+@router.get("/events/{event_id}/workbook", summary="이벤트 통합 워크북 다운로드", tags=["내보내기 API"])
+async def download_event_workbook(event_id: int, is_temp: Optional[bool] = False, db: AsyncSession = Depends(get_read_db)):
+    """
+    이벤트의 주문서를 시트별로 나누어 하나의 Excel 파일로 다운로드합니다.\n
+    시트: 주문서, 주문 상품(상품/속성), 결제, 수선(수선 항목)\n
+    각 시트는 별도 쿼리로 읽어 프로세스 풀에서 병렬로 생성한 뒤 하나의 파일로 합칩니다.\n
+    is_temp: False(기본값)면 일반 주문서만, True면 임시 주문서만, 비우면 전체
+    """
+    event = await db.get(Event, event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
+
+    directory = tempfile.mkdtemp(prefix="event-workbook-")
+    try:
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        sheets = await asyncio.gather(*(
+            loop.run_in_executor(pool, render_event_sheet, key, event_id, is_temp, directory)
+            for key in EVENT_SHEETS
+        ))
+        target = os.path.join(directory, "workbook.xlsx")
+        await asyncio.to_thread(write_workbook, target, sheets)
+    except Exception:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
+
+    file_name = urllib.parse.quote(f"{event.name}_통합_{datetime.now().strftime('%Y%m%d')}.xlsx")
+    return FileResponse(
+        target,
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{file_name}"},
+        background=BackgroundTask(shutil.rmtree, directory, ignore_errors=True),
+    )
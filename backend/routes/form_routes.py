@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-from database import get_db
+from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, get_read_db
 from models import Form, Category, FormCategory, FormRepair, Order, Event
 from schemas.form_schema import FormCreate, FormResponse, FormRepairResponse, FormUsedResponse
 
@@ -8,13 +10,21 @@ router = APIRouter()
 
 # 주문서 양식 리스트 조회 API
 @router.get("/forms", response_model=list[FormUsedResponse], summary="주문서 양식 리스트 조회", tags=["주문서 양식 API"])
-async def get_forms(db: Session = Depends(get_db)):
-    forms = db.query(Form).order_by(Form.id.desc()).options(joinedload(Form.form_repairs)).all()
+async def get_forms(db: AsyncSession = Depends(get_read_db)):
+    forms = (await db.scalars(select(Form).order_by(Form.id.desc()).options(
+        selectinload(Form.form_repairs),
+        selectinload(Form.form_categories).selectinload(FormCategory.category)
+    ))).all()
+
+    # 주문서가 있는 이벤트에 연결된 양식 ID (양식별 조회 대신 한 번에 조회)
+    used_form_ids = set((await db.scalars(
+        select(Event.form_id).join(Order, Order.event_id == Event.id).distinct()
+    )).all())
+
     form_responses = []
     for form in forms:
-        # 카테고리 정보 조회
-        categories = db.query(Category).join(FormCategory).filter(FormCategory.form_id == form.id).all()
-        category_list = [{"id": category.id, "name": category.name} for category in categories]
+        # 카테고리 정보
+        category_list = [{"id": fc.category.id, "name": fc.category.name} for fc in form.form_categories]
         
         # 수선 정보 정렬 후 조회
         repairs = [
@@ -29,7 +39,7 @@ async def get_forms(db: Session = Depends(get_db)):
         ]
 
         # 주문서 양식 사용 여부 확인
-        is_used = db.query(Order).join(Event).filter(Event.form_id == form.id).first() is not None
+        is_used = form.id in used_form_ids
 
         form_responses.append(
             FormUsedResponse(
@@ -46,13 +56,13 @@ async def get_forms(db: Session = Depends(get_db)):
 
 # 특정 주문서 양식 조회 API
 @router.get("/forms/{formID}", response_model=FormUsedResponse, summary="특정 주문서 양식 조회", tags=["주문서 양식 API"])
-async def get_form(formID: int, db: Session = Depends(get_db)):
-    form = db.query(Form).options(joinedload(Form.form_repairs)).filter(Form.id == formID).first()
+async def get_form(formID: int, db: AsyncSession = Depends(get_read_db)):
+    form = await db.scalar(select(Form).options(selectinload(Form.form_repairs)).where(Form.id == formID))
     if not form:
         raise HTTPException(status_code=404, detail="Form not found")
 
     # 카테고리 정보 조회
-    categories = db.query(Category).join(FormCategory).filter(FormCategory.form_id == formID).all()
+    categories = (await db.scalars(select(Category).join(FormCategory).where(FormCategory.form_id == formID))).all()
     category_list = [{"id": category.id, "name": category.name} for category in categories]
 
     # 수선 정보 정렬 후 조회
@@ -68,7 +78,7 @@ async def get_form(formID: int, db: Session = Depends(get_db)):
     ]
 
     # 주문서 양식 사용 여부 확인
-    is_used = db.query(Order).join(Event).filter(Event.form_id == formID).first() is not None
+    is_used = await db.scalar(select(Order.id).join(Event).where(Event.form_id == formID).limit(1)) is not None
 
     return FormUsedResponse(
         id=form.id,
@@ -81,12 +91,12 @@ async def get_form(formID: int, db: Session = Depends(get_db)):
 
 # 주문서 양식 생성 API
 @router.post("/forms", response_model=FormResponse, status_code=status.HTTP_201_CREATED, summary="주문서 양식 생성", tags=["주문서 양식 API"])
-async def create_form(form: FormCreate, db: Session = Depends(get_db)):
+async def create_form(form: FormCreate, db: AsyncSession = Depends(get_async_db)):
     try:
         # 새로운 폼 생성
         new_form = Form(name=form.name)
         db.add(new_form)
-        db.flush()
+        await db.flush()
 
         # 폼 카테고리 저장
         for category_id in form.categories:
@@ -105,14 +115,15 @@ async def create_form(form: FormCreate, db: Session = Depends(get_db)):
             )
             db.add(form_repair)
 
-        db.commit()
+        await db.commit()
+        await db.refresh(new_form)
 
         # 카테고리 정보 조회
-        categories = db.query(Category).filter(Category.id.in_(form.categories)).all()
+        categories = (await db.scalars(select(Category).where(Category.id.in_(form.categories)))).all()
         category_list = [{"id": category.id, "name": category.name} for category in categories]
 
         # 수리 정보 정렬 조회
-        repairs = db.query(FormRepair).filter(FormRepair.form_id == new_form.id).order_by(FormRepair.indexNumber).all()
+        repairs = (await db.scalars(select(FormRepair).where(FormRepair.form_id == new_form.id).order_by(FormRepair.indexNumber))).all()
 
         return FormResponse(
             id=new_form.id,
@@ -130,24 +141,24 @@ async def create_form(form: FormCreate, db: Session = Depends(get_db)):
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"양식 생성 중 오류 발생: {str(e)}")
 
 # 주문서 양식 수정 API
 @router.put("/forms/{formID}", response_model=FormResponse, summary="주문서 양식 수정", tags=["주문서 양식 API"])
-async def update_form(formID: int, form: FormCreate, db: Session = Depends(get_db)):
+async def update_form(formID: int, form: FormCreate, db: AsyncSession = Depends(get_async_db)):
     try:
         # 기존 Form 검색
-        existing_form = db.query(Form).filter(Form.id == formID).first()
+        existing_form = await db.scalar(select(Form).where(Form.id == formID))
         if not existing_form:
             raise HTTPException(status_code=404, detail="Form not found")
 
         # Form 업데이트
         existing_form.name = form.name
-        db.flush()
+        await db.flush()
 
         # 기존 repairs 삭제 및 업데이트
-        db.query(FormRepair).filter(FormRepair.form_id == formID).delete()
+        await db.execute(delete(FormRepair).where(FormRepair.form_id == formID))
         for idx, repair in enumerate(form.repairs, start=1):  # 순차적으로 indexNumber 부여
             new_repair = FormRepair(
                 form_id=formID,
@@ -160,18 +171,18 @@ async def update_form(formID: int, form: FormCreate, db: Session = Depends(get_d
             db.add(new_repair)
 
         # 기존 categories 삭제 및 업데이트
-        db.query(FormCategory).filter(FormCategory.form_id == formID).delete()
+        await db.execute(delete(FormCategory).where(FormCategory.form_id == formID))
         for category_id in form.categories:
             new_category = FormCategory(form_id=formID, category_id=category_id)
             db.add(new_category)
 
-        db.commit()
+        await db.commit()
 
         # 수정된 데이터 반환
-        categories = db.query(Category).filter(Category.id.in_(form.categories)).all()
+        categories = (await db.scalars(select(Category).where(Category.id.in_(form.categories)))).all()
         category_list = [{"id": category.id, "name": category.name} for category in categories]
 
-        repairs = db.query(FormRepair).filter(FormRepair.form_id == formID).order_by(FormRepair.indexNumber).all()
+        repairs = (await db.scalars(select(FormRepair).where(FormRepair.form_id == formID).order_by(FormRepair.indexNumber))).all()
 
         return FormResponse(
             id=existing_form.id,
@@ -189,28 +200,28 @@ async def update_form(formID: int, form: FormCreate, db: Session = Depends(get_d
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"양식 수정 중 오류 발생: {str(e)}")
 
 @router.put("/forms/repair/{formID}", response_model=FormResponse, summary="양식 수정(수선)", tags=["주문서 양식 API"])
-async def update_form(formID: int, form: FormCreate, db: Session = Depends(get_db)):
+async def update_form(formID: int, form: FormCreate, db: AsyncSession = Depends(get_async_db)):
     try:
         # 기존 Form 검색
-        existing_form = db.query(Form).filter(Form.id == formID).first()
+        existing_form = await db.scalar(select(Form).options(selectinload(Form.form_repairs)).where(Form.id == formID))
         if not existing_form:
             raise HTTPException(status_code=404, detail="양식을 찾을 수 없습니다.")
         
         # 양식 이름 업데이트
         if form.name:
             existing_form.name = form.name
-        db.flush()
+        await db.flush()
 
         # 기존 수선 정보 업데이트 (새로운 추가/삭제 불가능, 기존 정보만 수정 가능)
         for repair_data in form.repairs:
-            db_repair = db.query(FormRepair).filter(
+            db_repair = await db.scalar(select(FormRepair).where(
                 FormRepair.id == repair_data.id,
                 FormRepair.form_id == formID
-            ).first()
+            ))
 
             if not db_repair:
                 raise HTTPException(
@@ -226,17 +237,17 @@ async def update_form(formID: int, form: FormCreate, db: Session = Depends(get_d
             if repair_data.isAlterable is not None:
                 db_repair.isAlterable = repair_data.isAlterable
 
-        db.flush()
+        await db.flush()
 
         # 카테고리는 추가/삭제 없이 기존 데이터 유지
-        existing_categories = db.query(FormCategory).filter(FormCategory.form_id == formID).all()
+        existing_categories = (await db.scalars(select(FormCategory).where(FormCategory.form_id == formID))).all()
         category_ids = [category.category_id for category in existing_categories]
 
         # 카테고리 데이터 조회 및 응답 형식 생성
-        categories = db.query(Category).filter(Category.id.in_(category_ids)).all()
+        categories = (await db.scalars(select(Category).where(Category.id.in_(category_ids)))).all()
         category_list = [{"id": category.id, "name": category.name} for category in categories]
 
-        db.commit()
+        await db.commit()
 
         # 수정된 양식 반환
         return FormResponse(
@@ -257,23 +268,23 @@ async def update_form(formID: int, form: FormCreate, db: Session = Depends(get_d
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"양식 수정 중 오류 발생: {str(e)}")
 
 # 주문서 양식 복제 API
 @router.post("/forms/{formID}/duplicate", response_model=FormResponse, status_code=status.HTTP_201_CREATED, summary="주문서 양식 복제", tags=["주문서 양식 API"])
-async def duplicate_form(formID: int, db: Session = Depends(get_db)):
+async def duplicate_form(formID: int, db: AsyncSession = Depends(get_async_db)):
     try:
-        original_form = db.query(Form).filter(Form.id == formID).first()
+        original_form = await db.scalar(select(Form).where(Form.id == formID))
         if not original_form:
             raise HTTPException(status_code=404, detail="Form not found")
 
         new_form_name = f"{original_form.name}의 사본"
         new_form = Form(name=new_form_name)
         db.add(new_form)
-        db.flush()
+        await db.flush()
 
-        original_categories = db.query(FormCategory).filter(FormCategory.form_id == formID).all()
+        original_categories = (await db.scalars(select(FormCategory).where(FormCategory.form_id == formID))).all()
         for category_link in original_categories:
             new_form_category = FormCategory(
                 form_id=new_form.id,
@@ -281,7 +292,7 @@ async def duplicate_form(formID: int, db: Session = Depends(get_db)):
             )
             db.add(new_form_category)
 
-        original_repairs = db.query(FormRepair).filter(FormRepair.form_id == formID).all()
+        original_repairs = (await db.scalars(select(FormRepair).where(FormRepair.form_id == formID))).all()
         for idx, repair in enumerate(original_repairs, start=1):
             new_repair = FormRepair(
                 form_id=new_form.id,
@@ -293,9 +304,10 @@ async def duplicate_form(formID: int, db: Session = Depends(get_db)):
             )
             db.add(new_repair)
 
-        db.commit()
+        await db.commit()
+        await db.refresh(new_form)
 
-        categories = db.query(Category).filter(Category.id.in_([cat.category_id for cat in original_categories])).all()
+        categories = (await db.scalars(select(Category).where(Category.id.in_([cat.category_id for cat in original_categories])))).all()
         category_list = [{"id": category.id, "name": category.name} for category in categories]
         repairs = [
             FormRepairResponse(
@@ -317,25 +329,22 @@ async def duplicate_form(formID: int, db: Session = Depends(get_db)):
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"양식 복제 중 오류 발생: {str(e)}")
 
 # 주문서 양식 삭제 API
 @router.delete("/forms/{formID}", status_code=status.HTTP_204_NO_CONTENT, summary="주문서 양식 삭제", tags=["주문서 양식 API"])
-async def delete_form(formID: int, db: Session = Depends(get_db)):
+async def delete_form(formID: int, db: AsyncSession = Depends(get_async_db)):
     try:
-        db_form = db.query(Form).filter(Form.id == formID).first()
-        if not db_form:
+        # 양식과 연결된 카테고리/수선 정보는 DB의 ON DELETE CASCADE로 삭제
+        result = await db.execute(delete(Form).where(Form.id == formID))
+        if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Form not found")
 
-        # 양식과 연결된 카테고리 삭제
-        db.query(FormCategory).filter(FormCategory.form_id == formID).delete()
-
-        db.delete(db_form)
-        db.commit()  # 모든 작업이 성공적으로 완료되면 커밋
+        await db.commit()  # 모든 작업이 성공적으로 완료되면 커밋
 
         return {"detail": "Form deleted"}
 
     except Exception as e:
-        db.rollback()  # 오류 발생 시 롤백
+        await db.rollback()  # 오류 발생 시 롤백
         raise HTTPException(status_code=500, detail=f"양식 삭제 중 오류 발생: {str(e)}")
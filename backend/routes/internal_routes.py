@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends
+from database import POOL_ENGINES
+from models import User
+from routes.auth_routes import get_current_admin
+from schemas.internal_schema import DBPoolResponse, RateRefreshStatus
+from services.db_pool import pool_status
+from services.rate_refresher import rate_refresher
+
+router = APIRouter()
+
+# 커넥션 풀 상태 조회 API (관리자 전용)
+@router.get("/internal/db-pool", response_model=DBPoolResponse, summary="DB 커넥션 풀 상태 조회", tags=["내부 API"])
+async def get_db_pool_status(current_admin: User = Depends(get_current_admin)):
+    """
+    엔진별 커넥션 풀 상태를 조회합니다.\n
+    - checked_out: 사용 중인 커넥션 수\n
+    - idle: 풀에 반환되어 대기 중인 커넥션 수\n
+    - overflow: pool_size를 초과하여 생성된 커넥션 수\n
+    - wait: 커넥션 체크아웃까지 걸린 시간 통계 (프로세스 시작 이후 누적)\n
+    워커 프로세스마다 풀이 따로 있으므로 응답은 요청을 처리한 워커 기준입니다.
+    """
+    return DBPoolResponse(pools={name: pool_status(engine) for name, engine in POOL_ENGINES.items()})
+
+# 금 시세/환율 갱신 상태 조회 API (관리자 전용)
+@router.get("/internal/rate-refresh", response_model=RateRefreshStatus, summary="금 시세/환율 갱신 상태 조회", tags=["내부 API"])
+async def get_rate_refresh_status(current_admin: User = Depends(get_current_admin)):
+    """
+    백그라운드 금 시세/환율 갱신 작업의 마지막 실행 결과를 조회합니다.\n
+    - status: idle / running / succeeded / failed\n
+    - last_result: updated (새 데이터 저장) / skipped (이미 최신)\n
+    - last_duration: 마지막 갱신 소요 시간 (초)\n
+    - next_run_at: 다음 갱신 예정 시각 (서버 로컬 시각)\n
+    워커 프로세스마다 갱신 작업이 따로 있으므로 응답은 요청을 처리한 워커 기준입니다.
+    """
+    return rate_refresher.status_info()
+
+
+# 금 시세/환율 즉시 갱신 API (관리자 전용)
+@router.post("/internal/rate-refresh", response_model=RateRefreshStatus, summary="금 시세/환율 즉시 갱신", tags=["내부 API"])
+async def run_rate_refresh(current_admin: User = Depends(get_current_admin)):
+    """이미 오늘 고시 데이터가 있으면 외부 API를 호출하지 않습니다 (last_result: skipped)."""
+    await rate_refresher.refresh()
+    return rate_refresher.status_info()
@@ -1,28 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
-from datetime import datetime, timezone
-from database import get_db
+from starlette.datastructures import UploadFile
+from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from database import get_async_db, get_read_db, read_session_factory, utc_now
 from typing import Optional
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
-import pandas as pd
-from io import BytesIO
-import urllib.parse
-
-from models import Order, Event, Payments, OrderItems, AlterationDetails, Affiliation, Author, Product, Form, FormCategory
-from models.order import OrderStatus
+
+from models import Order, Event, OrderItems, AlterationDetails, Form, FormCategory
 from schemas.category_schema import AttributeResponse, CategoryResponse
-from schemas.order_schema import OrderListResponse, OrderDetailResponse, OrderCreate, OrderStatusUpdate, PaymentInfo, OrderFilterResponse, OrderItemResponse, ProductResponse
+from schemas.order_schema import OrderListResponse, OrderDetailResponse, OrderCreate, OrderStatusUpdate, PaymentInfo, OrderItemResponse, ProductResponse, BulkOrderResponse, OrderStatusBulkUpdate, OrderStatusBulkResponse, OrderStatusHistoryEntry
 from schemas.form_schema import FormResponse, FormRepairResponse
 from schemas.alteration_details_schema import AlterationDetailsInfo
+from services.order_paging import fetch_order_page, InvalidCursorError
+from services.order_search import refresh_order_search
+from services.order_numbers import allocate_order_number
+from services.order_children import sync_order_children
+from services.order_status import (
+    InvalidStatusUpdateError, bulk_update_order_status, record_status_change,
+    add_initial_status_history, order_status_timeline, parse_order_status,
+)
+from services.order_rollup import add_to_daily_rollup, remove_from_daily_rollup
+from services.order_bulk import BulkImportError, iter_json_rows, iter_file_rows, import_orders
+from services.order_loaders import resolve_order_fields, order_loader_options, build_order_summary, InvalidFieldsError
+from services.order_export import export_columns, iter_order_export_rows, order_export_title, order_export_filename
+from services.export_writers import get_export_format, stream_export
 
 router = APIRouter()
 
 # 1. 주문서 리스트 조회 API
-@router.get("/orders", response_model=OrderListResponse, summary="주문서 조회(필터)", tags=["주문서 API"])
+@router.get("/orders", response_model=OrderListResponse, response_model_exclude_unset=True, summary="주문서 조회(필터)", tags=["주문서 API"])
 async def get_orders(
     event_name: Optional[str] = None,
     order_date_from: Optional[datetime] = None,
@@ -33,7 +41,12 @@ async def get_orders(
     is_temp: Optional[bool] = None,
     limit: int = 10,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    profile: Optional[str] = None,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     주문서 조회 API 필터 설명\n
@@ -68,118 +81,55 @@ async def get_orders(
     7.limit 및 offset:\n
     설명: 페이징을 위한 필터, limit은 반환할 주문서 수, offset은 시작 위치.\n
     사용법: /orders?limit=10&offset=20\n
+    8.cursor:\n
+    설명: 커서 기반 페이징. 응답의 next_cursor 값을 그대로 전달하면 offset 대신 다음 페이지를 조회 (order_date_asc/desc 정렬에서 제공).\n
+    사용법: /orders?sort=order_date_desc&limit=50&cursor=eyJzIjoi...\n
+    9.include_total:\n
+    설명: false로 지정하면 전체 개수(total) 계산을 생략 (total은 null로 반환).\n
+    사용법: /orders?cursor=...&include_total=false\n
+    10.profile / fields / include:\n
+    설명: 응답 필드와 로딩할 관계를 제한. 지정하지 않으면 전체 필드를 반환.\n
+        profile: grid (목록 표), export (엑셀 내보내기), detail (전체 필드)\n
+        fields: 반환할 필드를 쉼표로 지정 (profile 대신 사용)\n
+        include: 추가로 포함할 관계 필드 (event_name, form_name, orderItems, payments)\n
+    사용법: /orders?profile=grid 또는 /orders?fields=id,groomName,status&include=payments\n
     """
-    query = db.query(Order).options(
-        joinedload(Order.author),
-        joinedload(Order.affiliation),
-        joinedload(Order.payments),
-        joinedload(Order.event).joinedload(Event.form).joinedload(Form.form_repairs),
-        joinedload(Order.order_items).joinedload(OrderItems.product).joinedload(Product.attributes),
-        joinedload(Order.alteration_details).joinedload(AlterationDetails.form_repair)
-    )
-
-    if event_name:
-        query = query.join(Event).filter(Event.name == event_name)
-    if order_date_from and order_date_to:
-        query = query.filter(and_(Order.created_at >= order_date_from, Order.created_at <= order_date_to))
-    if search:
-        query = query.filter(
-            or_(
-                Order.groomName.ilike(f"%{search}%"),
-                Order.brideName.ilike(f"%{search}%"),
-                Order.address.ilike(f"%{search}%"),
-                Order.contact.ilike(f"%{search}%"),
-                Order.notes.ilike(f"%{search}%"),
-                Order.alter_notes.ilike(f"%{search}%"),
-                Author.name.ilike(f"%{search}%"),
-                Affiliation.name.ilike(f"%{search}%")
-            )
+    try:
+        selected_fields = resolve_order_fields(profile, fields, include)
+        orders, total_orders, next_cursor = await fetch_order_page(
+            db,
+            loader_options=order_loader_options(selected_fields),
+            sort=sort,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+            event_name=event_name,
+            order_date_from=order_date_from,
+            order_date_to=order_date_to,
+            search=search,
+            status=status,
+            is_temp=is_temp
         )
-    if status:
-        query = query.filter(Order.status == status)
-    if is_temp is not None:
-        query = query.filter(Order.isTemporary == is_temp)
-
-    if sort == "order_date_asc":
-        query = query.order_by(Order.created_at.asc())
-    elif sort == "order_date_desc":
-        query = query.order_by(Order.created_at.desc())
-
-    total_orders = query.count()
-    query = query.offset(offset).limit(limit)
-    orders = query.all()
-
-    order_list = [
-        OrderFilterResponse(
-            id=order.id,
-            event_id=order.event_id,
-            author_id=order.author_id,
-            modifier_id=order.modifier_id,
-            affiliation_id=order.affiliation_id,
-            orderNumber=order.orderNumber,
-            event_name=order.event.name,
-            form_name=order.event.form.name,
-            groomName=order.groomName,
-            brideName=order.brideName,
-            orderItems=[
-                OrderItemResponse(
-                    product=ProductResponse(
-                        id=item.product_id,
-                        name=item.product.name,
-                        price=item.product.price
-                    ),
-                    price=item.price,
-                    quantity=item.quantity,
-                    attributes=[
-                        AttributeResponse(id=item.attribute.id, value=item.attribute.value)
-                    ] if item.attribute else []
-                ) for item in order.order_items
-            ],
-            payments=[
-                PaymentInfo(
-                    payer=payment.payer,
-                    payment_date=payment.payment_date,
-                    cashAmount=payment.cashAmount,
-                    cashCurrency=payment.cashCurrency,
-                    cashConversion=payment.cashConversion,
-                    cardAmount=payment.cardAmount,
-                    cardCurrency=payment.cardCurrency,
-                    cardConversion=payment.cardConversion,
-                    tradeInAmount=payment.tradeInAmount,
-                    tradeInCurrency=payment.tradeInCurrency,
-                    tradeInConversion=payment.tradeInConversion,
-                    paymentMethod=payment.paymentMethod,
-                    notes=payment.notes
-                ) for payment in order.payments
-            ],
-            created_at=order.created_at,
-            updated_at=order.updated_at,
-            status=order.status,
-            contact=order.contact,
-            address=order.address,
-            collectionMethod=order.collectionMethod,
-            notes=order.notes,
-            alter_notes=order.alter_notes,
-            totalPrice=order.totalPrice,
-            advancePayment=order.advancePayment,
-            balancePayment=order.balancePayment
-        ) for order in orders
-    ]
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    order_list = [build_order_summary(order, selected_fields) for order in orders]
 
-    return OrderListResponse(orders=order_list, total=total_orders)
+    return OrderListResponse(orders=order_list, total=total_orders, next_cursor=next_cursor)
 
 
 # 2. 단일 주문서 상세 조회 API
 @router.get("/order/{orderID}", response_model=OrderDetailResponse, summary="주문서 상세 조회", tags=["주문서 API"])
-async def get_order_detail(orderID: int, db: Session = Depends(get_db)):
-    order = db.query(Order).options(
-        joinedload(Order.event).joinedload(Event.form).joinedload(Form.form_repairs),
-        joinedload(Order.event).joinedload(Event.form).joinedload(Form.form_categories).joinedload(FormCategory.category),
-        joinedload(Order.order_items).joinedload(OrderItems.product),
-        joinedload(Order.order_items).joinedload(OrderItems.attribute),
-        joinedload(Order.payments),
-        joinedload(Order.alteration_details).joinedload(AlterationDetails.form_repair)
-    ).filter(Order.id == orderID).first()
+async def get_order_detail(orderID: int, db: AsyncSession = Depends(get_read_db)):
+    order = await db.scalar(select(Order).options(
+        selectinload(Order.event).selectinload(Event.form).selectinload(Form.form_repairs),
+        selectinload(Order.event).selectinload(Event.form).selectinload(Form.form_categories).selectinload(FormCategory.category),
+        selectinload(Order.order_items).selectinload(OrderItems.product),
+        selectinload(Order.order_items).selectinload(OrderItems.attribute),
+        selectinload(Order.payments),
+        selectinload(Order.alteration_details).selectinload(AlterationDetails.form_repair)
+    ).where(Order.id == orderID))
 
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
@@ -267,14 +217,26 @@ async def get_order_detail(orderID: int, db: Session = Depends(get_db)):
     return order_detail
 
 
+# 주문 상태 변경 이력 조회 API
+@router.get("/order/{orderID}/status-history", response_model=list[OrderStatusHistoryEntry], summary="주문 상태 변경 이력", tags=["주문서 API"])
+async def get_order_status_history(orderID: int, db: AsyncSession = Depends(get_read_db)):
+    """
+    주문서의 상태 변경 이력 (시간순)\n
+    left_at: 다음 상태로 바뀐 시각, seconds: 해당 상태에 머문 시간(초), 현재 상태는 둘 다 null
+    """
+    if not await db.scalar(select(Order.id).where(Order.id == orderID)):
+        raise HTTPException(status_code=404, detail="주문서를 찾을 수 없습니다.")
+    return await order_status_timeline(db, orderID)
+
 # 주문 상태 업데이트 API
 @router.put("/orders/{orderID}/{order_status}", response_model=OrderStatusUpdate, summary="주문 상태 업데이트", tags=["주문서 API"])
 async def update_order_status(
     orderID: int,
     order_status: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
+    order_status: 주문 상태 이름(In_delivery) 또는 값(In delivery), 응답의 status는 값\n
         Order_Completed = 'Order Completed' / 주문완료\n
         Packaging_Completed = 'Packaging Completed' / 포장완료\n
         Repair_Received = 'Repair Received' / 수선 접수\n
@@ -286,61 +248,66 @@ async def update_order_status(
         Counsel = 'Counsel' / 상담\n
     """
     # 주문서 조회
-    order = db.query(Order).filter(Order.id == orderID).first()
+    order = await db.scalar(select(Order).where(Order.id == orderID))
 
     if not order:
         raise HTTPException(status_code=404, detail="주문서를 찾을 수 없습니다.")
 
-    # 주문 상태 유효성 검사
+    # 주문 상태 유효성 검사 (이름 In_delivery 또는 값 In delivery, 일괄 변경 API와 동일)
     try:
-        new_status = OrderStatus(order_status)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="잘못된 주문 상태입니다.")
-
-    # 주문 상태 업데이트
+        new_status = parse_order_status(order_status)
+    except InvalidStatusUpdateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 상태 변경 이력 기록 후 주문 상태 업데이트 (같은 트랜잭션)
+    now = utc_now()
+    await record_status_change(db, [order.id], new_status, now)
+    await remove_from_daily_rollup(db, [order.id])
     order.status = new_status
-    order.updated_at = datetime.now(timezone.utc)
+    order.updated_at = now
+    await add_to_daily_rollup(db, [order.id])
 
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order)
 
     return {
         "id": order.id,
-        "status": order.status,
+        "status": order.status.value,
         "updated_at": order.updated_at
     }
 
+@router.patch("/orders/status", response_model=OrderStatusBulkResponse, summary="주문 상태 일괄 변경", tags=["주문서 API"])
+async def bulk_update_order_status_route(body: OrderStatusBulkUpdate, db: AsyncSession = Depends(get_async_db)):
+    """
+    여러 주문서의 상태를 한 번에 변경\n
+    - status: 변경할 주문 상태 (이름 Packaging_Completed 또는 값 Packaging Completed, 응답은 값)\n
+    - ids: 변경할 주문서 ID 목록 (없는 ID는 updated=false로 반환)\n
+    - filters: ids 대신 주문서 조회 API와 같은 필터 (event_name, order_date_from, order_date_to, search, status, is_temp)\n
+    사용법: {"status": "In_delivery", "ids": [1, 2, 3]} 또는 {"status": "In_delivery", "filters": {"event_name": "Fashion Week"}}
+    """
+    try:
+        return await bulk_update_order_status(
+            db,
+            body.status,
+            ids=body.ids,
+            filters=body.filters.model_dump() if body.filters else None,
+        )
+    except InvalidStatusUpdateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/order/save", summary="주문서 생성", status_code=status.HTTP_201_CREATED, tags=["주문서 API"])
-async def create_order(order: OrderCreate, db: Session = Depends(get_db), is_temp: bool = False):
+async def create_order(order: OrderCreate, db: AsyncSession = Depends(get_async_db), is_temp: bool = False):
     """
     새로운 주문서 생성
     """
     try:
-        # 임시 저장이 아닌 경우에만 주문번호 생성
-        order_number = None
-        if not is_temp:  
-            today_prefix = datetime.now(timezone.utc).strftime("%y%m%d")
-            latest_order = (
-                db.query(Order)
-                .filter(Order.orderNumber.like(f"{today_prefix}-%"))
-                .order_by(Order.orderNumber.desc())
-                .first()
-            )
-            if latest_order:
-                last_sequence = int(latest_order.orderNumber.split("-")[1])
-                next_sequence = f"{last_sequence + 1:03d}"
-            else:
-                next_sequence = "001"
-            order_number = f"{today_prefix}-{next_sequence}"
-
-        # 새로운 주문서 생성
+        # 새로운 주문서 생성 (주문번호는 커밋 직전에 발급)
         new_order = Order(
             event_id=order.event_id,
             author_id=order.author_id,
             modifier_id=order.modifier_id,
-            orderNumber=order_number,  # 생성된 주문번호 할당
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            created_at=utc_now(),
+            updated_at=utc_now(),
             status=order.status,
             groomName=order.groomName,
             brideName=order.brideName,
@@ -357,53 +324,27 @@ async def create_order(order: OrderCreate, db: Session = Depends(get_db), is_tem
         )
 
         db.add(new_order)
-        db.flush()  # 데이터베이스에 추가하고 ID 확보
-
-        # 주문 상품 정보 (OrderItems) 저장
-        for order_item in order.orderItems:
-            new_item = OrderItems(
-                order_id=new_order.id,
-                product_id=order_item.product_id,
-                attribute_id=order_item.attributes_id,
-                quantity=order_item.quantity,
-                price=order_item.price
-            )
-            db.add(new_item)
-        
-        # 결제 정보 저장
-        if order.payments:
-            for payment in order.payments:
-                new_payment = Payments(
-                    order_id=new_order.id,
-                    payer=payment.payer,
-                    payment_date=payment.payment_date,
-                    cashAmount=payment.cashAmount,
-                    cashCurrency=payment.cashCurrency,
-                    cashConversion=payment.cashConversion,
-                    cardAmount=payment.cardAmount,
-                    cardCurrency=payment.cardCurrency,
-                    cardConversion=payment.cardConversion,
-                    tradeInAmount=payment.tradeInAmount,
-                    tradeInCurrency=payment.tradeInCurrency,
-                    tradeInConversion=payment.tradeInConversion,
-                    paymentMethod=payment.paymentMethod,
-                    notes=payment.notes
-                )
-                db.add(new_payment)
-
-        # 수선 정보 저장
-        if order.alteration_details:
-            for alteration in order.alteration_details:
-                new_alteration = AlterationDetails(
-                    order_id=new_order.id,
-                    form_repair_id=alteration.form_repair_id,
-                    figure=alteration.figure,
-                    alterationFigure=alteration.alterationFigure,
-                )
-                db.add(new_alteration)
+        await db.flush()  # 데이터베이스에 추가하고 ID 확보
+
+        # 주문 상품/결제/수선 정보 저장 (테이블별 대량 INSERT)
+        await sync_order_children(db, new_order.id, order, is_new=True)
+
+        # 최초 상태 이력
+        await add_initial_status_history(db, [(new_order.id, order.status)], new_order.created_at)
+
+        # 행사 대시보드 집계 반영 (임시 주문서는 제외됨)
+        await add_to_daily_rollup(db, [new_order.id])
+
+        # 검색 문서 생성
+        await refresh_order_search(db, [new_order.id])
+
+        # 임시 저장이 아닌 경우에만 주문번호 발급
+        # 카운터 행 잠금이 커밋까지 유지되므로 마지막에 발급해 같은 날 저장끼리 기다리는 시간을 줄임
+        if not is_temp:
+            new_order.orderNumber = await allocate_order_number(db)
 
         # 모든 데이터 커밋
-        db.commit()
+        await db.commit()
         return {
             "message": "Order saved successfully!",
             "order_id": new_order.id,
@@ -411,40 +352,31 @@ async def create_order(order: OrderCreate, db: Session = Depends(get_db), is_tem
         }
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"주문 생성 중 오류가 발생했습니다: {str(e)}")
 
 @router.put("/order/save/{order_id}", summary="주문서 수정", tags=["주문서 API"])
-async def update_order(order_id: int, order: OrderCreate, db: Session = Depends(get_db), is_temp: bool = False):
+async def update_order(order_id: int, order: OrderCreate, db: AsyncSession = Depends(get_async_db), is_temp: bool = False):
     """
     기존 주문서 수정
     """
     try:
-        existing_order = db.query(Order).filter(Order.id == order_id).first()
+        existing_order = await db.scalar(select(Order).where(Order.id == order_id))
         if not existing_order:
             raise HTTPException(status_code=404, detail="Order not found")
 
-        # orderNumber가 None이고 is_temp가 False일 경우 새로운 주문번호 생성
-        if not is_temp and not existing_order.orderNumber:
-            today_prefix = datetime.now(timezone.utc).strftime("%y%m%d")
-            latest_order = (
-                db.query(Order)
-                .filter(Order.orderNumber.like(f"{today_prefix}-%"))
-                .order_by(Order.orderNumber.desc())
-                .first()
-            )
-            if latest_order:
-                last_sequence = int(latest_order.orderNumber.split("-")[1])
-                next_sequence = f"{last_sequence + 1:03d}"
-            else:
-                next_sequence = "001"
-            existing_order.orderNumber = f"{today_prefix}-{next_sequence}"
+        # 상태가 바뀌는 경우 변경 이력 기록 (주문서 수정 전에 현재 상태와 비교)
+        now = utc_now()
+        await record_status_change(db, [order_id], order.status, now)
+
+        # 수정 전 값을 행사 대시보드 집계에서 빼고, 수정 후 다시 더함
+        await remove_from_daily_rollup(db, [order_id])
 
         # 주문 정보 수정
         existing_order.event_id = order.event_id
         existing_order.author_id = order.author_id
         existing_order.modifier_id = order.modifier_id
-        existing_order.updated_at = datetime.now(timezone.utc)
+        existing_order.updated_at = now
         existing_order.status = order.status
         existing_order.groomName = order.groomName
         existing_order.brideName = order.brideName
@@ -459,115 +391,87 @@ async def update_order(order_id: int, order: OrderCreate, db: Session = Depends(
         existing_order.balancePayment = order.balancePayment
         existing_order.isTemporary = is_temp
 
-        db.flush()
-
-        # 상품 정보 (OrderItems) 업데이트 (삭제 후 재생성)
-        db.query(OrderItems).filter(OrderItems.order_id == existing_order.id).delete()
-        for order_item in order.orderItems:
-            new_item = OrderItems(
-                order_id=existing_order.id,
-                product_id=order_item.product_id,
-                attribute_id=order_item.attributes_id,
-                quantity=order_item.quantity,
-                price=order_item.price
-            )
-            db.add(new_item)
-
-        # 결제 정보 업데이트
-        for payment in order.payments:
-            existing_payment = db.query(Payments).filter(
-                and_(Payments.order_id == existing_order.id, Payments.paymentMethod == payment.paymentMethod)
-            ).first()
-            if existing_payment:
-                existing_payment.payer = payment.payer
-                existing_payment.payment_date = payment.payment_date
-                existing_payment.cashAmount = payment.cashAmount
-                existing_payment.cashCurrency = payment.cashCurrency
-                existing_payment.cashConversion = payment.cashConversion
-                existing_payment.cardAmount = payment.cardAmount
-                existing_payment.cardCurrency = payment.cardCurrency
-                existing_payment.cardConversion = payment.cardConversion
-                existing_payment.tradeInAmount = payment.tradeInAmount
-                existing_payment.tradeInCurrency = payment.tradeInCurrency
-                existing_payment.tradeInConversion = payment.tradeInConversion
-                existing_payment.notes = payment.notes
-            else:
-                new_payment = Payments(
-                    order_id=existing_order.id,
-                    payer=payment.payer,
-                    payment_date=payment.payment_date,
-                    cashAmount=payment.cashAmount,
-                    cashCurrency=payment.cashCurrency,
-                    cashConversion=payment.cashConversion,
-                    cardAmount=payment.cardAmount,
-                    cardCurrency=payment.cardCurrency,
-                    cardConversion=payment.cardConversion,
-                    tradeInAmount=payment.tradeInAmount,
-                    tradeInCurrency=payment.tradeInCurrency,
-                    tradeInConversion=payment.tradeInConversion,
-                    paymentMethod=payment.paymentMethod,
-                    notes=payment.notes
-                )
-                db.add(new_payment)
-
-        # 수선 정보 업데이트
-        for alteration in order.alteration_details:
-            existing_alteration = db.query(AlterationDetails).filter(
-                and_(AlterationDetails.order_id == existing_order.id, AlterationDetails.form_repair_id == alteration.form_repair_id)
-            ).first()
-            if existing_alteration:
-                existing_alteration.figure = alteration.figure
-                existing_alteration.alterationFigure = alteration.alterationFigure
-            else:
-                new_alteration = AlterationDetails(
-                    order_id=existing_order.id,
-                    form_repair_id=alteration.form_repair_id,
-                    figure=alteration.figure,
-                    alterationFigure=alteration.alterationFigure,
-                )
-                db.add(new_alteration)
+        await db.flush()
+
+        # 주문 상품/결제/수선 정보 업데이트 (기존 데이터를 한 번에 읽어 변경분만 대량 반영)
+        await sync_order_children(db, existing_order.id, order)
+
+        # 검색 문서 / 행사 대시보드 집계 갱신
+        await refresh_order_search(db, [existing_order.id])
+        await add_to_daily_rollup(db, [existing_order.id])
+
+        # orderNumber가 None이고 is_temp가 False일 경우 새로운 주문번호 생성 (카운터 잠금을 줄이도록 커밋 직전에 발급)
+        if not is_temp and not existing_order.orderNumber:
+            existing_order.orderNumber = await allocate_order_number(db)
+
         # 모든 데이터 커밋
-        db.commit()
+        await db.commit()
         return {"message": "Order updated successfully!", "order_id": existing_order.id}
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"주문 수정 중 오류가 발생했습니다: {str(e)}")
 
 # 임시 저장 주문서 API
 @router.post("/temp/order/save", summary="임시 주문서 생성", status_code=status.HTTP_201_CREATED, tags=["주문서 API"])
-async def create_temp_order(order: OrderCreate, db: Session = Depends(get_db)):
+async def create_temp_order(order: OrderCreate, db: AsyncSession = Depends(get_async_db)):
     return await create_order(order, db, is_temp=True)
 
 @router.put("/temp/order/save/{order_id}", summary="임시 주문서 수정", tags=["주문서 API"])
-async def update_temp_order(order_id: int, order: OrderCreate, db: Session = Depends(get_db)):
+async def update_temp_order(order_id: int, order: OrderCreate, db: AsyncSession = Depends(get_async_db)):
     return await update_order(order_id, order, db, is_temp=True)
 
+@router.post("/orders/bulk", response_model=BulkOrderResponse, summary="주문서 일괄 생성", tags=["주문서 API"])
+async def bulk_create_orders(request: Request, db: AsyncSession = Depends(get_async_db), is_temp: bool = False):
+    """
+    주문서 일괄 생성
+    - JSON: 주문서 생성 요청(OrderCreate) 목록
+    - multipart/form-data: file 필드에 CSV(UTF-8) 또는 XLSX 파일 (첫 행은 헤더)
+      - 헤더: 행사 ID, 작성자 ID, 수정자 ID, 소속 ID, 주문 상태, 신랑, 신부, 연락처, 주소, 수령 방법,
+        비고, 수선 비고, 총 주문 금액, 선금, 잔금 (OrderCreate 필드 이름도 사용 가능)
+      - 주문 상품/결제/수선 칼럼은 OrderCreate의 orderItems/payments/alteration_details 형식의 JSON 배열
+    200건 단위로 한 트랜잭션에서 저장하며, 잘못된 행은 건너뛰고 행 번호별 오류로 돌려준다.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("multipart/form-data"):
+            form = await request.form()
+            upload = form.get("file")
+            if not isinstance(upload, UploadFile):
+                raise HTTPException(status_code=400, detail="file 필드에 CSV 또는 XLSX 파일을 첨부해야 합니다.")
+            rows = iter_file_rows(upload.filename, upload.file)
+        elif content_type.startswith("application/json"):
+            try:
+                body = await request.json()
+            except ValueError:
+                raise HTTPException(status_code=400, detail="JSON 형식이 올바르지 않습니다.")
+            rows = iter_json_rows(body)
+        else:
+            raise HTTPException(status_code=415, detail="application/json 또는 multipart/form-data 요청만 지원합니다.")
+        return await import_orders(db, rows, is_temp)
+    except BulkImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.delete("/order/{order_id}", summary="주문서 삭제", status_code=status.HTTP_200_OK, tags=["주문서 API"])
-async def delete_order(order_id: int, db: Session = Depends(get_db)):
+async def delete_order(order_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     주문서 삭제 API
     - 해당 주문서와 관련된 OrderItems, Payments, AlterationDetails 테이블의 데이터도 함께 삭제합니다.
+      (하위 테이블은 DB의 ON DELETE CASCADE로 삭제)
     """
-    # 주문서 검색
-    existing_order = db.query(Order).filter(Order.id == order_id).first()
+    await remove_from_daily_rollup(db, [order_id])
+    result = await db.execute(delete(Order).where(Order.id == order_id))
 
-    if not existing_order:
+    if result.rowcount == 0:
+        await db.rollback()
         raise HTTPException(status_code=404, detail="주문서를 찾을 수 없습니다.")
-    # OrderItems 삭제
-    db.query(OrderItems).filter(OrderItems.order_id == order_id).delete()
-    # Payments 삭제
-    db.query(Payments).filter(Payments.order_id == order_id).delete()
-    # AlterationDetails 삭제
-    db.query(AlterationDetails).filter(AlterationDetails.order_id == order_id).delete()
-    # 주문서 삭제
-    db.delete(existing_order)
     # 변경 사항 커밋
-    db.commit()
+    await db.commit()
     return {"message": "주문서 및 관련 데이터가 성공적으로 삭제되었습니다.", "order_id": order_id}
 
 @router.get("/orders/download", summary="Excel 다운로드", tags=["주문서 API"])
 async def download_orders(
+    request: Request,
     event_name: Optional[str] = None,
     order_date_from: Optional[datetime] = None,
     order_date_to: Optional[datetime] = None,
@@ -575,7 +479,8 @@ async def download_orders(
     search: Optional[str] = None,
     status: Optional[str] = None,
     is_temp: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    export_format: str = Query("xlsx", alias="format"),
+    dataset: str = "payments"
 ):
     """
     주문서 Excel 다운로드 API 설명
@@ -616,136 +521,49 @@ async def download_orders(
        - 설명: 일반/임시 주문서를 선택하여 조회합니다.
        - 사용법: /orders/download?is_temp=False
 
+    7. format:
+       - 설명: 파일 형식을 선택합니다. 모든 형식의 칼럼(한글 헤더)은 엑셀과 같습니다.
+       - 옵션: xlsx (기본값), csv (UTF-8 BOM), ndjson (한 줄에 한 행), parquet
+       - 사용법: /orders/download?format=csv
+
+    8. dataset:
+       - 설명: 한 행의 기준이 되는 데이터를 선택합니다. 주문서 칼럼 뒤에 해당 데이터 칼럼이 붙습니다.
+       - 옵션: payments (결제 1건당 1행, 기본값), items (주문 상품 1건당 1행), alterations (수선 내역 1건당 1행)
+       - 사용법: /orders/download?dataset=items&format=parquet
+
     엑셀 파일 다운로드:
-    - API 호출 후 응답으로 생성된 엑셀 파일이 다운로드됩니다.
-    - 파일명은 'orders.xlsx'로 제공됩니다.
+    - API 호출 후 응답으로 생성된 파일이 다운로드됩니다.
+    - 파일명은 '{행사명}_{날짜}.{확장자}'로 제공됩니다.
     """
-    # 주문서 조회와 동일한 쿼리 로직 재사용
-    query = db.query(Order).options(
-        joinedload(Order.author),
-        joinedload(Order.modifier),  # 수정자 로드 추가
-        joinedload(Order.affiliation),
-        joinedload(Order.payments),
-        joinedload(Order.event).joinedload(Event.form),
-        joinedload(Order.order_items).joinedload(OrderItems.product).joinedload(Product.attributes)
+    try:
+        file_format = get_export_format(export_format)
+        columns = export_columns(dataset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 응답 본문을 보내는 동안에는 요청 종속성의 세션이 이미 닫혀 있으므로 생성기에서 별도 세션 사용
+    session_factory = read_session_factory(request)
+    filters = dict(
+        event_name=event_name,
+        order_date_from=order_date_from,
+        order_date_to=order_date_to,
+        search=search,
+        status=status,
+        is_temp=is_temp
     )
 
-    # 필터 적용
-    if event_name:
-        query = query.join(Event).filter(Event.name == event_name)
-
-    if order_date_from and order_date_to:
-        query = query.filter(and_(Order.created_at >= order_date_from, Order.created_at <= order_date_to))
-
-    if search:
-        query = query.filter(
-            or_(
-                Order.orderName.ilike(f"%{search}%"),
-                Order.address.ilike(f"%{search}%"),
-                Order.author.name.ilike(f"%{search}%"),
-                Order.affiliation.name.ilike(f"%{search}%")
-            )
-        )
+    # 서버 사이드 커서로 읽은 행을 바로 파일 청크로 변환하여 전송 (메모리 사용량이 주문서 수와 무관)
+    async def generate():
+        async with session_factory() as session:
+            rows = iter_order_export_rows(session, sort=sort, dataset=dataset, **filters)
+            async for chunk in stream_export(rows, export_format, columns, title=order_export_title(event_name)):
+                yield chunk
 
-    if status:
-        query = query.filter(Order.status == status)
-
-    if is_temp is not None:
-        query = query.filter(Order.isTemporary == is_temp)
-
-    # 정렬 옵션 처리
-    if sort == "order_date_asc":
-        query = query.order_by(Order.created_at.asc())
-    elif sort == "order_date_desc":
-        query = query.order_by(Order.created_at.desc())
-
-    # 모든 필터링된 주문서 가져오기
-    orders = query.all()
-
-    # 데이터프레임 생성
-    rows = []
-    for order in orders:
-        for payment in order.payments:
-            rows.append({
-                "Event Name": order.event.name if order.event else None,
-                "Author Name": order.author.name if order.author else None,
-                "Modifier Name": order.modifier.name if order.modifier else None,  # 수정자 이름 추가
-                "Order Name": order.orderName,
-                "Contact": order.contact,
-                "Affiliation Name": order.affiliation.name if order.affiliation else None,
-                "Collection Method": order.collectionMethod,
-                "Status": order.status,
-                "Created At": order.created_at,
-                "Updated At": order.updated_at,  # 수정 시간 추가
-                "Total Price": order.totalPrice,
-                "Total Payment": order.advancePayment + order.balancePayment,
-                "Payment Date": payment.payment_date,
-                "Payment Method": payment.paymentMethod,
-                "Address": order.address,
-                "Notes": payment.notes,
-            })
-
-    df = pd.DataFrame(rows)
-
-    # Excel 파일 생성 및 스타일링
-    wb = Workbook()
-    ws = wb.active
-
-    # 칼럼 헤더 설정 (2번째 줄)
-    headers = [
-        "행사명", "작성자", "수정자", "주문자", "연락처",  # 수정자 컬럼 추가
-        "소속", "수령 방법", "주문 상태", 
-        "주문서 생성날짜", "주문서 수정날짜",  # 수정 날짜 추가
-        "총 주문 금액", "총 결제 금액", 
-        "결제 날짜", "결제 방식", "주소", "비고"
-    ]
-
-    for c_idx, header in enumerate(headers, 1):
-        ws.cell(row=2, column=c_idx, value=header)
-
-    # 데이터 입력 (3번째 줄부터)
-    for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False), 3):
-        for c_idx, value in enumerate(row, 1):
-            ws.cell(row=r_idx, column=c_idx, value=value)
-
-    # 헤더 행에 필터 추가 (2번째 줄부터)
-    ws.auto_filter.ref = f"A2:P{len(rows) + 2}"  # 필터 범위를 2번째 줄부터 설정
-
-    # 열 너비 자동 조정
-    for column in ws.columns:
-        max_length = 0
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except Exception as e:
-                print(f"Error calculating length for cell {cell}: {e}")
-
-        # 열 문자 가져오기 (첫 번째 셀을 사용)
-        if max_length > 0:  # max_length가 0보다 클 경우에만 너비 설정
-            column_letter = column[0].column_letter  # 열 문자 가져오기
-            adjusted_width = (max_length + 2)  # 여유 공간 추가
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-    # 행사명 설정 (A1) 및 병합
-    ws.merge_cells('A1:P1')  # 행사명 셀 병합
-    ws['A1'] = f"행사명: {event_name or '전체'} 주문서 목록"
-    ws['A1'].font = Font(size=14, bold=True)
-    ws['A1'].alignment = Alignment(horizontal="center")
-
-    # 엑셀 파일 버퍼에 저장
-    excel_buffer = BytesIO()
-    wb.save(excel_buffer)
-    excel_buffer.seek(0)
-
-    # 현재 시간을 포맷하여 파일 이름에 추가
-    current_time = datetime.now().strftime("%Y%m%d")  # 예: 20230924_153045
-    file_name = f"{event_name or '전체 주문서'}_{current_time}.xlsx"
-    file_name = urllib.parse.quote(file_name)  # URL 인코딩
+    file_name = order_export_filename(event_name, file_format.extension, dataset)
 
     # 다운로드 응답 반환
     return StreamingResponse(
-        excel_buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        generate(),
+        media_type=file_format.media_type,
         headers={"Content-Disposition": f"attachment; filename*=UTF-8''{file_name}"}
     )
@@ -6,3 +6,6 @@ from .event_schema import *
 from .form_schema import *
 from .order_schema import *
 from .user_schema import *
+from .internal_schema import *
+from .export_schema import *
+from .rate_schema import *
@@ -39,3 +39,61 @@ class EventUpdate(BaseModel):
     start_date: Optional[date] = None
     end_date: Optional[date] = None
     inProgress: Optional[bool] = None
+
+
+# 행사 대시보드 (주문 집계 테이블 기준, 임시 주문서 제외)
+class DashboardTotals(BaseModel):
+    order_count: int
+    totalPrice: float
+    advancePayment: float
+    balancePayment: float
+
+
+class DashboardStatusTotals(DashboardTotals):
+    status: Optional[str] = None  # 상태 미지정 주문서는 null
+
+
+class DashboardDayTotals(DashboardTotals):
+    day: date
+
+
+class EventDashboardResponse(DashboardTotals):
+    event_id: int
+    by_status: List[DashboardStatusTotals] = []
+    by_day: List[DashboardDayTotals] = []
+
+
+# 행사 결제 원화 재평가 (결제일 기준 시세 적용, 입력된 환산액 대비 차이)
+class ValuationTotals(BaseModel):
+    count: int
+    stored_krw: float
+    valued_krw: float
+    drift_krw: float
+    unvalued_count: int  # 적용할 시세/통화가 없어 재평가하지 못한 항목 수
+    unconverted_count: int  # 환산액이 입력되지 않아(NULL) 차이 계산에서 제외한 항목 수
+
+
+class ValuationCurrencyTotals(ValuationTotals):
+    component: str  # cash / card / tradeIn
+    currency: Optional[str] = None
+    amount: float
+
+
+class ValuationDrift(BaseModel):
+    payment_id: int
+    order_id: int
+    payment_date: Optional[date] = None
+    component: str
+    currency: Optional[str] = None
+    amount: float
+    rate: float
+    stored_krw: float
+    valued_krw: float
+    drift_krw: float
+
+
+class EventValuationResponse(ValuationTotals):
+    event_id: int
+    payment_count: int
+    by_currency: List[ValuationCurrencyTotals] = []
+    largest_drifts: List[ValuationDrift] = []
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+# 내보내기 작업 생성 요청 (주문서 Excel 다운로드와 같은 필터)
+class ExportCreate(BaseModel):
+    event_name: Optional[str] = None
+    order_date_from: Optional[datetime] = None
+    order_date_to: Optional[datetime] = None
+    sort: Optional[str] = "order_date_asc"
+    search: Optional[str] = None
+    status: Optional[str] = None
+    is_temp: Optional[bool] = None
+    # 파일 형식 (xlsx, csv, ndjson, parquet)과 행 기준 데이터 (payments, items, alterations)
+    format: str = "xlsx"
+    dataset: str = "payments"
+
+# 내보내기 작업 상태
+class ExportJobResponse(BaseModel):
+    id: str
+    status: str
+    progress: float
+    rows_written: int
+    total_rows: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    download_url: Optional[str] = None
@@ -0,0 +1,50 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+# 커넥션 대기 시간 통계
+class PoolWaitInfo(BaseModel):
+    checkouts: int
+    total_wait_ms: float
+    avg_wait_ms: float
+    max_wait_ms: float
+    timeouts: int
+
+# 커넥션 풀 상태
+class DBPoolStatus(BaseModel):
+    pool_class: str
+    pool_size: Optional[int] = None
+    checked_out: Optional[int] = None
+    idle: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    timeout: Optional[float] = None
+    recycle: Optional[int] = None
+    pre_ping: Optional[bool] = None
+    wait: Optional[PoolWaitInfo] = None
+
+class DBPoolResponse(BaseModel):
+    pools: dict[str, DBPoolStatus]
+
+# 금 시세/환율 백그라운드 갱신 상태
+class RateCacheStatus(BaseModel):
+    ttl_seconds: int
+    cached: bool
+    etag: Optional[str] = None
+    hits: int
+    loads: int
+
+
+class RateRefreshStatus(BaseModel):
+    enabled: bool
+    status: str
+    last_result: Optional[str] = None
+    last_error: Optional[str] = None
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_duration: Optional[float] = None
+    last_success_at: Optional[datetime] = None
+    next_run_at: Optional[datetime] = None
+    runs: int
+    failures: int
+    cache: Optional[RateCacheStatus] = None
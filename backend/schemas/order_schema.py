@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from schemas.alteration_details_schema import AlterationDetailsInfo
 from schemas.category_schema import AttributeResponse
@@ -70,6 +70,7 @@ class OrderFilterResponse(BaseModel):
 class OrderListResponse(BaseModel):
     orders: Optional[List[OrderFilterResponse]] = []
     total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 # 주문서 상세 조회 응답 스키마
 class OrderDetailResponse(BaseModel):
@@ -124,3 +125,68 @@ class OrderStatusUpdate(BaseModel):
     id: Optional[int]
     status: Optional[str] = None
     updated_at: Optional[datetime]
+
+# 주문 상태 일괄 변경 대상 필터 (주문서 조회 API와 같은 필터)
+class OrderStatusFilter(BaseModel):
+    event_name: Optional[str] = None
+    order_date_from: Optional[datetime] = None
+    order_date_to: Optional[datetime] = None
+    search: Optional[str] = None
+    status: Optional[str] = None
+    is_temp: Optional[bool] = None
+
+# 주문 상태 일괄 변경 요청 (ids 또는 filters 중 하나로 대상 지정)
+class OrderStatusBulkUpdate(BaseModel):
+    status: str
+    ids: Optional[List[int]] = None
+    filters: Optional[OrderStatusFilter] = None
+
+class OrderStatusResult(BaseModel):
+    id: int
+    updated: bool
+    status: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+class OrderStatusBulkResponse(BaseModel):
+    status: str
+    matched: int
+    updated: int
+    results: List[OrderStatusResult] = []
+
+# 주문서 일괄 생성 결과 (row: 요청 목록/파일 데이터 행의 1부터 시작하는 번호, 헤더 제외)
+class BulkOrderCreated(BaseModel):
+    row: int
+    order_id: int
+    orderNumber: Optional[str] = None
+
+class BulkOrderError(BaseModel):
+    row: int
+    errors: List[str]
+
+class BulkOrderResponse(BaseModel):
+    total: int
+    created: int
+    failed: int
+    results: List[BulkOrderCreated] = []
+    errors: List[BulkOrderError] = []
+
+# 주문 상태 변경 이력 (left_at: 다음 상태로 바뀐 시각, 현재 상태면 None)
+class OrderStatusHistoryEntry(BaseModel):
+    status: str
+    changed_at: datetime
+    left_at: Optional[datetime] = None
+    seconds: Optional[float] = None
+
+# 상태별 체류 시간 통계 (초 단위, percentiles 키는 "p50" 형식)
+class StatusDwellTime(BaseModel):
+    status: str
+    count: int
+    avg_seconds: float
+    min_seconds: float
+    max_seconds: float
+    percentiles: Dict[str, float] = {}
+
+class EventStatusDwellResponse(BaseModel):
+    event_id: int
+    statuses: List[StatusDwellTime] = []
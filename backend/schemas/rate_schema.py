@@ -0,0 +1,36 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import date, datetime
+from typing import Optional, List
+
+# 기준일별 금 시세/환율 (rate 테이블 1행)
+class RateHistoryItem(BaseModel):
+    gold_bas_dt: Optional[date] = None
+    gold_24k: Optional[float] = None
+    gold_18k: Optional[float] = None
+    gold_14k: Optional[float] = None
+    gold_10k: Optional[float] = None
+    exchange_bas_dt: Optional[date] = None
+    usd: Optional[float] = None
+    jpy: Optional[float] = None
+    krw: Optional[float] = None
+    search_dt: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RateHistoryResponse(BaseModel):
+    items: List[RateHistoryItem]
+
+
+# 특정일에 적용되는 금 시세/환율 (각각 기준일이 해당일 이하인 가장 최근 값)
+class RateAsOfResponse(BaseModel):
+    date: date
+    gold_bas_dt: Optional[date] = None
+    gold_24k: Optional[float] = None
+    gold_18k: Optional[float] = None
+    gold_14k: Optional[float] = None
+    gold_10k: Optional[float] = None
+    exchange_bas_dt: Optional[date] = None
+    usd: Optional[float] = None
+    jpy: Optional[float] = None
+    krw: Optional[float] = None
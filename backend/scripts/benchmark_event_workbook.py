@@ -0,0 +1,161 @@
+"""
+이벤트 통합 워크북(시트 4개, 프로세스 풀) 생성 시간과 기존 단일 시트 Excel 다운로드 생성 시간 비교 스크립트
+
+사용법 (backend 디렉터리에서 실행):
+    # 임시 SQLite DB를 만들어 한 이벤트에 주문서 20000건을 넣고 비교
+    python -m scripts.benchmark_event_workbook --orders 20000
+
+    # 기존 데이터베이스의 이벤트로 비교
+    python -m scripts.benchmark_event_workbook --database-url postgresql://... --event-id 3
+
+측정 항목:
+    - single-sheet: /orders/download 와 같은 결제 단위 단일 시트 (현재 경로)
+    - workbook-serial: 통합 워크북의 시트를 현재 프로세스에서 순서대로 생성
+    - workbook-pool: 통합 워크북의 시트를 프로세스 풀에서 병렬로 생성 (풀 기동 시간 제외)
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="이벤트 통합 워크북 생성 시간 비교")
+    parser.add_argument("--database-url", help="대상 DB URL (생략 시 임시 SQLite DB 생성)")
+    parser.add_argument("--event-id", type=int, help="대상 이벤트 ID (생략 시 첫 번째 이벤트)")
+    parser.add_argument("--orders", type=int, default=20000, help="시드할 주문서 수")
+    parser.add_argument("--processes", type=int, default=4, help="프로세스 풀 크기")
+    parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수 (최솟값 보고)")
+    return parser.parse_args()
+
+
+def seed(session, order_count: int):
+    from sqlalchemy import insert, select
+    from models import Order, Event, Form, FormRepair, Category, Product, Attributes, OrderItems, Payments, AlterationDetails
+    from models.order import OrderStatus
+
+    form_id = session.execute(insert(Form).values(name="benchmark", created_at=datetime.now()).returning(Form.id)).scalar_one()
+    event_id = session.execute(insert(Event).values(name="벤치마크 행사", form_id=form_id, inProgress=True).returning(Event.id)).scalar_one()
+    category_id = session.execute(insert(Category).values(name="정장", created_at=datetime.now()).returning(Category.id)).scalar_one()
+    session.execute(insert(Product), [{"name": f"상품 {index}", "category_id": category_id, "price": 100 + index} for index in range(20)])
+    session.execute(insert(Attributes), [{"value": size} for size in ("S", "M", "L", "XL")])
+    session.execute(insert(FormRepair), [
+        {"form_id": form_id, "information": f"수선 {index}", "unit": "CM", "isAlterable": True, "indexNumber": index}
+        for index in range(6)
+    ])
+    product_ids = list(session.scalars(select(Product.id)))
+    attribute_ids = list(session.scalars(select(Attributes.id)))
+    repair_ids = list(session.scalars(select(FormRepair.id)))
+    statuses = list(OrderStatus)
+    start = datetime(2024, 1, 1)
+
+    for offset in range(0, order_count, 1000):
+        orders = []
+        for index in range(offset, min(offset + 1000, order_count)):
+            created_at = start + timedelta(minutes=index * 7)
+            orders.append({
+                "event_id": event_id,
+                "orderNumber": f"{created_at:%y%m%d}-{index % 1000:03d}",
+                "created_at": created_at,
+                "updated_at": created_at,
+                "status": random.choice(statuses),
+                "groomName": f"신랑{index}",
+                "brideName": f"신부{index}",
+                "address": f"서울시 테스트구 {index}번지",
+                "totalPrice": 300,
+                "advancePayment": 100,
+                "balancePayment": 200,
+                "isTemporary": False,
+            })
+        order_ids = session.execute(insert(Order).returning(Order.id), orders).scalars().all()
+        session.execute(insert(OrderItems), [
+            {"order_id": order_id, "product_id": random.choice(product_ids), "attribute_id": random.choice(attribute_ids),
+             "quantity": random.randint(1, 3), "price": 100}
+            for order_id in order_ids for _ in range(3)
+        ])
+        session.execute(insert(Payments), [
+            {"order_id": order_id, "payer": "결제자", "payment_date": start, "cashAmount": 100, "cashCurrency": "KRW",
+             "cashConversion": 100, "paymentMethod": method}
+            for order_id in order_ids for method in ("ADVANCE", "BALANCE")
+        ])
+        session.execute(insert(AlterationDetails), [
+            {"order_id": order_id, "form_repair_id": repair_id, "figure": 1.5, "alterationFigure": 2.0}
+            for order_id in order_ids for repair_id in repair_ids
+        ])
+    session.commit()
+    return event_id
+
+
+def measure(label: str, repeat: int, run):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = run()
+        timings.append(time.perf_counter() - started)
+    print(f"{label:<16} best {min(timings):7.3f}s  avg {sum(timings) / len(timings):7.3f}s  size {size / 1024 / 1024:6.2f}MB")
+
+
+def main():
+    args = parse_args()
+    # 프로세스 풀의 자식 프로세스도 같은 DB를 보도록 환경 변수로 전달
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark.db')}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["EVENT_WORKBOOK_PROCESSES"] = str(args.processes)
+
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    from sqlalchemy import select, func
+    from database import Base, SessionLocal, engine
+    from models import Event, Order
+    from services.event_workbook import build_event_workbook, render_event_sheet, EVENT_SHEETS
+    from services.export_writers import iter_export
+    from services.order_export import export_columns, iter_order_export_rows_sync, order_export_title
+
+    if not args.database_url:
+        Base.metadata.create_all(engine)
+        with SessionLocal() as session:
+            seeded_event_id = seed(session, args.orders)
+    else:
+        seeded_event_id = None
+
+    with SessionLocal() as session:
+        event_id = args.event_id or seeded_event_id or session.scalar(select(Event.id).order_by(Event.id))
+        event_name = session.scalar(select(Event.name).where(Event.id == event_id))
+        order_count = session.scalar(select(func.count()).select_from(Order).where(Order.event_id == event_id))
+    print(f"event {event_id} ({event_name}): {order_count} orders, sheets: {', '.join(EVENT_SHEETS)}")
+
+    work_dir = tempfile.mkdtemp(prefix="event-workbook-benchmark-")
+
+    def single_sheet():
+        target = os.path.join(work_dir, "single.xlsx")
+        with SessionLocal() as session, open(target, "wb") as file:
+            rows = iter_order_export_rows_sync(session, event_name=event_name)
+            for chunk in iter_export(rows, "xlsx", export_columns(), title=order_export_title(event_name)):
+                file.write(chunk)
+        return os.path.getsize(target)
+
+    def workbook(executor=None):
+        def run():
+            directory = tempfile.mkdtemp(dir=work_dir)
+            target = os.path.join(directory, "workbook.xlsx")
+            build_event_workbook(target, event_id, None, directory, executor=executor)
+            return os.path.getsize(target)
+        return run
+
+    try:
+        measure("single-sheet", args.repeat, single_sheet)
+        measure("workbook-serial", args.repeat, workbook())
+        with ProcessPoolExecutor(max_workers=args.processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+            # 자식 프로세스 기동/임포트 시간은 서버에서는 최초 1회만 발생하므로 측정에서 제외
+            list(executor.map(render_event_sheet, EVENT_SHEETS, [event_id] * len(EVENT_SHEETS),
+                              [None] * len(EVENT_SHEETS), [tempfile.mkdtemp(dir=work_dir)] * len(EVENT_SHEETS)))
+            measure("workbook-pool", args.repeat, workbook(executor))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
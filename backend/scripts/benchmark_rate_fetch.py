@@ -0,0 +1,111 @@
+"""
+금 시세/환율 조회 벤치마크 스크립트 (로컬 스텁 서버 사용, 외부 API 호출 없음)
+
+오늘(고시 전)과 최근 --gap 일의 데이터가 없는 상황에서
+- sequential: 기존 방식 (날짜별 순차 호출, 요청마다 새 연결)
+- concurrent: 공용 클라이언트로 모든 날짜를 동시에 조회하고 가장 최신 결과 사용
+의 소요 시간/요청 수/연결 수를 비교하고, 두 방식의 결과가 같은지 확인한다.
+재시도/타임아웃/저장 경로는 tests/test_rate_fetch.py 에서 검사한다.
+
+사용법 (backend 디렉터리에서 실행):
+    python -m scripts.benchmark_rate_fetch --latency 0.2 --gap 2
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import httpx
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="금 시세/환율 조회 벤치마크")
+    parser.add_argument("--port", type=int, default=8900, help="스텁 서버 포트")
+    parser.add_argument("--latency", type=float, default=0.2, help="스텁 응답 지연 (초)")
+    parser.add_argument("--gap", type=int, default=2, help="오늘 이전에 데이터가 없는 일수 (주말/휴일)")
+    return parser.parse_args()
+
+
+async def fetch_sequential(dates):
+    """기존 update_rate_data 의 조회 순서 (날짜별로 금 시세 -> 환율 순차 호출, 연결 재사용 없음)"""
+    from services import rates
+
+    async def get_json_without_pool(client, url, params):
+        async with httpx.AsyncClient(timeout=client.timeout) as fresh:
+            response = await fresh.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+
+    original = rates.get_json
+    rates.get_json = get_json_without_pool
+    try:
+        gold_data = exchange_data = None
+        for date in dates:
+            if not gold_data:
+                gold_data = await rates.fetch_gold_data(date)
+            if not exchange_data:
+                exchange_data = await rates.fetch_exchange_data(date)
+            if gold_data and exchange_data:
+                break
+        return gold_data, exchange_data
+    finally:
+        rates.get_json = original
+
+
+async def fetch_concurrent(dates):
+    from services import rates
+
+    gold_data, exchange_data = await asyncio.gather(
+        rates.fetch_latest(rates.fetch_gold_data, dates),
+        rates.fetch_latest(rates.fetch_exchange_data, dates),
+    )
+    return gold_data, exchange_data
+
+
+async def timed(label, stats, coroutine):
+    from services import rates
+
+    await rates.close_http_clients()
+    stats.reset()
+    started = time.perf_counter()
+    result = await coroutine
+    elapsed = time.perf_counter() - started
+    print(f"{label:<11} {elapsed:6.2f}s  requests: {stats.requests:>2}  connections: {len(stats.connections):>2}  "
+          f"gold: {result[0] and result[0]['gold_bas_dt']}  exchange: {result[1] and result[1]['exchange_bas_dt']}")
+    return result, elapsed
+
+
+async def run(args):
+    from config import settings
+    from services import rates
+    from scripts.rate_stub_server import run_stub_server
+
+    now = datetime.now()
+    dates = rates.candidate_dates(now)
+    missing = [(now - timedelta(days=day)).strftime("%Y%m%d") for day in range(1, args.gap + 1)]
+
+    with run_stub_server(args.port, latency=args.latency, missing=missing) as (base_url, stats):
+        settings.RATE_GOLD_ENDPOINT = f"{base_url}/gold"
+        settings.RATE_EXCHANGE_ENDPOINT = f"{base_url}/exchange"
+        sequential, sequential_elapsed = await timed("sequential", stats, fetch_sequential(dates))
+        concurrent, concurrent_elapsed = await timed("concurrent", stats, fetch_concurrent(dates))
+        print(f"speedup: {sequential_elapsed / concurrent_elapsed:.1f}x")
+
+    await rates.close_http_clients()
+    same = sequential == concurrent
+    print("OK" if same else "FAILED: sequential and concurrent results differ")
+    return same
+
+
+def main():
+    args = parse_args()
+    # 설정 로드에 필요한 값 (DB는 사용하지 않음)
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'rates.db')}"
+    os.environ.setdefault("SECRET_KEY", "rate-fetch-benchmark")
+    raise SystemExit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
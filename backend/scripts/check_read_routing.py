@@ -0,0 +1,74 @@
+"""
+읽기 복제본 라우팅(read-your-writes 포함) 로컬 확인 스크립트
+
+두 개의 SQLite 파일을 primary / replica로 사용한다. 복제가 되지 않으므로
+replica에는 primary에 쓴 데이터가 보이지 않으며, 이를 이용해 어느 DB에서 조회했는지 확인한다.
+프론트엔드(api.js)와 같이 다른 도메인(Origin)에서 호출하고, 쓰기 응답의 X-DB-Primary-Until 헤더를
+다음 요청 헤더로 다시 보낸다. (쿠키 사용 안 함)
+
+사용법 (backend 디렉터리에서 실행):
+    python -m scripts.check_read_routing
+"""
+import os
+import tempfile
+import time
+
+workdir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'primary.db')}"
+os.environ["READ_DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'replica.db')}"
+os.environ["READ_YOUR_WRITES_SECONDS"] = "2"
+os.environ["RATE_REFRESH_ENABLED"] = "false"
+os.environ.setdefault("SECRET_KEY", "local-read-routing-check")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+
+from database import Base  # noqa: E402
+from main import app  # noqa: E402
+from services.db_routing import PRIMARY_STICKY_HEADER  # noqa: E402
+
+FRONTEND_ORIGIN = "https://kristinahan.vercel.app"
+
+
+def author_names(client):
+    response = client.get("/authors")
+    response.raise_for_status()
+    return [author["name"] for author in response.json()]
+
+
+def check(title, condition):
+    print(f"[{'OK' if condition else 'FAIL'}] {title}")
+    return condition
+
+
+def main():
+    for url in (os.environ["DATABASE_URL"], os.environ["READ_DATABASE_URL"]):
+        Base.metadata.create_all(create_engine(url))
+
+    results = []
+    headers = {"Origin": FRONTEND_ORIGIN}
+    with TestClient(app, headers=headers) as writer, TestClient(app, headers=headers) as other:
+        results.append(check("쓰기 전 조회는 replica", author_names(writer) == []))
+
+        response = writer.post("/authors", json={"name": "read-your-writes"})
+        response.raise_for_status()
+        exposed = response.headers.get("access-control-expose-headers", "")
+        results.append(check("쓰기 응답의 고정 헤더를 브라우저에서 읽을 수 있음 (CORS expose)",
+                             PRIMARY_STICKY_HEADER.lower() in exposed.lower()))
+        results.append(check("쿠키는 설정하지 않음", "set-cookie" not in response.headers))
+        writer.cookies.clear()
+        # 프론트엔드처럼 응답 헤더 값을 다음 요청 헤더로 전달
+        writer.headers[PRIMARY_STICKY_HEADER] = response.headers[PRIMARY_STICKY_HEADER]
+        results.append(check("쓰기 직후 같은 클라이언트의 조회는 primary",
+                             author_names(writer) == ["read-your-writes"]))
+        results.append(check("다른 클라이언트의 조회는 replica", author_names(other) == []))
+
+        time.sleep(int(os.environ["READ_YOUR_WRITES_SECONDS"]) + 1)
+        results.append(check("고정 시간이 지나면 다시 replica", author_names(writer) == []))
+
+    print(f"DB 파일: {workdir}")
+    raise SystemExit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+주문서 조회 주요 필터의 실행 계획 출력 스크립트
+
+사용법 (backend 디렉터리에서 실행):
+    # 임시 SQLite DB를 만들어 시드 데이터를 넣고 실행 계획 출력
+    python -m scripts.explain_order_filters --orders 20000
+
+    # 기존 데이터베이스의 실행 계획 출력 (마이그레이션이 적용된 DB)
+    python -m scripts.explain_order_filters --database-url postgresql://...
+"""
+import argparse
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+parser = argparse.ArgumentParser(description="주문서 조회 필터 실행 계획 출력")
+parser.add_argument("--database-url", help="대상 DB URL (생략 시 임시 SQLite DB 생성)")
+parser.add_argument("--orders", type=int, default=20000, help="시드할 주문서 수")
+parser.add_argument("--events", type=int, default=20, help="시드할 이벤트 수")
+parser.add_argument("--seed", action="store_true", help="--database-url 지정 시에도 시드 데이터 삽입")
+args = parser.parse_args()
+
+database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'explain.db')}"
+os.environ.setdefault("DATABASE_URL", database_url)
+
+from sqlalchemy import create_engine, insert, select, func, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from database import Base  # noqa: E402
+from models import Order, Event, Form  # noqa: E402
+from models.order import OrderStatus  # noqa: E402
+from services.order_paging import apply_order_filters, apply_order_sort  # noqa: E402
+
+
+def seed(session: Session, order_count: int, event_count: int):
+    form_id = session.execute(insert(Form).values(name="explain", created_at=datetime.now()).returning(Form.id)).scalar_one()
+    session.execute(insert(Event), [
+        {"name": f"행사 {index}", "form_id": form_id, "inProgress": True} for index in range(event_count)
+    ])
+    event_ids = list(session.scalars(select(Event.id)))
+    statuses = list(OrderStatus)
+    start = datetime(2024, 1, 1)
+    batch = []
+    for index in range(order_count):
+        created_at = start + timedelta(minutes=index * 7)
+        batch.append({
+            "event_id": random.choice(event_ids),
+            "orderNumber": None,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "status": random.choice(statuses),
+            "groomName": f"신랑{index}",
+            "brideName": f"신부{index}",
+            "isTemporary": random.random() < 0.1,
+        })
+        if len(batch) == 1000:
+            session.execute(insert(Order), batch)
+            batch = []
+    if batch:
+        session.execute(insert(Order), batch)
+    session.commit()
+
+
+def explain(session: Session, title: str, statement):
+    bind = session.get_bind()
+    compiled = statement.compile(dialect=bind.dialect)
+    params = compiled.construct_params()
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    prefix = "EXPLAIN QUERY PLAN " if bind.dialect.name == "sqlite" else "EXPLAIN "
+
+    print(f"\n=== {title} ===")
+    print(str(compiled))
+    print("--- plan ---")
+    with bind.connect() as connection:
+        for row in connection.exec_driver_sql(prefix + str(compiled), params):
+            print("  " + " | ".join(str(value) for value in row))
+
+
+def main():
+    engine = create_engine(database_url)
+    if not args.database_url:
+        Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        if not args.database_url or args.seed:
+            seed(session, args.orders, args.events)
+            with engine.begin() as connection:
+                connection.execute(text("ANALYZE"))
+
+        event_name = session.scalar(select(Event.name).order_by(Event.id))
+        date_from = datetime(2024, 2, 1)
+        date_to = datetime(2024, 3, 1)
+        dialect_name = engine.dialect.name
+
+        def ids(**filters):
+            return apply_order_filters(select(Order.id, Order.created_at), dialect_name=dialect_name, **filters)
+
+        explain(session, "기본 목록 (정렬: 날짜 오름차순)",
+                apply_order_sort(ids(), "order_date_asc").limit(11))
+        explain(session, "일반/임시 주문서 목록 (is_temp=false, 날짜 내림차순)",
+                apply_order_sort(ids(is_temp=False), "order_date_desc").limit(11))
+        explain(session, "행사별 목록 (event_name)",
+                apply_order_sort(ids(event_name=event_name, is_temp=False), "order_date_asc").limit(11))
+        explain(session, "행사 + 상태 + 기간",
+                apply_order_sort(ids(event_name=event_name, status=OrderStatus.Order_Completed.name,
+                                     order_date_from=date_from, order_date_to=date_to), "order_date_asc").limit(11))
+        explain(session, "기간 필터 개수 (total)",
+                select(func.count()).select_from(ids(order_date_from=date_from, order_date_to=date_to, is_temp=False).subquery()))
+        explain(session, "Excel 다운로드 (행사 + 상태, 전체)",
+                apply_order_sort(ids(event_name=event_name, status=OrderStatus.Order_Completed.name), "order_date_asc"))
+
+
+if __name__ == "__main__":
+    main()
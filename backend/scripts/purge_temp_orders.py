@@ -0,0 +1,62 @@
+"""
+오래된 임시 주문서 삭제 스크립트 (서버의 주기적 삭제와 같은 작업을 즉시 1회 실행)
+
+마지막 수정 후 --older-than-days 일이 지난 임시 주문서를 하위 데이터와 함께
+--batch-size 건씩 나누어 삭제하고, 테이블별 삭제 행 수를 출력한다.
+
+사용법 (backend 디렉터리에서 실행, .env 의 DATABASE_URL 사용):
+    # 삭제 대상 수만 확인
+    python -m scripts.purge_temp_orders --dry-run
+
+    # 60일 이상 지난 임시 주문서를 100건씩 삭제
+    python -m scripts.purge_temp_orders --older-than-days 60 --batch-size 100
+
+    # 다른 DB 지정
+    python -m scripts.purge_temp_orders --database-url postgresql://...
+"""
+import argparse
+import asyncio
+import os
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="오래된 임시 주문서 삭제")
+    parser.add_argument("--database-url", help="대상 DB URL (생략 시 설정의 DATABASE_URL)")
+    parser.add_argument("--older-than-days", type=int, help="삭제 기준 경과 일수 (생략 시 TEMP_ORDER_MAX_AGE_DAYS)")
+    parser.add_argument("--batch-size", type=int, help="한 트랜잭션에서 삭제할 주문서 수 (생략 시 TEMP_ORDER_PURGE_BATCH_SIZE)")
+    parser.add_argument("--pause", type=float, help="배치 사이 대기 시간(초) (생략 시 TEMP_ORDER_PURGE_PAUSE_SECONDS)")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상 주문서 수만 출력")
+    return parser.parse_args()
+
+
+async def run(args):
+    from config import settings
+    from database import AsyncSessionLocal, async_engine
+    from services.temp_order_purge import count_purgeable_orders, purge_cutoff, purge_temporary_orders
+
+    max_age_days = settings.TEMP_ORDER_MAX_AGE_DAYS if args.older_than_days is None else args.older_than_days
+    try:
+        async with AsyncSessionLocal() as db:
+            if args.dry_run:
+                cutoff = purge_cutoff(max_age_days)
+                count = await count_purgeable_orders(db, cutoff)
+                print(f"cutoff: {cutoff:%Y-%m-%d %H:%M:%S}, temporary orders to purge: {count}")
+                return
+            result = await purge_temporary_orders(db, max_age_days, args.batch_size, args.pause)
+    finally:
+        await async_engine.dispose()
+
+    print(f"cutoff: {result['cutoff']:%Y-%m-%d %H:%M:%S}, batches: {result['batches']}, elapsed: {result['elapsed']:.2f}s")
+    for table, count in result["removed"].items():
+        print(f"  {table}: {count}")
+
+
+def main():
+    args = parse_args()
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
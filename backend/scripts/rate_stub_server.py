@@ -0,0 +1,142 @@
+"""
+금 시세(data.go.kr) / 환율(koreaexim) API 로컬 스텁 서버
+
+외부 API 없이 시세 조회 경로를 검사/벤치마크하기 위한 서버로, 두 API와 같은 형식으로 응답한다.
+- /gold     : getGoldPriceInfo 형식 (basDt 기준)
+- /exchange : exchangeJSON 형식 (searchdate 기준)
+--missing 으로 지정한 날짜(휴일 등)와 오늘(고시 전 상황)은 빈 응답을 돌려준다.
+
+사용법 (backend 디렉터리에서 실행):
+    # 스텁 서버 실행 (요청마다 0.3초 지연, 날짜별 첫 요청은 503)
+    python -m scripts.rate_stub_server --port 8900 --latency 0.3 --flaky 1
+
+    # 서버 설정에서 스텁을 사용하도록 지정
+    RATE_GOLD_ENDPOINT=http://127.0.0.1:8900/gold RATE_EXCHANGE_ENDPOINT=http://127.0.0.1:8900/exchange uvicorn main:app
+
+다른 스크립트에서는 run_stub_server() 로 백그라운드 스레드에서 실행한다.
+"""
+import argparse
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class StubStats:
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.connections = set()
+
+    def reset(self):
+        self.requests = 0
+        self.failures = 0
+        self.connections = set()
+
+
+def gold_price(date: str) -> float:
+    return 100000 + int(date[-4:])
+
+
+def usd_rate(date: str) -> float:
+    return 1300 + int(date[-2:]) + 0.5
+
+
+def create_stub_app(latency: float = 0.0, missing=(), flaky: int = 0, slow=(), slow_seconds: float = 30.0,
+                    skip_today: bool = True, stats: StubStats = None):
+    """
+    latency: 모든 요청의 응답 지연 (초)
+    missing: 데이터가 없는 날짜 (yyyymmdd)
+    flaky: 날짜/API별 처음 flaky 번의 요청은 503 응답 (재시도 검사)
+    slow: 응답이 slow_seconds 만큼 늦는 날짜 (타임아웃 검사)
+    skip_today: 오늘 날짜는 데이터 없음 (고시 전)
+    """
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse
+
+    app = FastAPI()
+    stats = stats if stats is not None else StubStats()
+    attempts = defaultdict(int)
+    unavailable = set(missing)
+    if skip_today:
+        unavailable.add(datetime.now().strftime("%Y%m%d"))
+
+    async def respond(request: Request, api: str, date: str):
+        stats.requests += 1
+        stats.connections.add((request.client.host, request.client.port))
+        await asyncio.sleep(slow_seconds if date in slow else latency)
+        attempts[(api, date)] += 1
+        if attempts[(api, date)] <= flaky:
+            stats.failures += 1
+            return JSONResponse({"error": "temporarily unavailable"}, status_code=503)
+        return None
+
+    @app.get("/gold")
+    async def gold(request: Request, basDt: str):
+        failure = await respond(request, "gold", basDt)
+        if failure:
+            return failure
+        items = [] if basDt in unavailable else [{"basDt": basDt, "itmsNm": "금 99.99_1Kg", "clpr": str(gold_price(basDt))}]
+        return {
+            "response": {
+                "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+                "body": {"numOfRows": 1, "pageNo": 1, "totalCount": len(items), "items": {"item": items}},
+            }
+        }
+
+    @app.get("/exchange")
+    async def exchange(request: Request, searchdate: str):
+        failure = await respond(request, "exchange", searchdate)
+        if failure:
+            return failure
+        if searchdate in unavailable:
+            return []
+        return [
+            {"result": 1, "cur_unit": "JPY(100)", "deal_bas_r": "912.34", "cur_nm": "일본 옌"},
+            {"result": 1, "cur_unit": "KRW", "deal_bas_r": "1", "cur_nm": "한국 원"},
+            {"result": 1, "cur_unit": "USD", "deal_bas_r": f"{usd_rate(searchdate):,.2f}", "cur_nm": "미국 달러"},
+        ]
+
+    app.state.stats = stats
+    return app
+
+
+@contextmanager
+def run_stub_server(port: int = 8900, **options):
+    """스텁 서버를 백그라운드 스레드에서 실행하고 (base_url, stats) 반환"""
+    import uvicorn
+
+    stats = StubStats()
+    app = create_stub_app(stats=stats, **options)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError(f"stub server failed to start on port {port}")
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}", stats
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="금 시세/환율 API 스텁 서버")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--missing", default="", help="데이터가 없는 날짜 (쉼표 구분 yyyymmdd)")
+    parser.add_argument("--flaky", type=int, default=0, help="날짜/API별 처음 N번 503 응답")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_stub_app(latency=args.latency, missing=[date for date in args.missing.split(",") if date], flaky=args.flaky)
+    uvicorn.run(app, host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+행사 대시보드 주문 집계(order_daily_rollup) 재계산 / 일관성 검사 스크립트
+
+사용법 (backend 디렉터리에서 실행, .env 의 DATABASE_URL 사용):
+    # 집계 테이블과 주문서 테이블의 재계산 결과 비교 (다르면 종료 코드 1)
+    python -m scripts.rebuild_order_rollup --check
+
+    # 전체 집계 재계산 (특정 행사만: --event-id 3)
+    python -m scripts.rebuild_order_rollup
+
+    # 다른 DB 지정
+    python -m scripts.rebuild_order_rollup --check --database-url postgresql://...
+"""
+import argparse
+import asyncio
+import os
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="주문 집계 재계산 / 일관성 검사")
+    parser.add_argument("--database-url", help="대상 DB URL (생략 시 설정의 DATABASE_URL)")
+    parser.add_argument("--event-id", type=int, help="대상 행사 ID (생략 시 전체)")
+    parser.add_argument("--check", action="store_true", help="재계산하지 않고 불일치 항목만 출력")
+    return parser.parse_args()
+
+
+async def run(args) -> bool:
+    from database import AsyncSessionLocal, async_engine
+    from services.order_rollup import check_daily_rollup, rebuild_daily_rollup
+
+    try:
+        async with AsyncSessionLocal() as db:
+            if not args.check:
+                rows = await rebuild_daily_rollup(db, args.event_id)
+                print(f"rebuilt: {rows} rollup rows")
+            mismatches = await check_daily_rollup(db, args.event_id)
+    finally:
+        await async_engine.dispose()
+
+    for mismatch in mismatches[:50]:
+        event_id, day, status = mismatch["key"]
+        print(f"  event {event_id} {day} {status or '-'}: expected {mismatch['expected']}, stored {mismatch['stored']}")
+    print(f"mismatches: {len(mismatches)}")
+    print("OK" if not mismatches else "FAILED")
+    return not mismatches
+
+
+def main():
+    args = parse_args()
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    raise SystemExit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
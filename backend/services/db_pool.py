@@ -0,0 +1,113 @@
+import threading
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class PoolWaitStats:
+    """커넥션 체크아웃 대기 시간 누적 통계 (풀 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.timeouts = 0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "checkouts": self.count,
+                "total_wait_ms": round(self.total_seconds * 1000, 3),
+                "avg_wait_ms": round(self.total_seconds * 1000 / self.count, 3) if self.count else 0.0,
+                "max_wait_ms": round(self.max_seconds * 1000, 3),
+                "timeouts": self.timeouts,
+            }
+
+
+class _TimedPoolMixin:
+    """풀에서 커넥션을 꺼낼 때까지 걸린 시간(대기 + 신규 연결)을 기록"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self):
+        new_pool = super().recreate()
+        new_pool.wait_stats = self.wait_stats
+        return new_pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def is_memory_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and (":memory:" in url or url.split("://", 1)[1] in ("", "/"))
+
+
+def pool_options(url: str, settings, is_async: bool = False) -> dict:
+    """
+    설정값으로 create_engine / create_async_engine 의 풀 옵션을 구성
+    인메모리 SQLite는 커넥션 하나를 공유해야 하므로 기본 풀을 그대로 사용
+    """
+    if is_memory_sqlite(url):
+        return {}
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def pool_status(engine) -> dict:
+    """엔진 커넥션 풀의 현재 상태 (체크아웃/유휴/오버플로 개수와 대기 시간)"""
+    pool = engine.pool
+    status = {
+        "pool_class": type(pool).__name__,
+        "pool_size": None,
+        "checked_out": None,
+        "idle": None,
+        "overflow": None,
+        "max_overflow": None,
+        "timeout": None,
+        "recycle": getattr(pool, "_recycle", None),
+        "pre_ping": getattr(pool, "_pre_ping", None),
+        "wait": pool.wait_stats.snapshot() if hasattr(pool, "wait_stats") else None,
+    }
+    if isinstance(pool, QueuePool):
+        status.update(
+            pool_size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            # overflow()는 pool_size 미만 사용 시 음수이므로 초과분만 보고
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    return status
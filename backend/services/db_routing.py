@@ -0,0 +1,26 @@
+import time
+from fastapi import Request, Response
+
+# 쓰기 이후 primary 고정 만료 시각(Unix 초)을 주고받는 헤더
+# 프론트엔드는 다른 도메인에서 호출하고 쿠키를 보내지 않으므로, 응답 헤더 값을 저장했다가 요청 헤더로 다시 보낸다.
+# (CORS expose_headers에 포함해야 브라우저에서 읽을 수 있음)
+PRIMARY_STICKY_HEADER = "X-DB-Primary-Until"
+
+# 데이터를 변경하지 않는 HTTP 메서드
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def prefers_primary(request: Request) -> bool:
+    """최근 쓰기 요청을 보낸 클라이언트인지 확인 (요청 헤더의 고정 만료 시각 이전이면 primary 사용)"""
+    value = request.headers.get(PRIMARY_STICKY_HEADER)
+    if not value:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+def mark_primary_sticky(response: Response, seconds: int):
+    """쓰기에 성공한 응답에 primary 고정 만료 시각 헤더를 설정"""
+    response.headers[PRIMARY_STICKY_HEADER] = str(int(time.time()) + seconds)
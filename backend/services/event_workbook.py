@@ -0,0 +1,212 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+
+from config import settings
+from database import SessionLocal
+from models import Order, Payments, Author, Affiliation, OrderItems, Product, Attributes, AlterationDetails, FormRepair
+from services.order_export import EXPORT_BATCH_SIZE
+from services.xlsx_stream import SheetXmlWriter, write_workbook
+
+# 시트별 열 너비 추정에 사용할 앞부분 행 수
+SAMPLE_SIZE = 500
+# 임시 워크시트 XML 파일 쓰기 버퍼 크기
+FILE_BUFFER_SIZE = 1024 * 1024
+
+ORDER_HEADERS = [
+    "주문 ID", "주문번호", "작성자", "수정자", "신랑", "신부", "연락처", "소속", "주소", "수령 방법", "주문 상태",
+    "주문서 생성날짜", "주문서 수정날짜", "총 주문 금액", "선금", "잔금", "비고", "수선 비고", "임시 저장",
+]
+ITEM_HEADERS = ["주문 ID", "주문번호", "주문자", "상품명", "속성", "수량", "가격"]
+PAYMENT_HEADERS = [
+    "주문 ID", "주문번호", "주문자", "결제자", "결제 날짜", "결제 방식",
+    "현금 금액", "현금 통화", "현금 환산 금액", "카드 금액", "카드 통화", "카드 환산 금액",
+    "보상판매 금액", "보상판매 종류", "보상판매 환산 금액", "비고",
+]
+ALTERATION_HEADERS = ["주문 ID", "주문번호", "주문자", "수선 항목", "단위", "기준", "수선 가능", "수치", "수선 수치"]
+
+
+def _orderer_name(row) -> Optional[str]:
+    names = [name for name in (row.groomName, row.brideName) if name]
+    return " / ".join(names) if names else None
+
+
+def _event_orders(event_id: int, is_temp: Optional[bool]):
+    conditions = [Order.event_id == event_id]
+    if is_temp is not None:
+        conditions.append(Order.isTemporary == is_temp)
+    return conditions
+
+
+def _orders_query(event_id: int, is_temp: Optional[bool]):
+    AuthorName = aliased(Author)
+    ModifierName = aliased(Author)
+    return (
+        select(
+            Order.id, Order.orderNumber,
+            AuthorName.name.label("author_name"), ModifierName.name.label("modifier_name"),
+            Order.groomName, Order.brideName, Order.contact, Affiliation.name.label("affiliation_name"),
+            Order.address, Order.collectionMethod, Order.status, Order.created_at, Order.updated_at,
+            Order.totalPrice, Order.advancePayment, Order.balancePayment, Order.notes, Order.alter_notes,
+            Order.isTemporary,
+        )
+        .select_from(Order)
+        .outerjoin(AuthorName, AuthorName.id == Order.author_id)
+        .outerjoin(ModifierName, ModifierName.id == Order.modifier_id)
+        .outerjoin(Affiliation, Affiliation.id == Order.affiliation_id)
+        .where(*_event_orders(event_id, is_temp))
+        .order_by(Order.id)
+    )
+
+
+def _order_row(row) -> list:
+    return [
+        row.id, row.orderNumber, row.author_name, row.modifier_name, row.groomName, row.brideName, row.contact,
+        row.affiliation_name, row.address, row.collectionMethod, row.status, row.created_at, row.updated_at,
+        row.totalPrice, row.advancePayment, row.balancePayment, row.notes, row.alter_notes,
+        "Y" if row.isTemporary else "N",
+    ]
+
+
+def _items_query(event_id: int, is_temp: Optional[bool]):
+    return (
+        select(
+            Order.id, Order.orderNumber, Order.groomName, Order.brideName,
+            Product.name.label("product_name"), Attributes.value.label("attribute_value"),
+            OrderItems.quantity, OrderItems.price,
+        )
+        .select_from(OrderItems)
+        .join(Order, Order.id == OrderItems.order_id)
+        .outerjoin(Product, Product.id == OrderItems.product_id)
+        .outerjoin(Attributes, Attributes.id == OrderItems.attribute_id)
+        .where(*_event_orders(event_id, is_temp))
+        .order_by(Order.id, OrderItems.id)
+    )
+
+
+def _item_row(row) -> list:
+    return [
+        row.id, row.orderNumber, _orderer_name(row),
+        row.product_name, row.attribute_value, row.quantity, row.price,
+    ]
+
+
+def _payments_query(event_id: int, is_temp: Optional[bool]):
+    return (
+        select(Order.id, Order.orderNumber, Order.groomName, Order.brideName, Payments)
+        .select_from(Payments)
+        .join(Order, Order.id == Payments.order_id)
+        .where(*_event_orders(event_id, is_temp))
+        .order_by(Order.id, Payments.id)
+    )
+
+
+def _payment_row(row) -> list:
+    payment = row.Payments
+    return [
+        row.id, row.orderNumber, _orderer_name(row), payment.payer, payment.payment_date, payment.paymentMethod,
+        payment.cashAmount, payment.cashCurrency, payment.cashConversion,
+        payment.cardAmount, payment.cardCurrency, payment.cardConversion,
+        payment.tradeInAmount, payment.tradeInCurrency, payment.tradeInConversion,
+        payment.notes,
+    ]
+
+
+def _alterations_query(event_id: int, is_temp: Optional[bool]):
+    return (
+        select(
+            Order.id, Order.orderNumber, Order.groomName, Order.brideName,
+            FormRepair.information, FormRepair.unit, FormRepair.standards, FormRepair.isAlterable,
+            AlterationDetails.figure, AlterationDetails.alterationFigure,
+        )
+        .select_from(AlterationDetails)
+        .join(Order, Order.id == AlterationDetails.order_id)
+        .outerjoin(FormRepair, FormRepair.id == AlterationDetails.form_repair_id)
+        .where(*_event_orders(event_id, is_temp))
+        .order_by(Order.id, FormRepair.indexNumber, AlterationDetails.id)
+    )
+
+
+def _alteration_row(row) -> list:
+    return [
+        row.id, row.orderNumber, _orderer_name(row), row.information, row.unit, row.standards,
+        None if row.isAlterable is None else ("Y" if row.isAlterable else "N"),
+        row.figure, row.alterationFigure,
+    ]
+
+
+# 시트 키 -> (시트 이름, 헤더, 조회 쿼리, 행 변환) (시트 순서대로)
+EVENT_SHEETS = {
+    "orders": ("주문서", ORDER_HEADERS, _orders_query, _order_row),
+    "items": ("주문 상품", ITEM_HEADERS, _items_query, _item_row),
+    "payments": ("결제", PAYMENT_HEADERS, _payments_query, _payment_row),
+    "alterations": ("수선", ALTERATION_HEADERS, _alterations_query, _alteration_row),
+}
+
+
+def _iter_rows(db: Session, query, convert):
+    result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    for partition in result.partitions():
+        for row in partition:
+            yield convert(row)
+
+
+def render_event_sheet(sheet_key: str, event_id: int, is_temp: Optional[bool], directory: str):
+    """
+    시트 하나를 자체 쿼리로 읽어 워크시트 XML 파일로 기록하고 (SheetInfo, 파일 경로)를 반환
+    프로세스 풀의 작업 함수이므로 자식 프로세스에서 세션을 새로 연다.
+    """
+    sheet_name, headers, build_query, convert = EVENT_SHEETS[sheet_key]
+    path = os.path.join(directory, f"{sheet_key}.xml")
+    with SessionLocal() as db, open(path, "wb", buffering=FILE_BUFFER_SIZE) as file:
+        rows = _iter_rows(db, build_query(event_id, is_temp), convert)
+        sample = []
+        for row in rows:
+            sample.append(row)
+            if len(sample) >= SAMPLE_SIZE:
+                break
+        writer = SheetXmlWriter(file, headers, sample)
+        for row in rows:
+            writer.write_row(row)
+        writer.finish()
+    return writer.sheet_info(sheet_name), path
+
+
+def build_event_workbook(target: str, event_id: int, is_temp: Optional[bool], directory: str, executor=None):
+    """
+    이벤트 통합 워크북 생성 (동기)
+    executor가 있으면 시트를 병렬로 만든 뒤 합치고, 없으면 현재 프로세스에서 순서대로 생성
+    """
+    if executor is None:
+        sheets = [render_event_sheet(key, event_id, is_temp, directory) for key in EVENT_SHEETS]
+    else:
+        futures = [executor.submit(render_event_sheet, key, event_id, is_temp, directory) for key in EVENT_SHEETS]
+        sheets = [future.result() for future in futures]
+    write_workbook(target, sheets)
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    시트 생성용 프로세스 풀 (처음 사용할 때 생성)
+    이벤트 루프 스레드와 DB 커넥션을 물려받지 않도록 spawn 방식으로 자식 프로세스를 만든다.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.EVENT_WORKBOOK_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional
+
+from config import settings
+from database import SessionLocal
+from services.order_export import (
+    export_columns, iter_order_export_rows_sync, count_order_export_rows,
+    order_export_title, order_export_filename,
+)
+from services.export_writers import get_export_format, iter_export
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# 작업 결과 파일명 ({작업 ID}.{확장자}, 작성 중에는 .part)
+ARTIFACT_NAME_RE = re.compile(r"^[0-9a-f]{32}\.\w+(\.part)?$")
+
+# 워커 프로세스별 결과 디렉터리명 (PID)
+PROCESS_DIR_RE = re.compile(r"^\d+$")
+
+
+class ExportJob:
+    def __init__(self, job_id: str, key: str, filters: dict, file_name: str, path: str, media_type: str):
+        self.id = job_id
+        self.key = key
+        self.filters = filters
+        self.file_name = file_name
+        self.path = path
+        self.media_type = media_type
+        self.status = QUEUED
+        self.rows_written = 0
+        self.total_rows: Optional[int] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.expires_at: Optional[datetime] = None
+
+    @property
+    def progress(self) -> float:
+        if self.status == COMPLETED:
+            return 1.0
+        if not self.total_rows:
+            return 0.0
+        return min(self.rows_written / self.total_rows, 1.0)
+
+
+def export_job_key(filters: dict) -> str:
+    """필터 조합이 같으면 같은 키 (중복 작업 판별용)"""
+    normalized = {
+        name: value.isoformat() if isinstance(value, datetime) else value
+        for name, value in filters.items()
+    }
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+
+
+class ExportJobManager:
+    """
+    주문서 내보내기 작업 관리
+    - 작업은 스레드 풀에서 동기 엔진으로 실행 (이벤트 루프를 막지 않음)
+    - 같은 필터의 대기/진행 중인 작업이 있으면 새로 만들지 않고 재사용 (완료된 작업은 이후 변경된 주문서가 빠지므로 새로 생성)
+    - 완료 후 ttl_seconds가 지난 결과 파일은 삭제
+    작업 목록은 프로세스 메모리에 있으므로 같은 워커 프로세스에서 조회해야 하고,
+    결과 파일도 워커별 하위 디렉터리({export_dir}/{PID})에 저장한다.
+    """
+
+    def __init__(self, export_dir: str, workers: int, ttl_seconds: int):
+        self.export_dir = export_dir
+        self.process_dir = os.path.join(export_dir, str(os.getpid()))
+        self.workers = workers
+        self.ttl_seconds = ttl_seconds
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self):
+        self.process_dir = os.path.join(self.export_dir, str(os.getpid()))
+        os.makedirs(self.process_dir, exist_ok=True)
+        self.remove_stale_artifacts()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="export")
+
+    def remove_stale_artifacts(self):
+        """
+        종료된 프로세스가 남긴 결과 파일 정리 (조회할 방법이 없음)
+        - 이 프로세스 디렉터리: 같은 PID를 쓰던 이전 프로세스의 파일이므로 모두 삭제
+        - 다른 워커 디렉터리: 실행 중인 워커가 제공 중일 수 있으므로 ttl_seconds 동안 수정되지 않은 파일만 삭제
+        """
+        cutoff = time.time() - self.ttl_seconds
+        directories = [self.export_dir] + [
+            entry.path for entry in os.scandir(self.export_dir)
+            if entry.is_dir() and PROCESS_DIR_RE.match(entry.name)
+        ]
+        for directory in directories:
+            own = directory == self.process_dir
+            for entry in os.scandir(directory):
+                if not entry.is_file() or not ARTIFACT_NAME_RE.match(entry.name):
+                    continue
+                try:
+                    if own or entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+            if not own and directory != self.export_dir and os.stat(directory).st_mtime < cutoff:
+                try:
+                    os.rmdir(directory)  # 비어 있을 때만 삭제됨
+                except OSError:
+                    pass
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def submit(self, filters: dict) -> ExportJob:
+        key = export_job_key(filters)
+        with self._lock:
+            for job in self._jobs.values():
+                if job.key == key and job.status in (QUEUED, RUNNING):
+                    return job
+
+            job_id = uuid.uuid4().hex
+            dataset = filters.get("dataset", "payments")
+            file_format = get_export_format(filters.get("format", "xlsx"))
+            job = ExportJob(
+                job_id,
+                key,
+                filters,
+                file_name=order_export_filename(filters.get("event_name"), file_format.extension, dataset),
+                path=os.path.join(self.process_dir, f"{job_id}.{file_format.extension}"),
+                media_type=file_format.media_type,
+            )
+            self._jobs[job_id] = job
+
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def purge_expired(self):
+        """만료된 작업과 결과 파일 삭제"""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            expired = [job for job in self._jobs.values() if job.expires_at and job.expires_at <= now]
+            for job in expired:
+                del self._jobs[job.id]
+        for job in expired:
+            if os.path.exists(job.path):
+                os.remove(job.path)
+
+    async def purge_periodically(self, interval: int = 60):
+        while True:
+            await asyncio.sleep(interval)
+            self.purge_expired()
+
+    def _run(self, job: ExportJob):
+        job.status = RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        part_path = f"{job.path}.part"
+        started = time.perf_counter()
+        try:
+            filters = dict(job.filters)
+            sort = filters.pop("sort", "order_date_asc")
+            export_format = filters.pop("format", "xlsx")
+            dataset = filters.pop("dataset", "payments")
+            with SessionLocal() as db:
+                job.total_rows = count_order_export_rows(db, dataset=dataset, **filters)
+
+                def counted(rows):
+                    for row in rows:
+                        job.rows_written += 1
+                        yield row
+
+                rows = counted(iter_order_export_rows_sync(db, sort=sort, dataset=dataset, **filters))
+                columns = export_columns(dataset)
+                title = order_export_title(filters.get("event_name"))
+                os.makedirs(self.process_dir, exist_ok=True)
+                with open(part_path, "wb") as file:
+                    for chunk in iter_export(rows, export_format, columns, title=title):
+                        file.write(chunk)
+            os.replace(part_path, job.path)
+            job.status = COMPLETED
+            logger.info("export %s completed: %d rows in %.2fs", job.id, job.rows_written, time.perf_counter() - started)
+        except Exception as e:
+            logger.exception("export %s failed", job.id)
+            job.status = FAILED
+            job.error = str(e)
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+            job.expires_at = datetime.fromtimestamp(time.time() + self.ttl_seconds, timezone.utc)
+
+
+export_jobs = ExportJobManager(
+    export_dir=settings.EXPORT_DIR or os.path.join(tempfile.gettempdir(), "kristinahan-exports"),
+    workers=settings.EXPORT_WORKERS,
+    ttl_seconds=settings.EXPORT_TTL_SECONDS,
+)
@@ -0,0 +1,236 @@
+import codecs
+import csv
+import importlib.util
+import io
+import itertools
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import NamedTuple, Optional
+
+from services.order_export import STRING, DATETIME, NUMBER, INTEGER
+from services.xlsx_stream import XlsxStreamWriter, ChunkBuffer, WIDTH_SAMPLE_SIZE, CHUNK_SIZE
+
+# Parquet row group 당 행 수
+PARQUET_ROW_GROUP_SIZE = 10000
+
+
+def _plain(value):
+    """Enum/Decimal을 기본 타입으로 변환"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+class CsvStreamWriter:
+    """
+    CSV 작성기 (엑셀에서 한글이 깨지지 않도록 UTF-8 BOM으로 시작)
+    - 1행은 엑셀과 같은 한글 헤더, 날짜는 엑셀 표시 형식(yyyy-mm-dd hh:mm:ss)
+    """
+
+    def __init__(self, columns):
+        self._text = io.StringIO()
+        self._csv = csv.writer(self._text)
+        self._buffer = ChunkBuffer()
+        self._buffer.write(codecs.BOM_UTF8)
+        self.write_row([header for header, _ in columns])
+
+    @staticmethod
+    def _format(value):
+        value = _plain(value)
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
+
+    def write_row(self, values):
+        self._csv.writerow([self._format(value) for value in values])
+        self._buffer.write(self._text.getvalue().encode("utf-8"))
+        self._text.seek(0)
+        self._text.truncate()
+
+    def pending(self) -> int:
+        return self._buffer.pending()
+
+    def drain(self) -> bytes:
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        return self._buffer.drain()
+
+
+class NdjsonStreamWriter:
+    """NDJSON 작성기 (한 행당 한글 헤더를 키로 하는 JSON 객체 1줄, 날짜는 ISO 8601)"""
+
+    def __init__(self, columns):
+        self.headers = [header for header, _ in columns]
+        self._buffer = ChunkBuffer()
+
+    @staticmethod
+    def _default(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        raise TypeError(f"{type(value).__name__} 값은 JSON으로 변환할 수 없습니다.")
+
+    def write_row(self, values):
+        record = {header: _plain(value) for header, value in zip(self.headers, values)}
+        line = json.dumps(record, ensure_ascii=False, default=self._default)
+        self._buffer.write(f"{line}\n".encode("utf-8"))
+
+    def pending(self) -> int:
+        return self._buffer.pending()
+
+    def drain(self) -> bytes:
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        return self._buffer.drain()
+
+
+class _ArrowSink(ChunkBuffer):
+    """pyarrow PythonFile이 요구하는 파일 속성을 갖춘 청크 버퍼 (close 후에도 남은 바이트는 drain 가능)"""
+
+    closed = False
+
+    def writable(self):
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+class ParquetStreamWriter:
+    """
+    Parquet 작성기 (pyarrow 필요)
+    - 칼럼 값 종류로 스키마를 고정하므로 빈 결과나 None만 있는 칼럼도 타입이 유지됨
+    - row_group_size 행씩 모아 row group 단위로 기록 (메모리 사용량은 row group 크기에 비례)
+    """
+
+    def __init__(self, columns, row_group_size: int = PARQUET_ROW_GROUP_SIZE):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {
+            STRING: pa.string(),
+            DATETIME: pa.timestamp("us"),
+            NUMBER: pa.float64(),
+            INTEGER: pa.int64(),
+        }
+        self._pa = pa
+        self.schema = pa.schema([(header, types[kind]) for header, kind in columns])
+        self.row_group_size = row_group_size
+        self._columns = [[] for _ in columns]
+        self._rows = 0
+        self._buffer = _ArrowSink()
+        self._writer = pq.ParquetWriter(pa.PythonFile(self._buffer, mode="w"), self.schema)
+
+    @staticmethod
+    def _convert(value):
+        value = _plain(value)
+        if isinstance(value, datetime) and value.tzinfo:
+            return value.replace(tzinfo=None)
+        return value
+
+    def write_row(self, values):
+        for column, value in zip(self._columns, values):
+            column.append(self._convert(value))
+        self._rows += 1
+        if self._rows >= self.row_group_size:
+            self._flush_row_group()
+
+    def _flush_row_group(self):
+        if not self._rows:
+            return
+        self._writer.write_table(self._pa.Table.from_arrays(self._columns, schema=self.schema))
+        self._columns = [[] for _ in self._columns]
+        self._rows = 0
+
+    def pending(self) -> int:
+        return self._buffer.pending()
+
+    def drain(self) -> bytes:
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        self._flush_row_group()
+        self._writer.close()
+        return self._buffer.drain()
+
+
+class ExportFormat(NamedTuple):
+    extension: str
+    media_type: str
+    # 선택 의존성 (설치되지 않으면 해당 형식 사용 불가)
+    requires: Optional[str] = None
+
+
+EXPORT_FORMATS = {
+    "xlsx": ExportFormat("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "csv": ExportFormat("csv", "text/csv; charset=utf-8"),
+    "ndjson": ExportFormat("ndjson", "application/x-ndjson"),
+    "parquet": ExportFormat("parquet", "application/vnd.apache.parquet", requires="pyarrow"),
+}
+
+
+def get_export_format(name: str) -> ExportFormat:
+    """내보내기 형식 조회 (지원하지 않거나 필요한 패키지가 없으면 ValueError)"""
+    if name not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {name} (지원 형식: {', '.join(EXPORT_FORMATS)})")
+    export_format = EXPORT_FORMATS[name]
+    if export_format.requires and importlib.util.find_spec(export_format.requires) is None:
+        raise ValueError(f"{name} 형식은 {export_format.requires} 설치가 필요합니다.")
+    return export_format
+
+
+def create_export_writer(name: str, columns, sample_rows=(), title=None):
+    """형식별 작성기 생성 후 샘플 행까지 기록 (XLSX는 샘플 행으로 열 너비 추정)"""
+    if name == "xlsx":
+        return XlsxStreamWriter([header for header, _ in columns], sample_rows, title=title)
+
+    if name == "csv":
+        writer = CsvStreamWriter(columns)
+    elif name == "ndjson":
+        writer = NdjsonStreamWriter(columns)
+    elif name == "parquet":
+        writer = ParquetStreamWriter(columns)
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {name}")
+    for row in sample_rows:
+        writer.write_row(row)
+    return writer
+
+
+async def stream_export(rows, name: str, columns, title=None, sample_size=WIDTH_SAMPLE_SIZE):
+    """행(async iterable)을 받아 지정한 형식의 파일을 청크(bytes) 단위로 생성하는 비동기 제너레이터"""
+    rows = rows.__aiter__()
+    sample = []
+    async for row in rows:
+        sample.append(row)
+        if len(sample) >= sample_size:
+            break
+
+    writer = create_export_writer(name, columns, sample, title=title)
+    sample = None
+    async for row in rows:
+        writer.write_row(row)
+        if writer.pending() >= CHUNK_SIZE:
+            yield writer.drain()
+    yield writer.close()
+
+
+def iter_export(rows, name: str, columns, title=None, sample_size=WIDTH_SAMPLE_SIZE):
+    """stream_export의 동기 버전 (백그라운드 작업에서 파일로 기록할 때 사용)"""
+    rows = iter(rows)
+    sample = list(itertools.islice(rows, sample_size))
+
+    writer = create_export_writer(name, columns, sample, title=title)
+    sample = None
+    for row in rows:
+        writer.write_row(row)
+        if writer.pending() >= CHUNK_SIZE:
+            yield writer.drain()
+    yield writer.close()
@@ -0,0 +1,304 @@
+import asyncio
+import csv
+import io
+import itertools
+import json
+from datetime import datetime
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import utc_now
+from models import Order, Event, Author, Affiliation, Product, Attributes, FormRepair
+from models.order import OrderStatus
+from models.payments import CurrencyType, TradeInCurrencyType, PaymentMethodType
+from schemas.order_schema import OrderCreate
+from services.order_children import ChildChanges, diff_order_children, apply_child_changes
+from services.order_numbers import allocate_order_numbers
+from services.order_search import refresh_order_search
+from services.order_status import add_initial_status_history
+from services.order_rollup import add_to_daily_rollup
+
+# 한 트랜잭션에서 처리할 주문서 수
+BULK_CHUNK_SIZE = 200
+
+# 파일 헤더 -> OrderCreate 필드 (필드 이름을 그대로 헤더로 써도 됨)
+FILE_COLUMNS = {
+    "행사 ID": "event_id",
+    "작성자 ID": "author_id",
+    "수정자 ID": "modifier_id",
+    "소속 ID": "affiliation_id",
+    "주문 상태": "status",
+    "신랑": "groomName",
+    "신부": "brideName",
+    "연락처": "contact",
+    "주소": "address",
+    "수령 방법": "collectionMethod",
+    "비고": "notes",
+    "수선 비고": "alter_notes",
+    "총 주문 금액": "totalPrice",
+    "선금": "advancePayment",
+    "잔금": "balancePayment",
+    # 하위 데이터는 JSON 배열 (OrderCreate의 orderItems/payments/alteration_details 형식)
+    "주문 상품": "orderItems",
+    "결제": "payments",
+    "수선": "alteration_details",
+}
+JSON_FIELDS = ("orderItems", "payments", "alteration_details")
+
+
+class BulkImportError(ValueError):
+    pass
+
+
+def _header_field(header) -> str:
+    header = str(header or "").strip()
+    return FILE_COLUMNS.get(header, header)
+
+
+def parse_order(data) -> tuple:
+    """요청/파일 1행을 OrderCreate로 변환 (오류가 있으면 (None, 오류 목록))"""
+    try:
+        return OrderCreate.model_validate(data), []
+    except ValidationError as e:
+        return None, [
+            f"{'.'.join(str(part) for part in error['loc']) or '-'}: {error['msg']}" for error in e.errors()
+        ]
+
+
+def _file_row_data(headers, values) -> tuple:
+    data = {}
+    errors = []
+    for field, value in zip(headers, values):
+        if not field or value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        if field in JSON_FIELDS and isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError as e:
+                errors.append(f"{field}: JSON 형식이 아닙니다 ({e.msg})")
+                continue
+        data[field] = value
+    return data, errors
+
+
+def iter_json_rows(body):
+    """JSON 배열 요청 본문 -> (행 번호, OrderCreate 또는 None, 오류 목록)"""
+    if not isinstance(body, list):
+        raise BulkImportError("요청 본문은 주문서 목록(JSON 배열)이어야 합니다.")
+    for index, data in enumerate(body, start=1):
+        order, errors = parse_order(data)
+        yield index, order, errors
+
+
+def _iter_csv(file):
+    reader = csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    yield from reader
+
+
+def _iter_xlsx(file):
+    from openpyxl import load_workbook
+
+    # read_only 모드는 시트를 행 단위로 읽으므로 파일 크기와 무관하게 메모리 사용량이 일정
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_file_rows(filename: str, file):
+    """
+    CSV/XLSX 업로드 파일을 한 행씩 읽어 (행 번호, OrderCreate 또는 None, 오류 목록) 반환
+    첫 행은 헤더 (FILE_COLUMNS의 한글 헤더 또는 OrderCreate 필드 이름), 빈 행은 건너뜀
+    """
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        rows = _iter_csv(file)
+    elif extension == "xlsx":
+        rows = _iter_xlsx(file)
+    else:
+        raise BulkImportError("CSV 또는 XLSX 파일만 업로드할 수 있습니다.")
+
+    headers = None
+    for index, values in enumerate(rows):
+        if headers is None:
+            headers = [_header_field(header) for header in values]
+            continue
+        if not any(value not in (None, "") for value in values):
+            continue
+        data, errors = _file_row_data(headers, values)
+        order, validation_errors = parse_order(data)
+        errors += validation_errors
+        # 데이터 행 번호 (헤더 다음 행이 1)
+        yield index, (order if not errors else None), errors
+
+
+def _enum_name(enum_class, value):
+    """Enum 이름 또는 값을 DB에 저장하는 Enum 이름으로 변환 (잘못된 값이면 ValueError)"""
+    if value is None or value in enum_class.__members__:
+        return value
+    for member in enum_class:
+        if member.value == value:
+            return member.name
+    raise ValueError(f"{value} (사용 가능: {', '.join(enum_class.__members__)})")
+
+
+def normalize_enums(order: OrderCreate) -> list:
+    """상태/결제 방식/통화를 Enum 이름으로 맞추고 잘못된 값의 오류 목록 반환"""
+    errors = []
+
+    def convert(label, enum_class, target, field):
+        try:
+            setattr(target, field, _enum_name(enum_class, getattr(target, field)))
+        except ValueError as e:
+            errors.append(f"{label}: 잘못된 값입니다 - {e}")
+
+    convert("status", OrderStatus, order, "status")
+    for index, payment in enumerate(order.payments or []):
+        convert(f"payments.{index}.paymentMethod", PaymentMethodType, payment, "paymentMethod")
+        convert(f"payments.{index}.cashCurrency", CurrencyType, payment, "cashCurrency")
+        convert(f"payments.{index}.cardCurrency", CurrencyType, payment, "cardCurrency")
+        convert(f"payments.{index}.tradeInCurrency", TradeInCurrencyType, payment, "tradeInCurrency")
+    return errors
+
+
+async def find_missing_references(db: AsyncSession, orders) -> list:
+    """
+    주문서별 존재하지 않는 참조(행사/작성자/소속/상품/속성/수선 항목) 오류 목록
+    참조 테이블마다 1회 조회하므로 조회 수는 주문서 수와 무관
+    """
+    references = [
+        ("event_id", Event, lambda order: [order.event_id]),
+        ("author_id", Author, lambda order: [order.author_id, order.modifier_id]),
+        ("affiliation_id", Affiliation, lambda order: [order.affiliation_id]),
+        ("product_id", Product, lambda order: [item.product_id for item in order.orderItems or []]),
+        ("attributes_id", Attributes, lambda order: [item.attributes_id for item in order.orderItems or []]),
+        ("form_repair_id", FormRepair, lambda order: [detail.form_repair_id for detail in order.alteration_details or []]),
+    ]
+    errors = [[] for _ in orders]
+    for order, order_errors in zip(orders, errors):
+        if order.event_id is None:
+            order_errors.append("event_id: 필수 값입니다")
+
+    for label, model, ids_of in references:
+        requested = {value for order in orders for value in ids_of(order) if value is not None}
+        if not requested:
+            continue
+        found = set((await db.scalars(select(model.id).where(model.id.in_(requested)))).all())
+        for order, order_errors in zip(orders, errors):
+            missing = sorted({value for value in ids_of(order) if value is not None} - found)
+            if missing:
+                order_errors.append(f"{label}: 존재하지 않는 ID입니다 - {', '.join(map(str, missing))}")
+    return errors
+
+
+def _order_values(order: OrderCreate, order_number, is_temp: bool, now: datetime) -> dict:
+    values = order.model_dump(exclude={"payments", "alteration_details", "orderItems"})
+    values.update(orderNumber=order_number, created_at=now, updated_at=now, isTemporary=is_temp)
+    return values
+
+
+async def insert_orders(db: AsyncSession, orders, is_temp: bool = False) -> list:
+    """
+    주문서와 하위 데이터를 다중 행 INSERT로 저장하고 (주문서 ID, 주문번호) 목록 반환
+    - 주문번호는 카운터를 한 번에 len(orders)만큼 증가시켜 발급
+    - 주문서 INSERT ... RETURNING 은 요청 순서대로 ID를 돌려받음 (sort_by_parameter_order)
+    """
+    now = utc_now()
+    numbers = [None] * len(orders) if is_temp else await allocate_order_numbers(db, len(orders), now)
+    order_ids = (await db.scalars(
+        insert(Order).returning(Order.id, sort_by_parameter_order=True),
+        [_order_values(order, number, is_temp, now) for order, number in zip(orders, numbers)],
+    )).all()
+
+    changes = ChildChanges()
+    for order_id, order in zip(order_ids, orders):
+        order_changes = diff_order_children(order_id, order, [], [], [])
+        for model, rows in order_changes.inserts.items():
+            changes.inserts[model].extend(rows)
+    await apply_child_changes(db, changes)
+    await add_initial_status_history(db, [(order_id, order.status) for order_id, order in zip(order_ids, orders)], now)
+    await refresh_order_search(db, list(order_ids))
+    await add_to_daily_rollup(db, list(order_ids))
+    return list(zip(order_ids, numbers))
+
+
+def _error_message(error: Exception) -> str:
+    return str(getattr(error, "orig", None) or error)
+
+
+async def _save_chunk(db: AsyncSession, chunk, is_temp: bool, result: dict):
+    """청크 1개를 한 트랜잭션으로 저장 (실패 시 행마다 SAVEPOINT로 다시 시도하여 실패한 행만 제외)"""
+    orders = [order for _, order in chunk]
+    reference_errors = await find_missing_references(db, orders)
+    valid = []
+    for (row, order), errors in zip(chunk, reference_errors):
+        if errors:
+            result["errors"].append({"row": row, "errors": errors})
+        else:
+            valid.append((row, order))
+    if not valid:
+        return
+
+    try:
+        created = await insert_orders(db, [order for _, order in valid], is_temp)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+    else:
+        for (row, _), (order_id, number) in zip(valid, created):
+            result["results"].append({"row": row, "order_id": order_id, "orderNumber": number})
+        return
+
+    for row, order in valid:
+        try:
+            async with db.begin_nested():
+                [(order_id, number)] = await insert_orders(db, [order], is_temp)
+        except Exception as e:
+            result["errors"].append({"row": row, "errors": [_error_message(e)]})
+        else:
+            result["results"].append({"row": row, "order_id": order_id, "orderNumber": number})
+    await db.commit()
+
+
+async def read_rows(rows, chunk_size: int):
+    """
+    동기 행 iterator를 chunk_size 행씩 스레드에서 읽어 전달
+    파일 파싱/검증이 행 수에 비례해 오래 걸리므로 이벤트 루프를 막지 않도록 한다.
+    """
+    rows = iter(rows)
+    while True:
+        batch = await asyncio.to_thread(list, itertools.islice(rows, chunk_size))
+        if not batch:
+            return
+        for row in batch:
+            yield row
+
+
+async def import_orders(db: AsyncSession, rows, is_temp: bool = False, chunk_size: int = BULK_CHUNK_SIZE) -> dict:
+    """
+    (행 번호, OrderCreate 또는 None, 오류 목록)을 순서대로 받아 chunk_size 건씩 저장
+    행 파싱은 chunk_size 건씩 스레드에서 처리한다. (read_rows)
+    잘못된 행은 건너뛰고 오류로 보고하며, 나머지 행의 저장은 계속한다.
+    """
+    result = {"total": 0, "results": [], "errors": []}
+    chunk = []
+    async for row, order, errors in read_rows(rows, chunk_size):
+        result["total"] += 1
+        if order is not None:
+            errors = errors + normalize_enums(order)
+        if errors or order is None:
+            result["errors"].append({"row": row, "errors": errors})
+            continue
+        chunk.append((row, order))
+        if len(chunk) >= chunk_size:
+            await _save_chunk(db, chunk, is_temp, result)
+            chunk = []
+    if chunk:
+        await _save_chunk(db, chunk, is_temp, result)
+
+    result["errors"].sort(key=lambda error: error["row"])
+    result["created"] = len(result["results"])
+    result["failed"] = len(result["errors"])
+    return result
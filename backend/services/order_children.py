@@ -0,0 +1,152 @@
+from decimal import Decimal
+from enum import Enum
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import OrderItems, Payments, AlterationDetails
+
+# 비교/저장 대상 칼럼 (id, order_id 제외)
+ITEM_FIELDS = ("product_id", "attribute_id", "quantity", "price")
+PAYMENT_FIELDS = (
+    "payer", "payment_date",
+    "cashAmount", "cashCurrency", "cashConversion",
+    "cardAmount", "cardCurrency", "cardConversion",
+    "tradeInAmount", "tradeInCurrency", "tradeInConversion",
+    "paymentMethod", "notes",
+)
+ALTERATION_FIELDS = ("form_repair_id", "figure", "alterationFigure")
+
+
+def _normalize(value):
+    # DB의 Enum/DECIMAL 값과 요청의 문자열(Enum 이름)/float 값을 같은 기준으로 비교
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _changed(row, values: dict) -> bool:
+    return any(_normalize(getattr(row, name)) != _normalize(value) for name, value in values.items())
+
+
+def item_values(order_item) -> dict:
+    return {
+        "product_id": order_item.product_id,
+        "attribute_id": order_item.attributes_id,
+        "quantity": order_item.quantity,
+        "price": order_item.price,
+    }
+
+
+def payment_values(payment) -> dict:
+    return {name: getattr(payment, name) for name in PAYMENT_FIELDS}
+
+
+def alteration_values(alteration) -> dict:
+    return {name: getattr(alteration, name) for name in ALTERATION_FIELDS}
+
+
+class ChildChanges:
+    """테이블별 INSERT/UPDATE/DELETE 목록 (메모리에서 계산)"""
+
+    def __init__(self):
+        self.inserts = {OrderItems: [], Payments: [], AlterationDetails: []}
+        self.updates = {OrderItems: [], Payments: [], AlterationDetails: []}
+        self.deletes = {OrderItems: [], Payments: [], AlterationDetails: []}
+
+
+def diff_order_children(order_id: int, order, items, payments, alterations) -> ChildChanges:
+    """
+    기존 하위 데이터와 요청을 비교하여 변경 목록 계산
+    - 주문 상품: 요청 목록이 전체 목록 (순서대로 기존 행을 재사용, 남는 행은 삭제)
+    - 결제: paymentMethod 기준으로 기존 행 수정, 없으면 추가 (요청에 없는 결제는 유지)
+    - 수선: form_repair_id 기준으로 기존 행 수정, 없으면 추가 (요청에 없는 수선은 유지)
+    값이 바뀌지 않은 행은 UPDATE 하지 않는다.
+    """
+    changes = ChildChanges()
+
+    for index, order_item in enumerate(order.orderItems or []):
+        values = item_values(order_item)
+        if index < len(items):
+            if _changed(items[index], values):
+                changes.updates[OrderItems].append({"id": items[index].id, **values})
+        else:
+            changes.inserts[OrderItems].append({"order_id": order_id, **values})
+    changes.deletes[OrderItems] = [row.id for row in items[len(order.orderItems or []):]]
+
+    # 같은 키의 기존 행이 여러 개면 가장 먼저 만들어진 행을 수정 (기존 동작과 동일)
+    payments_by_method = {}
+    for row in payments:
+        payments_by_method.setdefault(_normalize(row.paymentMethod), row)
+    pending_payments = {}
+    for payment in order.payments or []:
+        values = payment_values(payment)
+        existing = payments_by_method.get(_normalize(payment.paymentMethod))
+        if existing is None:
+            changes.inserts[Payments].append({"order_id": order_id, **values})
+        elif _changed(existing, values):
+            # 같은 결제 방식이 요청에 여러 번 있으면 마지막 값으로 수정
+            pending_payments[existing.id] = {"id": existing.id, **values}
+    changes.updates[Payments] = list(pending_payments.values())
+
+    alterations_by_repair = {}
+    for row in alterations:
+        alterations_by_repair.setdefault(row.form_repair_id, row)
+    pending_alterations = {}
+    for alteration in order.alteration_details or []:
+        values = alteration_values(alteration)
+        existing = alterations_by_repair.get(alteration.form_repair_id)
+        if existing is None:
+            changes.inserts[AlterationDetails].append({"order_id": order_id, **values})
+        elif _changed(existing, values):
+            pending_alterations[existing.id] = {"id": existing.id, **values}
+    changes.updates[AlterationDetails] = list(pending_alterations.values())
+
+    return changes
+
+
+async def load_order_children(db: AsyncSession, order_id: int):
+    """주문서의 하위 데이터를 테이블별 1회 조회로 읽음 (ORM 객체 없이 비교에 필요한 칼럼만)"""
+    items = (await db.execute(
+        select(OrderItems.id, *(getattr(OrderItems, name) for name in ITEM_FIELDS))
+        .where(OrderItems.order_id == order_id).order_by(OrderItems.id)
+    )).all()
+    payments = (await db.execute(
+        select(Payments.id, *(getattr(Payments, name) for name in PAYMENT_FIELDS))
+        .where(Payments.order_id == order_id).order_by(Payments.id)
+    )).all()
+    alterations = (await db.execute(
+        select(AlterationDetails.id, *(getattr(AlterationDetails, name) for name in ALTERATION_FIELDS))
+        .where(AlterationDetails.order_id == order_id).order_by(AlterationDetails.id)
+    )).all()
+    return items, payments, alterations
+
+
+async def apply_child_changes(db: AsyncSession, changes: ChildChanges):
+    """변경 목록을 테이블/종류별 1문장(executemany)으로 반영"""
+    for model, ids in changes.deletes.items():
+        if ids:
+            await db.execute(delete(model).where(model.id.in_(ids)))
+    for model, rows in changes.updates.items():
+        if rows:
+            # 기본 키 기준 ORM 대량 UPDATE
+            await db.execute(update(model), rows)
+    for model, rows in changes.inserts.items():
+        if rows:
+            await db.execute(insert(model), rows)
+
+
+async def sync_order_children(db: AsyncSession, order_id: int, order, is_new: bool = False):
+    """
+    요청(OrderCreate)의 주문 상품/결제/수선 정보를 DB에 반영
+    하위 데이터 개수와 무관하게 조회 3회 + 테이블/종류별 최대 1문장으로 처리한다.
+    새 주문서(is_new)는 기존 데이터 조회를 생략한다.
+    """
+    if is_new:
+        children = ([], [], [])
+    else:
+        children = await load_order_children(db, order_id)
+    changes = diff_order_children(order_id, order, *children)
+    await apply_child_changes(db, changes)
+    return changes
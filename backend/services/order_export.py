@@ -0,0 +1,217 @@
+import urllib.parse
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import select, func
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Order, Event, Payments, Author, Affiliation, OrderItems, Product, Attributes, AlterationDetails, FormRepair
+from services.order_paging import apply_order_filters, apply_order_sort
+
+# 한 번에 DB에서 가져올 행 수 (서버 사이드 커서)
+EXPORT_BATCH_SIZE = 1000
+
+# 칼럼 값 종류 (Parquet 스키마 구성에 사용)
+STRING = "string"
+DATETIME = "datetime"
+NUMBER = "number"
+INTEGER = "integer"
+
+# 주문서 공통 칼럼 (모든 데이터셋의 앞부분)
+_ORDER_COLUMNS = [
+    ("행사명", STRING), ("작성자", STRING), ("수정자", STRING), ("주문자", STRING), ("연락처", STRING),
+    ("소속", STRING), ("수령 방법", STRING), ("주문 상태", STRING),
+    ("주문서 생성날짜", DATETIME), ("주문서 수정날짜", DATETIME),
+    ("총 주문 금액", NUMBER), ("총 결제 금액", NUMBER),
+]
+
+# 데이터셋별 (칼럼 헤더, 값 종류) 목록
+# - payments: 결제 1건당 1행 (기존 엑셀 다운로드와 동일)
+# - items: 주문 상품 1건당 1행
+# - alterations: 수선 내역 1건당 1행
+EXPORT_DATASET_COLUMNS = {
+    "payments": _ORDER_COLUMNS + [
+        ("결제 날짜", DATETIME), ("결제 방식", STRING), ("주소", STRING), ("비고", STRING),
+    ],
+    "items": _ORDER_COLUMNS + [
+        ("주소", STRING), ("상품명", STRING), ("속성", STRING), ("수량", INTEGER), ("가격", NUMBER),
+    ],
+    "alterations": _ORDER_COLUMNS + [
+        ("주소", STRING), ("수선 항목", STRING), ("단위", STRING), ("수치", NUMBER), ("수선 수치", NUMBER),
+    ],
+}
+EXPORT_DATASETS = tuple(EXPORT_DATASET_COLUMNS)
+
+# 엑셀 칼럼 헤더 (결제 1건당 1행)
+ORDER_EXPORT_HEADERS = [header for header, _ in EXPORT_DATASET_COLUMNS["payments"]]
+
+
+def export_columns(dataset: str = "payments"):
+    if dataset not in EXPORT_DATASET_COLUMNS:
+        raise ValueError(f"지원하지 않는 데이터셋입니다: {dataset}")
+    return EXPORT_DATASET_COLUMNS[dataset]
+
+
+def export_headers(dataset: str = "payments"):
+    return [header for header, _ in export_columns(dataset)]
+
+
+def build_order_export_query(
+    sort: Optional[str] = "order_date_asc",
+    dialect_name: str = "postgresql",
+    dataset: str = "payments",
+    **filters,
+):
+    """주문서 조회 필터를 적용한 하위 데이터(결제/상품/수선) 단위 평면 조회 (ORM 객체 없이 필요한 컬럼만 조회)"""
+    export_columns(dataset)
+    EventName = aliased(Event)
+    AuthorName = aliased(Author)
+    ModifierName = aliased(Author)
+    order_columns = (
+        EventName.name.label("event_name"),
+        AuthorName.name.label("author_name"),
+        ModifierName.name.label("modifier_name"),
+        Order.groomName,
+        Order.brideName,
+        Order.contact,
+        Affiliation.name.label("affiliation_name"),
+        Order.collectionMethod,
+        Order.status,
+        Order.created_at,
+        Order.updated_at,
+        Order.totalPrice,
+        Order.advancePayment,
+        Order.balancePayment,
+        Order.address,
+    )
+
+    if dataset == "items":
+        query = (
+            select(
+                *order_columns,
+                Product.name.label("product_name"),
+                Attributes.value.label("attribute_value"),
+                OrderItems.quantity,
+                OrderItems.price,
+            )
+            .select_from(Order)
+            .join(OrderItems, OrderItems.order_id == Order.id)
+            .outerjoin(Product, Product.id == OrderItems.product_id)
+            .outerjoin(Attributes, Attributes.id == OrderItems.attribute_id)
+        )
+        child_id = OrderItems.id
+    elif dataset == "alterations":
+        query = (
+            select(
+                *order_columns,
+                FormRepair.information,
+                FormRepair.unit,
+                AlterationDetails.figure,
+                AlterationDetails.alterationFigure,
+            )
+            .select_from(Order)
+            .join(AlterationDetails, AlterationDetails.order_id == Order.id)
+            .outerjoin(FormRepair, FormRepair.id == AlterationDetails.form_repair_id)
+        )
+        child_id = AlterationDetails.id
+    else:
+        query = (
+            select(*order_columns, Payments.payment_date, Payments.paymentMethod, Payments.notes)
+            .select_from(Order)
+            .join(Payments, Payments.order_id == Order.id)
+        )
+        child_id = Payments.id
+
+    query = (
+        query
+        .outerjoin(EventName, EventName.id == Order.event_id)
+        .outerjoin(AuthorName, AuthorName.id == Order.author_id)
+        .outerjoin(ModifierName, ModifierName.id == Order.modifier_id)
+        .outerjoin(Affiliation, Affiliation.id == Order.affiliation_id)
+    )
+    query = apply_order_filters(query, dialect_name=dialect_name, **filters)
+    return apply_order_sort(query, sort).order_by(child_id)
+
+
+def _orderer_name(row) -> Optional[str]:
+    names = [name for name in (row.groomName, row.brideName) if name]
+    return " / ".join(names) if names else None
+
+
+def _order_values(row) -> list:
+    return [
+        row.event_name,
+        row.author_name,
+        row.modifier_name,
+        _orderer_name(row),
+        row.contact,
+        row.affiliation_name,
+        row.collectionMethod,
+        row.status.value if row.status else None,
+        row.created_at,
+        row.updated_at,
+        row.totalPrice,
+        (row.advancePayment or 0) + (row.balancePayment or 0),
+    ]
+
+
+def order_export_row(row, dataset: str = "payments") -> list:
+    """조회 결과 1행을 데이터셋 칼럼 순서의 값 목록으로 변환"""
+    if dataset == "items":
+        return _order_values(row) + [
+            row.address,
+            row.product_name,
+            row.attribute_value,
+            row.quantity,
+            row.price,
+        ]
+    if dataset == "alterations":
+        return _order_values(row) + [
+            row.address,
+            row.information,
+            row.unit.value if row.unit else None,
+            row.figure,
+            row.alterationFigure,
+        ]
+    return _order_values(row) + [
+        row.payment_date,
+        row.paymentMethod.value if row.paymentMethod else None,
+        row.address,
+        row.notes,
+    ]
+
+
+async def iter_order_export_rows(db: AsyncSession, sort: Optional[str] = "order_date_asc", dataset: str = "payments", **filters):
+    """서버 사이드 커서(yield_per)로 EXPORT_BATCH_SIZE 행씩 읽어 내보낼 행을 하나씩 반환"""
+    query = build_order_export_query(sort, dialect_name=db.get_bind().dialect.name, dataset=dataset, **filters)
+    result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for partition in result.partitions():
+        for row in partition:
+            yield order_export_row(row, dataset)
+
+
+def iter_order_export_rows_sync(db: Session, sort: Optional[str] = "order_date_asc", dataset: str = "payments", **filters):
+    """iter_order_export_rows의 동기 버전 (백그라운드 내보내기 작업용)"""
+    query = build_order_export_query(sort, dialect_name=db.get_bind().dialect.name, dataset=dataset, **filters)
+    result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    for partition in result.partitions():
+        for row in partition:
+            yield order_export_row(row, dataset)
+
+
+def count_order_export_rows(db: Session, dataset: str = "payments", **filters) -> int:
+    """내보낼 행 수 (진행률 계산용)"""
+    query = build_order_export_query(None, dialect_name=db.get_bind().dialect.name, dataset=dataset, **filters).order_by(None)
+    return db.scalar(select(func.count()).select_from(query.subquery()))
+
+
+def order_export_title(event_name: Optional[str]) -> str:
+    return f"행사명: {event_name or '전체'} 주문서 목록"
+
+
+def order_export_filename(event_name: Optional[str], extension: str = "xlsx", dataset: str = "payments") -> str:
+    """다운로드 파일명 (URL 인코딩, 결제 외 데이터셋은 이름 뒤에 데이터셋 표시)"""
+    current_time = datetime.now().strftime("%Y%m%d")
+    suffix = "" if dataset == "payments" else f"_{dataset}"
+    return urllib.parse.quote(f"{event_name or '전체 주문서'}{suffix}_{current_time}.{extension}")
@@ -0,0 +1,144 @@
+from typing import Optional
+from sqlalchemy.orm import selectinload, load_only
+
+from models import Order, Event, OrderItems
+from schemas.category_schema import AttributeResponse
+from schemas.order_schema import OrderFilterResponse, OrderItemResponse, ProductResponse, PaymentInfo
+
+# 주문서 목록 응답에서 선택 가능한 전체 필드
+ORDER_LIST_FIELDS = tuple(OrderFilterResponse.model_fields)
+
+# 관계 로딩이 필요한 필드 (include= 로 추가 가능)
+RELATION_FIELDS = ("event_name", "form_name", "orderItems", "payments")
+
+# 화면별 로더 프로필: 각 화면이 렌더링하는 필드만 조회/직렬화
+LOADER_PROFILES = {
+    # 주문서 목록 표
+    "grid": (
+        "id", "event_id", "author_id", "affiliation_id", "orderNumber", "event_name",
+        "groomName", "brideName", "collectionMethod", "status", "created_at",
+        "totalPrice", "advancePayment", "balancePayment", "address", "payments",
+    ),
+    # 목록 화면의 엑셀 내보내기
+    "export": (
+        "id", "event_id", "author_id", "modifier_id", "affiliation_id", "orderNumber", "event_name",
+        "groomName", "brideName", "contact", "collectionMethod", "status", "created_at", "updated_at",
+        "totalPrice", "advancePayment", "balancePayment", "address", "notes", "alter_notes",
+        "orderItems", "payments",
+    ),
+    # 전체 필드
+    "detail": ORDER_LIST_FIELDS,
+}
+
+
+class InvalidFieldsError(ValueError):
+    pass
+
+
+def _split(value: Optional[str]):
+    return [item.strip() for item in value.split(",") if item.strip()] if value else []
+
+
+def resolve_order_fields(profile: Optional[str] = None, fields: Optional[str] = None, include: Optional[str] = None):
+    """
+    profile / fields / include 파라미터로 응답에 포함할 필드 목록을 결정한다.
+    - fields가 주어지면 프로필 대신 해당 필드만 사용
+    - include의 관계 필드는 결정된 필드 목록에 추가
+    - 아무것도 지정하지 않으면 전체 필드 (기존 응답과 동일)
+    """
+    if profile and profile not in LOADER_PROFILES:
+        raise InvalidFieldsError(f"알 수 없는 프로필입니다: {profile}")
+
+    requested = _split(fields)
+    unknown = [field for field in requested if field not in ORDER_LIST_FIELDS]
+    if unknown:
+        raise InvalidFieldsError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+    included = _split(include)
+    unknown = [field for field in included if field not in RELATION_FIELDS]
+    if unknown:
+        raise InvalidFieldsError(f"include 할 수 없는 필드입니다: {', '.join(unknown)}")
+
+    selected = list(requested or LOADER_PROFILES.get(profile, ORDER_LIST_FIELDS))
+    if "id" not in selected:
+        selected.insert(0, "id")
+    selected += [field for field in included if field not in selected]
+    return selected
+
+
+def order_loader_options(selected_fields):
+    """선택된 필드를 렌더링하는 데 필요한 컬럼과 관계만 로딩하는 옵션"""
+    columns = {Order.id}
+    columns.update(
+        getattr(Order, field) for field in selected_fields if field not in RELATION_FIELDS
+    )
+
+    options = []
+    if "form_name" in selected_fields:
+        options.append(selectinload(Order.event).selectinload(Event.form))
+    elif "event_name" in selected_fields:
+        options.append(selectinload(Order.event))
+    if "event_name" in selected_fields or "form_name" in selected_fields:
+        columns.add(Order.event_id)
+    if "orderItems" in selected_fields:
+        options.append(selectinload(Order.order_items).selectinload(OrderItems.product))
+        options.append(selectinload(Order.order_items).selectinload(OrderItems.attribute))
+    if "payments" in selected_fields:
+        options.append(selectinload(Order.payments))
+
+    return [load_only(*columns)] + options
+
+
+def _order_items(order):
+    return [
+        OrderItemResponse(
+            product=ProductResponse(
+                id=item.product_id,
+                name=item.product.name,
+                price=item.product.price
+            ),
+            price=item.price,
+            quantity=item.quantity,
+            attributes=[
+                AttributeResponse(id=item.attribute.id, value=item.attribute.value)
+            ] if item.attribute else []
+        ) for item in order.order_items
+    ]
+
+
+def _payments(order):
+    return [
+        PaymentInfo(
+            payer=payment.payer,
+            payment_date=payment.payment_date,
+            cashAmount=payment.cashAmount,
+            cashCurrency=payment.cashCurrency,
+            cashConversion=payment.cashConversion,
+            cardAmount=payment.cardAmount,
+            cardCurrency=payment.cardCurrency,
+            cardConversion=payment.cardConversion,
+            tradeInAmount=payment.tradeInAmount,
+            tradeInCurrency=payment.tradeInCurrency,
+            tradeInConversion=payment.tradeInConversion,
+            paymentMethod=payment.paymentMethod,
+            notes=payment.notes
+        ) for payment in order.payments
+    ]
+
+
+# 관계 필드 직렬화
+RELATION_BUILDERS = {
+    "event_name": lambda order: order.event.name,
+    "form_name": lambda order: order.event.form.name,
+    "orderItems": _order_items,
+    "payments": _payments,
+}
+
+
+def build_order_summary(order, selected_fields) -> OrderFilterResponse:
+    """선택된 필드만 설정된 OrderFilterResponse 생성 (설정되지 않은 필드는 응답에서 제외)"""
+    values = {}
+    for field in selected_fields:
+        builder = RELATION_BUILDERS.get(field)
+        values[field] = builder(order) if builder else getattr(order, field)
+    return OrderFilterResponse(**values)
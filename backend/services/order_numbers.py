@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import dialect_insert
+from models import OrderNumberCounter
+
+
+def order_number_prefix(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now(timezone.utc)).strftime("%y%m%d")
+
+
+def format_order_number(prefix: str, sequence: int) -> str:
+    """yymmdd-NNN (1000번째부터는 자릿수가 늘어남)"""
+    return f"{prefix}-{sequence:03d}"
+
+
+async def allocate_order_numbers(db: AsyncSession, count: int = 1, now: Optional[datetime] = None) -> list[str]:
+    """
+    오늘 날짜의 카운터를 count만큼 원자적으로 증가시키고 발급된 주문번호 목록을 반환
+    - INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 문장으로 처리하므로 동시 저장에도 중복되지 않음
+    - 카운터 행의 잠금은 현재 트랜잭션이 끝날 때까지 유지되므로 롤백되면 번호도 함께 반환됨 (번호 누락 없음)
+    """
+    prefix = order_number_prefix(now)
+    statement = dialect_insert(db, OrderNumberCounter).values(day=prefix, last_value=count)
+    statement = statement.on_conflict_do_update(
+        index_elements=[OrderNumberCounter.day],
+        set_={"last_value": OrderNumberCounter.last_value + count},
+    ).returning(OrderNumberCounter.last_value)
+    last_value = await db.scalar(statement)
+    return [format_order_number(prefix, sequence) for sequence in range(last_value - count + 1, last_value + 1)]
+
+
+async def allocate_order_number(db: AsyncSession, now: Optional[datetime] = None) -> str:
+    return (await allocate_order_numbers(db, 1, now))[0]
@@ -0,0 +1,136 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import and_, or_, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Order, Event
+from services.order_search import search_order_ids
+
+# 커서 페이징을 지원하는 정렬 옵션
+CURSOR_SORTS = ("order_date_asc", "order_date_desc")
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+# 커서 인코딩: 정렬 기준과 마지막 행의 (created_at, id)를 불투명 문자열로 변환
+def encode_cursor(sort: str, created_at: datetime, order_id: int) -> str:
+    payload = json.dumps({"s": sort, "c": created_at.isoformat(), "i": order_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: Optional[str]):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = datetime.fromisoformat(payload["c"])
+        order_id = int(payload["i"])
+        cursor_sort = payload["s"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorError("잘못된 커서입니다.")
+    if cursor_sort != sort:
+        raise InvalidCursorError("커서의 정렬 기준이 요청과 일치하지 않습니다.")
+    return created_at, order_id
+
+
+# 주문서 필터 적용 (ID 조회 / 카운트 쿼리 공용, select 문에 조건 추가)
+def apply_order_filters(
+    query,
+    event_name: Optional[str] = None,
+    order_date_from: Optional[datetime] = None,
+    order_date_to: Optional[datetime] = None,
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    is_temp: Optional[bool] = None,
+    dialect_name: str = "postgresql",
+):
+    if event_name:
+        query = query.join(Event, Order.event_id == Event.id).filter(Event.name == event_name)
+    if order_date_from and order_date_to:
+        query = query.filter(and_(Order.created_at >= order_date_from, Order.created_at <= order_date_to))
+    if search and search.strip():
+        # 검색 인덱스(order_search)에서 일치하는 주문서 ID만 조회
+        query = query.filter(Order.id.in_(search_order_ids(dialect_name, search)))
+    if status:
+        query = query.filter(Order.status == status)
+    if is_temp is not None:
+        query = query.filter(Order.isTemporary == is_temp)
+    return query
+
+
+# 정렬 적용 (id를 보조 키로 사용하여 페이지 경계를 안정적으로 유지)
+def apply_order_sort(query, sort: Optional[str]):
+    if sort == "order_date_asc":
+        return query.order_by(Order.created_at.asc(), Order.id.asc())
+    if sort == "order_date_desc":
+        return query.order_by(Order.created_at.desc(), Order.id.desc())
+    return query.order_by(Order.id.asc())
+
+
+# 키셋 조건: (created_at, id)가 커서 위치 이후인 행만 조회
+def apply_order_cursor(query, sort: str, created_at: datetime, order_id: int):
+    if sort == "order_date_desc":
+        return query.filter(
+            or_(Order.created_at < created_at, and_(Order.created_at == created_at, Order.id < order_id))
+        )
+    return query.filter(
+        or_(Order.created_at > created_at, and_(Order.created_at == created_at, Order.id > order_id))
+    )
+
+
+async def fetch_order_page(
+    db: AsyncSession,
+    loader_options: list,
+    sort: Optional[str] = "order_date_asc",
+    limit: int = 10,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    **filters,
+):
+    """
+    2단계 페이징
+    1) 필터가 적용된 Order.id만 조회하여 페이지 ID 목록과 (필요 시) 전체 개수를 구한다.
+       cursor가 주어지면 offset 대신 (created_at, id) 키셋 조건으로 다음 페이지를 찾는다.
+    2) 해당 ID의 주문서만 selectinload 옵션으로 하이드레이션한다.
+    반환값: (주문서 목록, 전체 개수 또는 None, 다음 페이지 커서 또는 None)
+    """
+    id_query = apply_order_filters(
+        select(Order.id, Order.created_at), dialect_name=db.get_bind().dialect.name, **filters
+    )
+
+    total = None
+    if include_total:
+        total = await db.scalar(select(func.count()).select_from(id_query.subquery()))
+
+    page_query = apply_order_sort(id_query, sort)
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor, sort)
+        page_query = apply_order_cursor(page_query, sort, cursor_created_at, cursor_id)
+    else:
+        page_query = page_query.offset(offset)
+
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+    rows = (await db.execute(page_query.limit(limit + 1))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows and sort in CURSOR_SORTS:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, last.created_at, last.id)
+
+    page_ids = [row.id for row in rows]
+    if not page_ids:
+        return [], total, next_cursor
+
+    orders = list((await db.scalars(select(Order).options(*loader_options).where(Order.id.in_(page_ids)))).all())
+
+    # IN 조회는 순서를 보장하지 않으므로 1단계의 정렬 순서로 복원
+    position = {order_id: index for index, order_id in enumerate(page_ids)}
+    orders.sort(key=lambda order: position[order.id])
+    return orders, total, next_cursor
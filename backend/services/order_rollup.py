@@ -0,0 +1,143 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import String, cast, delete, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import dialect_insert
+from models import Order, OrderDailyRollup
+from models.order import OrderStatus
+
+# 집계 키와 금액 칼럼 (OrderDailyRollup 칼럼 이름 = Order 칼럼 이름)
+ROLLUP_KEYS = ("event_id", "day", "status")
+ROLLUP_AMOUNTS = ("totalPrice", "advancePayment", "balancePayment")
+
+
+def rollup_source(order_ids=None, sign: int = 1):
+    """
+    주문서 테이블에서 (행사, 생성일, 상태)별 집계를 계산하는 select (임시 주문서 제외)
+    sign=-1 이면 집계에서 빼야 할 값(음수)을 계산한다.
+    """
+    day = func.date(Order.created_at)
+    status = func.coalesce(cast(Order.status, String), literal(""))
+    query = select(
+        Order.event_id,
+        day.label("day"),
+        status.label("status"),
+        (func.count() * sign).label("order_count"),
+        *(
+            (func.coalesce(func.sum(getattr(Order, name)), 0) * sign).label(name)
+            for name in ROLLUP_AMOUNTS
+        ),
+    ).where(Order.isTemporary == False)
+    if order_ids is not None:
+        query = query.where(Order.id.in_(order_ids))
+    return query.group_by(Order.event_id, day, status)
+
+
+async def _apply_rollup(db: AsyncSession, order_ids, sign: int):
+    # INSERT ... SELECT ... GROUP BY ... ON CONFLICT DO UPDATE: 키별로 기존 값에 증감분을 더함
+    statement = dialect_insert(db, OrderDailyRollup).from_select(
+        [*ROLLUP_KEYS, "order_count", *ROLLUP_AMOUNTS], rollup_source(order_ids, sign)
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[getattr(OrderDailyRollup, name) for name in ROLLUP_KEYS],
+        set_={
+            name: getattr(OrderDailyRollup, name) + getattr(statement.excluded, name)
+            for name in ("order_count", *ROLLUP_AMOUNTS)
+        },
+    )
+    await db.execute(statement)
+
+
+async def remove_from_daily_rollup(db: AsyncSession, order_ids):
+    """
+    주문서들의 현재 값을 집계에서 뺌 (주문서를 수정/삭제하기 전에, 같은 트랜잭션에서 호출)
+    order_ids에는 ID 리스트 또는 Order.id를 조회하는 select를 전달할 수 있다.
+    """
+    await _apply_rollup(db, order_ids, -1)
+
+
+async def add_to_daily_rollup(db: AsyncSession, order_ids):
+    """주문서들의 현재 값을 집계에 더함 (주문서를 생성/수정한 후 flush 된 상태에서 호출)"""
+    await db.flush()
+    await _apply_rollup(db, order_ids, 1)
+
+
+async def rebuild_daily_rollup(db: AsyncSession, event_id: Optional[int] = None) -> int:
+    """집계 테이블을 주문서 테이블에서 다시 계산 (event_id 지정 시 해당 행사만), 생성된 집계 행 수 반환"""
+    removal = delete(OrderDailyRollup)
+    order_ids = None
+    if event_id is not None:
+        removal = removal.where(OrderDailyRollup.event_id == event_id)
+        order_ids = select(Order.id).where(Order.event_id == event_id)
+    await db.execute(removal)
+    await _apply_rollup(db, order_ids, 1)
+    await db.commit()
+    query = select(func.count()).select_from(OrderDailyRollup)
+    if event_id is not None:
+        query = query.where(OrderDailyRollup.event_id == event_id)
+    return await db.scalar(query)
+
+
+def _rollup_key(row) -> tuple:
+    day = row.day if isinstance(row.day, date) else date.fromisoformat(row.day)
+    return row.event_id, day, row.status
+
+
+def _rollup_values(row) -> tuple:
+    return (row.order_count, *(Decimal(str(getattr(row, name) or 0)).quantize(Decimal("0.01")) for name in ROLLUP_AMOUNTS))
+
+
+async def check_daily_rollup(db: AsyncSession, event_id: Optional[int] = None) -> list:
+    """
+    집계 테이블과 주문서 테이블에서 다시 계산한 값을 비교하여 다른 키 목록 반환
+    (주문서가 0건인 집계 행은 없는 것으로 간주)
+    """
+    source = rollup_source(select(Order.id).where(Order.event_id == event_id) if event_id is not None else None)
+    stored_query = select(OrderDailyRollup).where(OrderDailyRollup.order_count != 0)
+    if event_id is not None:
+        stored_query = stored_query.where(OrderDailyRollup.event_id == event_id)
+
+    expected = {_rollup_key(row): _rollup_values(row) for row in (await db.execute(source)).all()}
+    stored = {_rollup_key(row): _rollup_values(row) for row in (await db.scalars(stored_query)).all()}
+    mismatches = []
+    for key in sorted(expected.keys() | stored.keys()):
+        if expected.get(key) != stored.get(key):
+            mismatches.append({"key": key, "expected": expected.get(key), "stored": stored.get(key)})
+    return mismatches
+
+
+async def event_dashboard(db: AsyncSession, event_id: int, day_from: Optional[date] = None, day_to: Optional[date] = None) -> dict:
+    """집계 테이블만 읽어 행사의 전체/상태별/일자별 합계 계산"""
+    query = select(OrderDailyRollup).where(OrderDailyRollup.event_id == event_id, OrderDailyRollup.order_count != 0)
+    if day_from:
+        query = query.where(OrderDailyRollup.day >= day_from)
+    if day_to:
+        query = query.where(OrderDailyRollup.day <= day_to)
+    rows = (await db.scalars(query.order_by(OrderDailyRollup.day, OrderDailyRollup.status))).all()
+
+    def empty():
+        return {"order_count": 0, **{name: Decimal("0") for name in ROLLUP_AMOUNTS}}
+
+    def accumulate(target, row):
+        target["order_count"] += row.order_count
+        for name in ROLLUP_AMOUNTS:
+            target[name] += getattr(row, name)
+
+    totals = empty()
+    by_status = {}
+    by_day = {}
+    for row in rows:
+        accumulate(totals, row)
+        # 집계 테이블은 상태를 Enum 이름으로 저장하므로 다른 API와 같이 값으로 응답
+        status = OrderStatus[row.status].value if row.status else None
+        accumulate(by_status.setdefault(row.status, {"status": status, **empty()}), row)
+        accumulate(by_day.setdefault(row.day, {"day": row.day, **empty()}), row)
+
+    return {
+        "event_id": event_id,
+        **totals,
+        "by_status": sorted(by_status.values(), key=lambda entry: entry["status"] or ""),
+        "by_day": list(by_day.values()),
+    }
@@ -0,0 +1,74 @@
+from sqlalchemy import delete, insert, select, func, literal, literal_column, table, column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Order, Author, Affiliation, OrderSearch
+from models.order_search import SQLITE_FTS_TABLE
+
+# trigram 인덱스는 3글자 이상부터 사용 가능
+MIN_INDEXED_TERM_LENGTH = 3
+
+LIKE_ESCAPE = "/"
+
+
+# 검색 대상 필드를 하나의 문서로 합치는 식
+# (신랑/신부 이름, 주소, 연락처, 노트, 수선 노트, 작성자, 소속)
+def search_document_expression():
+    separator = literal("\n")
+    fields = [
+        Order.groomName,
+        Order.brideName,
+        Order.address,
+        Order.contact,
+        Order.notes,
+        Order.alter_notes,
+        Author.name,
+        Affiliation.name,
+    ]
+    document = func.coalesce(fields[0], "")
+    for field in fields[1:]:
+        document = document + separator + func.coalesce(field, "")
+    return document
+
+
+async def refresh_order_search(db: AsyncSession, order_ids):
+    """
+    주어진 주문서들의 검색 문서를 다시 생성한다.
+    order_ids에는 ID 리스트 또는 Order.id를 조회하는 select를 전달할 수 있다.
+    """
+    # 세션의 변경 사항을 먼저 반영해야 최신 값으로 문서가 만들어진다
+    await db.flush()
+    await db.execute(delete(OrderSearch).where(OrderSearch.order_id.in_(order_ids)))
+    await db.execute(
+        insert(OrderSearch).from_select(
+            ["order_id", "document"],
+            select(Order.id, search_document_expression())
+            .outerjoin(Author, Order.author_id == Author.id)
+            .outerjoin(Affiliation, Order.affiliation_id == Affiliation.id)
+            .where(Order.id.in_(order_ids))
+        )
+    )
+
+
+def _escape_like(term: str) -> str:
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def search_order_ids(dialect_name: str, term: str):
+    """
+    검색어와 일치하는 Order.id를 조회하는 select를 반환한다.
+    - PostgreSQL: order_search.document의 pg_trgm GIN 인덱스를 타는 ILIKE
+    - SQLite: FTS5 trigram 테이블 MATCH (3글자 미만은 검색 문서 테이블 LIKE)
+    """
+    term = term.strip()
+    if dialect_name == "sqlite" and len(term) >= MIN_INDEXED_TERM_LENGTH:
+        fts = table(SQLITE_FTS_TABLE, column("rowid"))
+        phrase = '"' + term.replace('"', '""') + '"'
+        return select(fts.c.rowid).where(literal_column(SQLITE_FTS_TABLE).op("MATCH")(phrase))
+
+    return select(OrderSearch.order_id).where(
+        OrderSearch.document.ilike(f"%{_escape_like(term)}%", escape=LIKE_ESCAPE)
+    )
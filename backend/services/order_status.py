@@ -0,0 +1,214 @@
+from datetime import datetime
+from sqlalchemy import case, cast, extract, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import utc_now
+from models import Order, OrderStatusHistory
+from models.order import OrderStatus
+from services.order_paging import apply_order_filters
+from services.order_rollup import add_to_daily_rollup, remove_from_daily_rollup
+
+DEFAULT_PERCENTILES = (50, 90, 95)
+
+
+class InvalidStatusUpdateError(ValueError):
+    pass
+
+
+class InvalidPercentilesError(ValueError):
+    pass
+
+
+def parse_order_status(value: str) -> OrderStatus:
+    """주문 상태 이름(Order_Completed) 또는 값(Order Completed)을 OrderStatus로 변환"""
+    if value in OrderStatus.__members__:
+        return OrderStatus[value]
+    try:
+        return OrderStatus(value)
+    except ValueError:
+        raise InvalidStatusUpdateError("잘못된 주문 상태입니다.")
+
+
+async def record_status_change(db: AsyncSession, order_ids, status, changed_at: datetime):
+    """
+    상태가 status로 바뀌는 주문서의 변경 이력 추가 (상태를 변경하는 UPDATE 전에, 같은 트랜잭션에서 호출)
+    order_ids에는 ID 리스트 또는 Order.id를 조회하는 select를 전달할 수 있으며,
+    이미 같은 상태인 주문서는 이력을 남기지 않는다.
+    """
+    if status is None:
+        return
+    new_status = parse_order_status(status)
+    await db.execute(
+        insert(OrderStatusHistory).from_select(
+            ["order_id", "status", "changed_at"],
+            select(
+                Order.id,
+                cast(literal(new_status.name), OrderStatusHistory.status.type),
+                literal(changed_at, OrderStatusHistory.changed_at.type),
+            ).where(Order.id.in_(order_ids), Order.status.is_distinct_from(new_status)),
+        )
+    )
+
+
+async def add_initial_status_history(db: AsyncSession, orders, changed_at: datetime):
+    """새 주문서의 최초 상태 이력 추가 (orders: (주문서 ID, 상태) 목록, 상태가 없는 주문서는 제외)"""
+    rows = [
+        {"order_id": order_id, "status": parse_order_status(status).name, "changed_at": changed_at}
+        for order_id, status in orders if status is not None
+    ]
+    if rows:
+        await db.execute(insert(OrderStatusHistory), rows)
+
+
+async def bulk_update_order_status(db: AsyncSession, status: str, ids=None, filters: dict = None) -> dict:
+    """
+    주문서 여러 건의 상태를 UPDATE ... WHERE id IN (...) RETURNING 한 문장으로 변경
+    - ids: 변경할 주문서 ID 목록 (없는 ID는 결과에 updated=False로 표시)
+    - filters: 주문서 조회 API와 같은 필터 (ids 대신 사용, 최소 1개 필요)
+    """
+    new_status = parse_order_status(status)
+    filters = {name: value for name, value in (filters or {}).items() if value is not None}
+    if (ids is None) == (not filters):
+        raise InvalidStatusUpdateError("ids 또는 filters 중 하나만 지정해야 합니다.")
+
+    if ids is not None:
+        requested = list(dict.fromkeys(ids))
+        if not requested:
+            raise InvalidStatusUpdateError("변경할 주문서 ID가 없습니다.")
+        target = requested
+    else:
+        if "status" in filters:
+            filters["status"] = parse_order_status(filters["status"]).name
+        requested = None
+        target = apply_order_filters(select(Order.id), dialect_name=db.get_bind().dialect.name, **filters)
+
+    now = utc_now()
+    await record_status_change(db, target, new_status, now)
+    await remove_from_daily_rollup(db, target)
+    rows = (await db.execute(
+        update(Order)
+        .where(Order.id.in_(target))
+        .values(status=new_status, updated_at=now)
+        .returning(Order.id, Order.updated_at)
+        .execution_options(synchronize_session=False)
+    )).all()
+    # 변경 후에는 필터(예: status)가 달라지므로 반환된 ID로 집계에 다시 더함
+    await add_to_daily_rollup(db, [row.id for row in rows])
+    await db.commit()
+
+    updated = {row.id: row.updated_at for row in rows}
+    results = [
+        {"id": order_id, "updated": True, "status": new_status.value, "updated_at": updated_at}
+        for order_id, updated_at in sorted(updated.items())
+    ] if requested is None else [
+        {"id": order_id, "updated": True, "status": new_status.value, "updated_at": updated[order_id]}
+        if order_id in updated else
+        {"id": order_id, "updated": False, "error": "주문서를 찾을 수 없습니다."}
+        for order_id in requested
+    ]
+    return {
+        "status": new_status.value,
+        "matched": len(results),
+        "updated": len(updated),
+        "results": results,
+    }
+
+
+def parse_percentiles(value) -> tuple:
+    """쉼표로 구분된 백분위 문자열(예: 50,90,95)을 1~100 정수 튜플로 변환"""
+    if not value:
+        return DEFAULT_PERCENTILES
+    try:
+        percentiles = tuple(sorted({int(part) for part in str(value).split(",") if part.strip()}))
+    except ValueError:
+        raise InvalidPercentilesError("percentiles는 쉼표로 구분된 정수여야 합니다.")
+    if not percentiles or any(not 1 <= percentile <= 100 for percentile in percentiles):
+        raise InvalidPercentilesError("percentiles는 1~100 사이여야 합니다.")
+    return percentiles
+
+
+def _seconds_between(start, end, dialect_name: str):
+    if dialect_name == "postgresql":
+        return extract("epoch", end - start)
+    # julianday는 부동소수 일 단위라 밀리초 단위로 반올림
+    return func.round((func.julianday(end) - func.julianday(start)) * 86400, 3)
+
+
+def _status_intervals(order_filter, dialect_name: str):
+    """상태 이력 + 다음 변경 시각(LEAD)으로 만든 상태별 구간 (left_at/seconds는 현재 상태면 NULL)"""
+    history = OrderStatusHistory
+    left_at = func.lead(history.changed_at).over(
+        partition_by=history.order_id, order_by=(history.changed_at, history.id)
+    )
+    intervals = (
+        select(history.id, history.order_id, history.status, history.changed_at, left_at.label("left_at"))
+        .join(Order, Order.id == history.order_id)
+        .where(order_filter)
+        .subquery()
+    )
+    seconds = _seconds_between(intervals.c.changed_at, intervals.c.left_at, dialect_name)
+    return intervals, seconds
+
+
+async def order_status_timeline(db: AsyncSession, order_id: int) -> list:
+    """주문서 1건의 상태 변경 이력 ((order_id, changed_at) 인덱스 사용)"""
+    intervals, seconds = _status_intervals(Order.id == order_id, db.get_bind().dialect.name)
+    rows = (await db.execute(
+        select(intervals.c.status, intervals.c.changed_at, intervals.c.left_at, seconds.label("seconds"))
+        .order_by(intervals.c.changed_at, intervals.c.id)
+    )).all()
+    return [
+        {"status": row.status.value, "changed_at": row.changed_at, "left_at": row.left_at, "seconds": row.seconds}
+        for row in rows
+    ]
+
+
+async def event_status_dwell_times(db: AsyncSession, event_id: int, percentiles=DEFAULT_PERCENTILES, is_temp=False) -> list:
+    """
+    행사의 상태별 체류 시간(다음 상태로 바뀔 때까지 걸린 초) 통계를 SQL에서 집계
+    - LEAD로 구간을 만들고, ROW_NUMBER/COUNT로 상태별 순위를 매겨 nearest-rank 방식 백분위 계산
+    - 아직 다음 상태로 바뀌지 않은 현재 상태 구간은 제외
+    """
+    order_filter = Order.event_id == event_id
+    if is_temp is not None:
+        order_filter = order_filter & (Order.isTemporary == is_temp)
+    intervals, seconds = _status_intervals(order_filter, db.get_bind().dialect.name)
+    dwell = (
+        select(intervals.c.status, seconds.label("seconds"))
+        .where(intervals.c.left_at.isnot(None))
+        .subquery()
+    )
+    ranked = select(
+        dwell.c.status,
+        dwell.c.seconds,
+        func.row_number().over(partition_by=dwell.c.status, order_by=dwell.c.seconds).label("rank"),
+        func.count().over(partition_by=dwell.c.status).label("total"),
+    ).subquery()
+    # nearest-rank: ceil(p / 100 * total) 번째 값 (정수 나눗셈으로 올림 계산)
+    percentile_columns = [
+        func.max(case((ranked.c.rank == (ranked.c.total * percentile + 99) // 100, ranked.c.seconds))).label(f"p{percentile}")
+        for percentile in percentiles
+    ]
+    rows = (await db.execute(
+        select(
+            ranked.c.status,
+            func.count().label("count"),
+            func.avg(ranked.c.seconds).label("avg_seconds"),
+            func.min(ranked.c.seconds).label("min_seconds"),
+            func.max(ranked.c.seconds).label("max_seconds"),
+            *percentile_columns,
+        )
+        .group_by(ranked.c.status)
+        .order_by(ranked.c.status)
+    )).all()
+    return [
+        {
+            "status": row.status.value,
+            "count": row.count,
+            "avg_seconds": float(row.avg_seconds),
+            "min_seconds": float(row.min_seconds),
+            "max_seconds": float(row.max_seconds),
+            "percentiles": {f"p{percentile}": float(getattr(row, f"p{percentile}")) for percentile in percentiles},
+        }
+        for row in rows
+    ]
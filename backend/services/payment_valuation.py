@@ -0,0 +1,219 @@
+import numpy as np
+from sqlalchemy import String, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Order, Payments, Rate
+from models.payments import CurrencyType, TradeInCurrencyType
+
+# 결제 항목 (금액, 통화, 입력된 원화 환산액 컬럼) - 통화는 DB에 저장된 Enum 이름으로 읽음
+COMPONENTS = (
+    ("cash", Payments.cashAmount, Payments.cashCurrency, Payments.cashConversion),
+    ("card", Payments.cardAmount, Payments.cardCurrency, Payments.cardConversion),
+    ("tradeIn", Payments.tradeInAmount, Payments.tradeInCurrency, Payments.tradeInConversion),
+)
+
+# Enum 이름 -> 응답에 쓰는 값 ('K18' -> '18K')
+CURRENCY_VALUES = {
+    **{currency.name: currency.value for currency in CurrencyType},
+    **{currency.name: currency.value for currency in TradeInCurrencyType},
+}
+CURRENCY_NAMES = np.array(sorted(CURRENCY_VALUES))
+
+GOLD_COLUMNS = ("gold_10k", "gold_14k", "gold_18k", "gold_24k")
+EXCHANGE_COLUMNS = ("usd", "jpy")
+
+
+def _columns(rows, count: int) -> list:
+    """행 목록 -> 컬럼별 튜플"""
+    return list(zip(*rows)) if rows else [()] * count
+
+
+def _float_array(values) -> np.ndarray:
+    return np.array(values, dtype=float)  # None -> nan
+
+
+def _day_array(values) -> np.ndarray:
+    return np.array(values, dtype="datetime64[D]")  # None -> NaT
+
+
+async def load_payment_columns(db: AsyncSession, event_id: int) -> dict:
+    """행사 주문서(임시 제외)의 결제 내역을 컬럼 배열로 조회 (결제일이 없으면 주문서 작성일 기준)"""
+    query = (
+        select(
+            Payments.id,
+            Payments.order_id,
+            func.coalesce(Payments.payment_date, Order.created_at),
+            *[column for _, amount, currency, conversion in COMPONENTS
+              for column in (amount, cast(currency, String), conversion)],
+        )
+        .join(Order, Order.id == Payments.order_id)
+        .where(Order.event_id == event_id, Order.isTemporary == False)
+        .order_by(Payments.id)
+    )
+    columns = _columns((await db.execute(query)).all(), 3 + 3 * len(COMPONENTS))
+    payments = {
+        "id": np.array(columns[0], dtype=np.int64),
+        "order_id": np.array(columns[1], dtype=np.int64),
+        "day": _day_array(columns[2]),
+    }
+    for position, (name, *_) in enumerate(COMPONENTS):
+        amount, currency, conversion = columns[3 + 3 * position: 6 + 3 * position]
+        payments[name] = {
+            "amount": _float_array(amount),
+            "currency": np.array([value or "" for value in currency], dtype=str),
+            "conversion": _float_array(conversion),
+        }
+    return payments
+
+
+async def load_rate_series(db: AsyncSession, last_day) -> dict:
+    """
+    last_day 까지의 금 시세/환율 이력 (기준일 오름차순, 같은 기준일은 마지막 행만)
+    금 시세와 환율은 고시일이 달라 각각 따로 정렬한다.
+    """
+    series = {}
+    for bas_dt, other_bas_dt, names in (
+        (Rate.gold_bas_dt, Rate.exchange_bas_dt, GOLD_COLUMNS),
+        (Rate.exchange_bas_dt, Rate.gold_bas_dt, EXCHANGE_COLUMNS),
+    ):
+        query = select(bas_dt, *[getattr(Rate, name) for name in names]).where(bas_dt.isnot(None))
+        if last_day is not None:
+            query = query.where(bas_dt <= last_day)
+        columns = _columns((await db.execute(query.order_by(bas_dt, other_bas_dt))).all(), 1 + len(names))
+        days = _day_array(columns[0])
+        last = np.append(days[1:] != days[:-1], True) if len(days) else np.zeros(0, dtype=bool)
+        series[bas_dt.key] = days[last]
+        for name, values in zip(names, columns[1:]):
+            series[name] = _float_array(values)[last]
+    return series
+
+
+def as_of(days: np.ndarray, series_days: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """각 날짜에 적용되는 값 (기준일이 해당일 이하인 가장 최근 값, 없으면 nan)"""
+    if not len(series_days):
+        return np.full(len(days), np.nan)
+    index = np.searchsorted(series_days, days, side="right") - 1
+    valid = (index >= 0) & ~np.isnat(days)
+    return np.where(valid, values[np.clip(index, 0, None)], np.nan)
+
+
+def unit_rates(days: np.ndarray, rates: dict) -> dict:
+    """결제일 기준 통화(Enum 이름)별 1단위 원화 환산율 (화면 계산과 같이 JPY는 100엔 환율 / 100, 금은 g당 시세)"""
+    gold = {name: as_of(days, rates["gold_bas_dt"], rates[name]) for name in GOLD_COLUMNS}
+    exchange = {name: as_of(days, rates["exchange_bas_dt"], rates[name]) for name in EXCHANGE_COLUMNS}
+    return {
+        CurrencyType.KRW.name: np.ones(len(days)),
+        CurrencyType.USD.name: exchange["usd"],
+        CurrencyType.JPY.name: exchange["jpy"] / 100,
+        TradeInCurrencyType.K10.name: gold["gold_10k"],
+        TradeInCurrencyType.K14.name: gold["gold_14k"],
+        TradeInCurrencyType.K18.name: gold["gold_18k"],
+        TradeInCurrencyType.K24.name: gold["gold_24k"],
+    }
+
+
+def _totals(count, amount, stored, valued, drift, unvalued, unconverted) -> dict:
+    return {
+        "count": int(count),
+        "amount": round(float(amount), 2),
+        "stored_krw": round(float(stored), 2),
+        "valued_krw": round(float(valued), 2),
+        "drift_krw": round(float(drift), 2),
+        "unvalued_count": int(unvalued),
+        "unconverted_count": int(unconverted),
+    }
+
+
+def value_payments(payments: dict, rates: dict, limit: int = 10) -> dict:
+    """
+    결제 항목별 원화 재평가 (결제일 기준 시세 as-of 조인)와 입력된 환산액(*Conversion) 대비 차이
+    - 금액이 0보다 큰 항목만 대상 (화면 합계와 동일), 환산액은 화면과 같이 원 단위 반올림
+    - 적용할 시세가 없거나 통화가 없는 항목은 unvalued 로 집계하고 차이 계산에서 제외
+    - 환산액이 NULL(미입력)인 항목은 unconverted 로 집계하고 입력 환산액 합계/차이 계산에서 제외 (0원으로 보지 않음)
+    세 결제 항목을 한 배열로 이어 붙여 통화별 합계/최대 차이를 한 번에 계산한다.
+    """
+    day_rates = unit_rates(payments["day"], rates)
+    names = [name for name, *_ in COMPONENTS]
+    size = len(payments["id"])
+
+    component = np.repeat(np.arange(len(names)), size)
+    row = np.tile(np.arange(size), len(names))
+    amount = np.concatenate([payments[name]["amount"] for name in names])
+    currency = np.concatenate([payments[name]["currency"] for name in names])
+    stored = np.concatenate([payments[name]["conversion"] for name in names])
+    rate = np.concatenate([
+        np.select(
+            [payments[name]["currency"] == currency_name for currency_name in day_rates],
+            list(day_rates.values()),
+            default=np.nan,
+        )
+        for name in names
+    ])
+
+    active = amount > 0
+    component, row, amount, currency, stored, rate = (
+        values[active] for values in (component, row, amount, currency, stored, rate)
+    )
+    valid = np.isfinite(rate)
+    entered = np.isfinite(stored)
+    stored = np.where(entered, stored, 0)
+    valued = np.where(valid, np.floor(np.where(valid, amount * rate, 0) + 0.5), 0)
+    drift = np.where(valid & entered, valued - stored, 0)
+
+    # (결제 항목, 통화)별 합계 - 알 수 없는 통화는 마지막 칸
+    currency_index = np.searchsorted(CURRENCY_NAMES, currency)
+    known = currency_index < len(CURRENCY_NAMES)
+    known[known] = CURRENCY_NAMES[currency_index[known]] == currency[known]
+    currency_index = np.where(known, currency_index, len(CURRENCY_NAMES))
+    keys, group = np.unique(component * (len(CURRENCY_NAMES) + 1) + currency_index, return_inverse=True)
+
+    def group_sum(values):
+        return np.bincount(group, weights=values, minlength=len(keys))
+
+    sums = [np.bincount(group, minlength=len(keys)), group_sum(amount), group_sum(stored),
+            group_sum(valued), group_sum(drift), group_sum((~valid).astype(float)),
+            group_sum((~entered).astype(float))]
+    by_currency = []
+    for position, key in enumerate(keys):
+        component_index, index = divmod(int(key), len(CURRENCY_NAMES) + 1)
+        by_currency.append({
+            "component": names[component_index],
+            "currency": CURRENCY_VALUES[CURRENCY_NAMES[index]] if index < len(CURRENCY_NAMES) else None,
+            **_totals(*(values[position] for values in sums)),
+        })
+
+    # 차이가 큰 항목
+    largest = np.argsort(-np.abs(drift), kind="stable")[:limit]
+    largest = largest[drift[largest] != 0]
+    largest_drifts = [
+        {
+            "payment_id": int(payments["id"][row[index]]),
+            "order_id": int(payments["order_id"][row[index]]),
+            "payment_date": payments["day"][row[index]].item(),
+            "component": names[component[index]],
+            "currency": CURRENCY_VALUES.get(currency[index]),
+            "amount": round(float(amount[index]), 2),
+            "rate": round(float(rate[index]), 4),
+            "stored_krw": round(float(stored[index]), 2),
+            "valued_krw": round(float(valued[index]), 2),
+            "drift_krw": round(float(drift[index]), 2),
+        }
+        for index in largest
+    ]
+
+    totals = _totals(len(amount), 0, stored.sum(), valued.sum(), drift.sum(), (~valid).sum(), (~entered).sum())
+    totals.pop("amount")  # 통화가 섞여 있어 전체 금액 합계는 의미 없음
+    return {
+        "payment_count": size,
+        **totals,
+        "by_currency": by_currency,
+        "largest_drifts": largest_drifts,
+    }
+
+
+async def event_valuation(db: AsyncSession, event_id: int, limit: int = 10) -> dict:
+    payments = await load_payment_columns(db, event_id)
+    days = payments["day"][~np.isnat(payments["day"])]
+    last_day = days.max().item() if len(days) else None
+    rates = await load_rate_series(db, last_day)
+    return {"event_id": event_id, **value_payments(payments, rates, limit)}
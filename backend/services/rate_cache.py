@@ -0,0 +1,84 @@
+import asyncio
+import time
+from typing import Optional
+
+from config import settings
+from database import AsyncSessionLocal
+from models import Rate
+from services.rates import get_latest_rate
+
+
+class RateSnapshot:
+    """캐시된 최신 Rate 행 (세션과 분리된 값과 ETag)"""
+
+    def __init__(self, rate: Rate):
+        self.id = rate.id
+        self.gold_bas_dt = rate.gold_bas_dt
+        self.gold_10k = rate.gold_10k
+        self.gold_14k = rate.gold_14k
+        self.gold_18k = rate.gold_18k
+        self.gold_24k = rate.gold_24k
+        self.exchange_bas_dt = rate.exchange_bas_dt
+        self.usd = rate.usd
+        self.jpy = rate.jpy
+        self.krw = rate.krw
+        self.search_dt = rate.search_dt
+        search_dt = rate.search_dt.strftime("%Y%m%d%H%M%S") if rate.search_dt else ""
+        self.etag = f'W/"rate-{rate.id}-{search_dt}"'
+
+
+class LatestRateCache:
+    """
+    최신 Rate 행 프로세스 내 캐시 (/getGoldPriceInfo, /getExchangeRateInfo 공용)
+    - ttl_seconds 동안은 DB를 조회하지 않음
+    - 갱신 작업이 새 행을 저장하면 invalidate() 로 즉시 무효화
+    워커 프로세스마다 따로 캐시하므로 다른 워커에는 최대 ttl_seconds 늦게 반영된다.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.loads = 0
+        self._snapshot: Optional[RateSnapshot] = None
+        self._expires_at = 0.0
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() < self._expires_at
+
+    async def get(self) -> Optional[RateSnapshot]:
+        if self._is_fresh():
+            self.hits += 1
+            return self._snapshot
+        async with self._lock:  # 만료 직후 동시 요청은 한 번만 조회
+            if self._is_fresh():
+                self.hits += 1
+                return self._snapshot
+            version = self._version
+            # 갱신 직후 무효화가 복제 지연으로 무의미해지지 않도록 primary에서 조회
+            async with AsyncSessionLocal() as db:
+                rate = await get_latest_rate(db)
+            self.loads += 1
+            snapshot = RateSnapshot(rate) if rate else None
+            if version == self._version:  # 조회 중 무효화되었으면 저장하지 않음
+                self._snapshot = snapshot
+                self._expires_at = time.monotonic() + self.ttl_seconds
+            return snapshot
+
+    def invalidate(self):
+        self._version += 1
+        self._snapshot = None
+        self._expires_at = 0.0
+
+    def status_info(self) -> dict:
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "cached": self._is_fresh(),
+            "etag": self._snapshot.etag if self._is_fresh() and self._snapshot else None,
+            "hits": self.hits,
+            "loads": self.loads,
+        }
+
+
+latest_rate_cache = LatestRateCache(ttl_seconds=settings.RATE_CACHE_TTL_SECONDS)
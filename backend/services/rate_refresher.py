@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from config import settings
+from database import AsyncSessionLocal
+from services.rate_cache import latest_rate_cache
+from services.rates import PUBLICATION_HOUR, UPDATED, update_rate_data
+
+logger = logging.getLogger(__name__)
+
+# 갱신 상태
+IDLE = "idle"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+def next_refresh_time(now: datetime, delay_seconds: int = 0) -> datetime:
+    """다음 고시 시각(매일 PUBLICATION_HOUR시) + delay_seconds"""
+    scheduled = now.replace(hour=PUBLICATION_HOUR, minute=0, second=0, microsecond=0) + timedelta(seconds=delay_seconds)
+    if scheduled <= now:
+        scheduled += timedelta(days=1)
+    return scheduled
+
+
+class RateRefresher:
+    """
+    금 시세/환율 주기적 갱신 (lifespan에서 시작)
+    - 시작 시 1회 갱신하고, 이후 매일 고시 시각(11시) 직후에 갱신
+    - 실패하면 RATE_REFRESH_RETRY_SECONDS 후 다시 시도
+    시각은 update_rate_data 와 같은 서버 로컬 시각 기준
+    """
+
+    def __init__(self):
+        self.status = IDLE
+        self.last_result: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_started_at: Optional[datetime] = None
+        self.last_finished_at: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_success_at: Optional[datetime] = None
+        self.next_run_at: Optional[datetime] = None
+        self.runs = 0
+        self.failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self) -> Optional[str]:
+        self.status = RUNNING
+        self.last_started_at = datetime.now()
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as db:
+                self.last_result = await update_rate_data(db)
+            if self.last_result == UPDATED:
+                latest_rate_cache.invalidate()  # 새 행을 바로 조회 API에 반영
+            self.status = SUCCEEDED
+            self.last_error = None
+            self.last_success_at = datetime.now()
+        except Exception as e:
+            self.status = FAILED
+            self.last_result = None
+            self.last_error = str(e)
+            self.failures += 1
+            logger.exception("rate refresh failed")
+        finally:
+            self.runs += 1
+            self.last_duration = time.perf_counter() - started
+            self.last_finished_at = datetime.now()
+        logger.info("rate refresh %s (%s) in %.2fs", self.status, self.last_result, self.last_duration)
+        return self.last_result
+
+    def _next_run(self) -> datetime:
+        now = datetime.now()
+        if self.status == FAILED:
+            return now + timedelta(seconds=settings.RATE_REFRESH_RETRY_SECONDS)
+        return next_refresh_time(now, settings.RATE_REFRESH_DELAY_SECONDS)
+
+    async def run_periodically(self):
+        await self.refresh()
+        while True:
+            self.next_run_at = self._next_run()
+            await asyncio.sleep(max((self.next_run_at - datetime.now()).total_seconds(), 0))
+            await self.refresh()
+
+    def start(self):
+        if settings.RATE_REFRESH_ENABLED and self._task is None:
+            self._task = asyncio.create_task(self.run_periodically())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def status_info(self) -> dict:
+        return {
+            "enabled": settings.RATE_REFRESH_ENABLED,
+            "status": self.status,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+            "last_duration": self.last_duration,
+            "last_success_at": self.last_success_at,
+            "next_run_at": self.next_run_at,
+            "runs": self.runs,
+            "failures": self.failures,
+            "cache": latest_rate_cache.status_info(),
+        }
+
+
+rate_refresher = RateRefresher()
@@ -0,0 +1,279 @@
+import asyncio
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import Optional
+import httpx
+from dotenv import load_dotenv
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from database import dialect_insert
+from models import Rate
+
+# 환경 변수 로드
+load_dotenv()
+
+GOLD_API_KEY = os.getenv("GOLD_API_KEY")
+EXCHANGE_API_KEY = os.getenv("EXCHANGE_API_KEY")
+
+# 재시도할 응답 상태 코드 (일시적인 서버 오류/요청 제한)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 시세/환율 고시 시각 (이 시각 이후에 당일 데이터를 가져옴)
+PUBLICATION_HOUR = 11
+
+# 갱신 결과
+UPDATED = "updated"
+SKIPPED = "skipped"
+
+GOLD_FIELDS = ("gold_bas_dt", "gold_24k", "gold_18k", "gold_14k", "gold_10k")
+EXCHANGE_FIELDS = ("exchange_bas_dt", "usd", "jpy", "krw")
+
+
+class RateUnavailableError(RuntimeError):
+    pass
+
+
+class InvalidRateRangeError(ValueError):
+    pass
+
+
+async def get_latest_rate(db: AsyncSession) -> Optional[Rate]:
+    return await db.scalar(select(Rate).order_by(Rate.search_dt.desc()).limit(1))
+
+
+async def get_rate_history(db: AsyncSession, date_from: Optional[date] = None, date_to: Optional[date] = None) -> list:
+    """금 시세 또는 환율 기준일이 기간에 포함되는 행 (기준일순)"""
+    if date_from and date_to and date_from > date_to:
+        raise InvalidRateRangeError("from 은 to 보다 늦을 수 없습니다.")
+    conditions = []
+    for column in (Rate.gold_bas_dt, Rate.exchange_bas_dt):
+        bounds = [column.isnot(None)]
+        if date_from:
+            bounds.append(column >= date_from)
+        if date_to:
+            bounds.append(column <= date_to)
+        conditions.append(and_(*bounds))
+    statement = select(Rate).where(or_(*conditions)).order_by(Rate.gold_bas_dt, Rate.exchange_bas_dt)
+    return list(await db.scalars(statement))
+
+
+async def get_rate_as_of(db: AsyncSession, day: date) -> dict:
+    """
+    day 에 적용되는 금 시세/환율 (기준일이 day 이하인 가장 최근 값)
+    금 시세와 환율은 고시일이 다를 수 있어 각각 따로 찾는다. (기준일 인덱스 사용)
+    """
+    gold = await db.scalar(
+        select(Rate).where(Rate.gold_bas_dt <= day).order_by(Rate.gold_bas_dt.desc(), Rate.exchange_bas_dt.desc()).limit(1)
+    )
+    exchange = await db.scalar(
+        select(Rate).where(Rate.exchange_bas_dt <= day).order_by(Rate.exchange_bas_dt.desc(), Rate.gold_bas_dt.desc()).limit(1)
+    )
+    result = {"date": day}
+    result.update({field: getattr(gold, field) if gold else None for field in GOLD_FIELDS})
+    result.update({field: getattr(exchange, field) if exchange else None for field in EXCHANGE_FIELDS})
+    return result
+
+
+def is_rate_fresh(latest_rate: Optional[Rate], now: datetime) -> bool:
+    """마지막 갱신이 오늘 고시 시각 이후이거나, 아직 오늘 고시 전이면 갱신 불필요"""
+    if not latest_rate or not latest_rate.search_dt:
+        return False
+    is_today = latest_rate.search_dt.date() == now.date()
+    is_after_publication = latest_rate.search_dt.hour >= PUBLICATION_HOUR
+    now_is_after_publication = now.hour >= PUBLICATION_HOUR
+    return is_today and (is_after_publication or not now_is_after_publication)
+
+
+async def save_rate(db: AsyncSession, values: dict):
+    """기준일 조합(gold_bas_dt, exchange_bas_dt)당 1행 유지 (있으면 값/조회 시각 갱신)"""
+    if values["gold_bas_dt"] is None or values["exchange_bas_dt"] is None:
+        # unique 인덱스는 NULL 끼리 충돌하지 않으므로 직접 찾아서 갱신 (한쪽 API만 조회된 초기 상태)
+        existing = await db.scalar(
+            select(Rate.id).where(
+                Rate.gold_bas_dt.is_not_distinct_from(values["gold_bas_dt"]),
+                Rate.exchange_bas_dt.is_not_distinct_from(values["exchange_bas_dt"]),
+            ).limit(1)
+        )
+        if existing:
+            await db.execute(update(Rate).where(Rate.id == existing).values(**values))
+        else:
+            db.add(Rate(**values))
+            await db.flush()
+        return
+    statement = dialect_insert(db, Rate).values(**values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[Rate.gold_bas_dt, Rate.exchange_bas_dt],
+        set_={field: statement.excluded[field] for field in values if field not in ("gold_bas_dt", "exchange_bas_dt")},
+    )
+    await db.execute(statement)
+
+
+update_lock = asyncio.Lock()
+
+
+async def update_rate_data(db: AsyncSession) -> str:
+    """최신 금 시세/환율을 가져와 기준일별 Rate 행에 저장 (이미 최신이면 건너뜀), 결과(UPDATED/SKIPPED) 반환"""
+    async with update_lock:  # 동기화 락 사용
+        latest_rate = await get_latest_rate(db)
+        now = datetime.now()
+
+        if is_rate_fresh(latest_rate, now):
+            return SKIPPED
+
+        # 오늘부터 RATE_LOOKBACK_DAYS 일 전까지의 날짜를 금 시세/환율 모두 동시에 조회
+        dates = candidate_dates(now)
+        gold_data, exchange_data = await asyncio.gather(
+            fetch_latest(fetch_gold_data, dates),
+            fetch_latest(fetch_exchange_data, dates),
+        )
+
+        # 조회되지 않은 쪽은 마지막 값 유지
+        if not gold_data and latest_rate and latest_rate.gold_bas_dt:
+            gold_data = {field: getattr(latest_rate, field) for field in GOLD_FIELDS}
+
+        if not exchange_data and latest_rate and latest_rate.exchange_bas_dt:
+            exchange_data = {field: getattr(latest_rate, field) for field in EXCHANGE_FIELDS}
+
+        if not gold_data and not exchange_data:
+            # 빈 행은 저장하지 않음 (갱신 실패로 보고 재시도)
+            raise RateUnavailableError("금 시세/환율 데이터를 가져오지 못했습니다.")
+
+        values = {field: gold_data[field] if gold_data else None for field in GOLD_FIELDS}
+        values.update({field: exchange_data[field] if exchange_data else None for field in EXCHANGE_FIELDS})
+        values["search_dt"] = now
+        await save_rate(db, values)
+        await db.commit()
+        return UPDATED
+
+
+# 외부 API별 공용 HTTP 클라이언트 (keep-alive 연결 재사용, 이벤트 루프당 1개)
+_http_clients: dict = {}
+
+
+def get_http_client(name: str, verify: bool = True) -> httpx.AsyncClient:
+    client = _http_clients.get(name)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.RATE_HTTP_TIMEOUT, connect=settings.RATE_HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            verify=verify,
+        )
+        _http_clients[name] = client
+    return client
+
+
+async def close_http_clients():
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def get_json(client: httpx.AsyncClient, url: str, params: dict):
+    """
+    GET 요청 후 JSON 반환
+    연결 오류/타임아웃/일시적 서버 오류는 RATE_HTTP_RETRIES 회까지 지수 백오프(0.2초, 0.4초, ...)로 재시도
+    """
+    for attempt in range(settings.RATE_HTTP_RETRIES + 1):
+        try:
+            response = await client.get(url, params=params)
+            if response.status_code not in RETRY_STATUS_CODES:
+                response.raise_for_status()
+                return response.json()
+            error = httpx.HTTPStatusError(f"{response.status_code} from {url}", request=response.request, response=response)
+        except (httpx.TransportError, httpx.TimeoutException) as e:
+            error = e
+        if attempt < settings.RATE_HTTP_RETRIES:
+            await asyncio.sleep(settings.RATE_HTTP_BACKOFF_SECONDS * 2 ** attempt)
+    raise error
+
+
+def candidate_dates(now: datetime) -> list:
+    """조회할 기준일 목록 (최신순)"""
+    return [(now - timedelta(days=i)).strftime("%Y%m%d") for i in range(settings.RATE_LOOKBACK_DAYS)]
+
+
+async def fetch_latest(fetch, dates: list):
+    """
+    모든 날짜를 동시에 조회하고, 데이터가 있는 가장 최신 날짜의 결과 반환
+    더 최신 날짜의 결과가 모두 나오면 남은(더 오래된) 요청은 취소한다.
+    """
+    tasks = [asyncio.create_task(fetch(date)) for date in dates]
+    try:
+        for task in tasks:
+            result = await task
+            if result:
+                return result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+# 금 시세 데이터 조회
+async def fetch_gold_data(date: str):
+    try:
+        params = {
+            "serviceKey": GOLD_API_KEY,
+            "pageNo": 1,
+            "numOfRows": 1,
+            "resultType": "json",
+            "basDt": date
+        }
+        data = await get_json(get_http_client("gold"), settings.RATE_GOLD_ENDPOINT, params)
+
+        # 해당 날짜 데이터가 없으면 items가 비어 있음 (휴일 등)
+        items = ((data.get("response") or {}).get("body") or {}).get("items")
+        if not isinstance(items, dict) or not items.get("item"):
+            return None
+
+        gold_item = items["item"][0]
+        clpr = float(gold_item["clpr"])
+
+        return {
+            "gold_bas_dt": datetime.strptime(date, "%Y%m%d").date(),
+            "gold_24k": clpr,
+            "gold_18k": clpr * 0.75,
+            "gold_14k": clpr * 0.585,
+            "gold_10k": clpr * 0.417,
+        }
+    except Exception as e:
+        logging.error(f"Failed to fetch gold data ({date}): {e!r}")
+        return None
+
+
+# 환율 데이터 조회
+async def fetch_exchange_data(date: str):
+    try:
+        params = {
+            "authkey": EXCHANGE_API_KEY,
+            "searchdate": date,
+            "data": "AP01"
+        }
+        # 수출입은행 API는 인증서 검증을 하지 않음 (기존 동작 유지)
+        data = await get_json(get_http_client("exchange", verify=False), settings.RATE_EXCHANGE_ENDPOINT, params)
+
+        required_currencies = ["KRW", "JPY(100)", "USD"]
+        filtered_items = [
+            {
+                "cur_unit": item.get("cur_unit"),
+                "deal_bas_r": float(item["deal_bas_r"].replace(",", ""))
+            }
+            for item in data or [] if item.get("cur_unit") in required_currencies
+        ]
+
+        if not filtered_items:
+            return None
+
+        return {
+            "exchange_bas_dt": datetime.strptime(date, "%Y%m%d").date(),
+            "usd": next((item["deal_bas_r"] for item in filtered_items if item["cur_unit"] == "USD"), None),
+            "jpy": next((item["deal_bas_r"] for item in filtered_items if item["cur_unit"] == "JPY(100)"), None),
+            "krw": next((item["deal_bas_r"] for item in filtered_items if item["cur_unit"] == "KRW"), None),
+        }
+    except Exception as e:
+        logging.error(f"Failed to fetch exchange data ({date}): {e!r}")
+        return None
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from database import AsyncSessionLocal, utc_now
+from models import Order, OrderItems, Payments, AlterationDetails, OrderSearch, OrderStatusHistory
+
+logger = logging.getLogger(__name__)
+
+# 주문서보다 먼저 삭제할 하위 테이블: (결과 키, 모델, 주문서 ID 칼럼)
+CHILD_TABLES = [
+    ("orderItems", OrderItems, OrderItems.order_id),
+    ("payments", Payments, Payments.order_id),
+    ("alterationDetails", AlterationDetails, AlterationDetails.order_id),
+    ("order_search", OrderSearch, OrderSearch.order_id),
+    ("order_status_history", OrderStatusHistory, OrderStatusHistory.order_id),
+]
+
+
+def purge_cutoff(max_age_days: int, now: datetime = None) -> datetime:
+    """삭제 기준 시각 (DB 시각 컬럼과 같이 타임존 없는 UTC)"""
+    now = now or utc_now()
+    if now.tzinfo is not None:
+        now = now.astimezone(timezone.utc).replace(tzinfo=None)
+    return now - timedelta(days=max_age_days)
+
+
+def _stale_temporary_orders(cutoff: datetime):
+    # 마지막 수정(없으면 생성) 시각이 기준보다 오래된 임시 주문서
+    return (Order.isTemporary == True, func.coalesce(Order.updated_at, Order.created_at) < cutoff)
+
+
+async def count_purgeable_orders(db: AsyncSession, cutoff: datetime) -> int:
+    return await db.scalar(select(func.count()).select_from(Order).where(*_stale_temporary_orders(cutoff)))
+
+
+async def purge_temporary_orders(
+    db: AsyncSession,
+    max_age_days: int = None,
+    batch_size: int = None,
+    pause: float = None,
+    now: datetime = None,
+) -> dict:
+    """
+    오래된 임시 주문서와 하위 데이터(주문 상품/결제/수선/검색 문서/상태 이력) 삭제
+    - 주문서 ID 순으로 batch_size 건씩 (id > 마지막 ID) 잘라 배치마다 커밋하므로
+      한 번에 잠그는 행이 batch_size 건으로 제한된다.
+    - 배치 사이에 pause 초를 쉬어 다른 요청이 먼저 처리되도록 한다.
+    반환값: 테이블별 삭제 행 수, 배치 수, 소요 시간
+    """
+    max_age_days = settings.TEMP_ORDER_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    batch_size = batch_size or settings.TEMP_ORDER_PURGE_BATCH_SIZE
+    pause = settings.TEMP_ORDER_PURGE_PAUSE_SECONDS if pause is None else pause
+    cutoff = purge_cutoff(max_age_days, now)
+
+    started = time.perf_counter()
+    removed = {"order": 0, **{key: 0 for key, _, _ in CHILD_TABLES}}
+    batches = 0
+    last_id = 0
+    while True:
+        order_ids = (await db.scalars(
+            select(Order.id)
+            .where(*_stale_temporary_orders(cutoff), Order.id > last_id)
+            .order_by(Order.id)
+            .limit(batch_size)
+            # 수정 중인 주문서는 건너뛰고(다음 실행에서 삭제), 삭제할 행은 하위 데이터 삭제 전에 잠금
+            .with_for_update(skip_locked=True)
+        )).all()
+        if not order_ids:
+            break
+
+        for key, model, order_id_column in CHILD_TABLES:
+            result = await db.execute(delete(model).where(order_id_column.in_(order_ids)))
+            removed[key] += result.rowcount
+        result = await db.execute(delete(Order).where(Order.id.in_(order_ids)))
+        removed["order"] += result.rowcount
+        await db.commit()
+
+        batches += 1
+        last_id = order_ids[-1]
+        if len(order_ids) < batch_size:
+            break
+        if pause:
+            await asyncio.sleep(pause)
+
+    return {
+        "cutoff": cutoff,
+        "batches": batches,
+        "removed": removed,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+async def purge_periodically(interval: int = None):
+    """TEMP_ORDER_PURGE_INTERVAL_SECONDS 마다 오래된 임시 주문서 삭제 (lifespan에서 실행)"""
+    interval = interval or settings.TEMP_ORDER_PURGE_INTERVAL_SECONDS
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await purge_temporary_orders(db)
+            logger.info(
+                "temporary order purge: %d batches in %.2fs, removed %s",
+                result["batches"], result["elapsed"], result["removed"],
+            )
+        except Exception:
+            logger.exception("temporary order purge failed")
@@ -0,0 +1,295 @@
+import shutil
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import NamedTuple
+from xml.sax.saxutils import escape, quoteattr
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import to_excel
+
+# 열 너비 추정에 사용할 앞부분 행 수
+WIDTH_SAMPLE_SIZE = 500
+# 클라이언트로 내보낼 청크 크기
+CHUNK_SIZE = 64 * 1024
+
+# 셀 스타일 인덱스 (styles.xml의 cellXfs 순서)
+STYLE_DATETIME = 1
+STYLE_DATE = 2
+STYLE_TITLE = 3
+
+
+def _content_types_xml(sheet_count: int) -> str:
+    sheets = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{index}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for index in range(1, sheet_count + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        f'{sheets}'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    )
+
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+
+def _workbook_rels_xml(sheet_count: int) -> str:
+    """시트는 rId1..rIdN, 스타일은 rId{N+1}"""
+    sheets = "".join(
+        f'<Relationship Id="rId{index}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{index}.xml"/>'
+        for index in range(1, sheet_count + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'{sheets}'
+        f'<Relationship Id="rId{sheet_count + 1}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    )
+
+
+# openpyxl 기본 서식과 동일한 날짜 표시 형식, 제목 셀(굵게, 14pt, 가운데 정렬)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="2">'
+    '<numFmt numFmtId="164" formatCode="yyyy-mm-dd h:mm:ss"/>'
+    '<numFmt numFmtId="165" formatCode="yyyy-mm-dd"/>'
+    '</numFmts>'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="14"/><name val="Calibri"/><family val="2"/></font>'
+    '</fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1">'
+    '<alignment horizontal="center"/></xf>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+class ChunkBuffer:
+    """쓰인 바이트를 모아 두었다가 청크 단위로 꺼내는 쓰기 전용 버퍼 (seek 불가, ZipFile/내보내기 작성기 공용)"""
+
+    def __init__(self):
+        self._parts = []
+        self._size = 0
+        self._position = 0
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        self._size += len(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def pending(self):
+        return self._size
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts = []
+        self._size = 0
+        return data
+
+
+def _display_length(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, Enum):
+        value = value.value
+    return len(str(value))
+
+
+def estimate_column_widths(headers, sample_rows):
+    """헤더와 앞부분 샘플 행의 최대 글자 수 + 여유 2칸으로 열 너비 추정"""
+    widths = []
+    for index, header in enumerate(headers):
+        max_length = max(
+            [_display_length(header)] + [_display_length(row[index]) for row in sample_rows if index < len(row)]
+        )
+        widths.append(max_length + 2 if max_length > 0 else None)
+    return widths
+
+
+def _cell_xml(ref: str, value, style: int = 0) -> str:
+    style_attr = f' s="{style}"' if style else ""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"{style_attr}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, Decimal)):
+        return f'<c r="{ref}"{style_attr}><v>{value}</v></c>'
+    if isinstance(value, datetime):
+        return f'<c r="{ref}" s="{style or STYLE_DATETIME}"><v>{to_excel(value.replace(tzinfo=None))}</v></c>'
+    if isinstance(value, date):
+        return f'<c r="{ref}" s="{style or STYLE_DATE}"><v>{to_excel(value)}</v></c>'
+    text = ILLEGAL_CHARACTERS_RE.sub("", str(value))
+    return f'<c r="{ref}" t="inlineStr"{style_attr}><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+
+def _row_xml(row_number: int, values, letters, style: int = 0) -> str:
+    cells = "".join(
+        _cell_xml(f"{letters[index]}{row_number}", value, style)
+        for index, value in enumerate(values) if value is not None
+    )
+    return f'<row r="{row_number}">{cells}</row>'
+
+
+class SheetInfo(NamedTuple):
+    """workbook.xml에 시트와 필터 범위(_FilterDatabase)를 등록하는 데 필요한 정보"""
+    sheet_name: str
+    header_row_number: int
+    row_number: int
+    last_letter: str
+
+
+class SheetXmlWriter:
+    """
+    워크시트 XML(xl/worksheets/sheetN.xml)을 바이너리 스트림에 순차적으로 기록하는 작성기
+    - 생성 시 앞부분 샘플 행으로 열 너비를 정하고 샘플 행을 먼저 기록
+    - title이 있으면 1행에 병합된 제목, 2행에 헤더, 3행부터 데이터 (헤더 행에 필터 적용)
+    """
+
+    def __init__(self, stream, headers, sample_rows=(), title=None):
+        self._stream = stream
+        self.title = title
+        self.letters = [get_column_letter(index + 1) for index in range(len(headers))]
+        self.header_row_number = 2 if title else 1
+        self.row_number = self.header_row_number
+
+        self._write(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+            ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        )
+        cols = "".join(
+            f'<col min="{index + 1}" max="{index + 1}" width="{width}" customWidth="1"/>'
+            for index, width in enumerate(estimate_column_widths(headers, sample_rows)) if width
+        )
+        if cols:
+            self._write(f"<cols>{cols}</cols>")
+        self._write("<sheetData>")
+        if title:
+            self._write(_row_xml(1, [title], self.letters, STYLE_TITLE))
+        self._write(_row_xml(self.header_row_number, headers, self.letters))
+        for row in sample_rows:
+            self.write_row(row)
+
+    def _write(self, text: str):
+        self._stream.write(text.encode("utf-8"))
+
+    def write_row(self, values):
+        self.row_number += 1
+        self._write(_row_xml(self.row_number, values, self.letters))
+
+    def finish(self):
+        """필터/병합 범위를 기록하고 워크시트를 마무리 (스트림은 닫지 않음)"""
+        last_letter = self.letters[-1]
+        self._write("</sheetData>")
+        self._write(f'<autoFilter ref="A{self.header_row_number}:{last_letter}{self.row_number}"/>')
+        if self.title:
+            self._write(f'<mergeCells count="1"><mergeCell ref="A1:{last_letter}1"/></mergeCells>')
+        self._write("</worksheet>")
+
+    def sheet_info(self, sheet_name: str) -> SheetInfo:
+        return SheetInfo(sheet_name, self.header_row_number, self.row_number, self.letters[-1])
+
+
+def _workbook_xml(sheets) -> str:
+    entries = "".join(
+        f'<sheet name={quoteattr(sheet.sheet_name)} sheetId="{index}" r:id="rId{index}"/>'
+        for index, sheet in enumerate(sheets, start=1)
+    )
+    defined_names = "".join(
+        f'<definedName name="_xlnm._FilterDatabase" localSheetId="{index}" hidden="1">'
+        + escape("'" + sheet.sheet_name.replace("'", "''") + "'")
+        + f"!$A${sheet.header_row_number}:${sheet.last_letter}${sheet.row_number}</definedName>"
+        for index, sheet in enumerate(sheets)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+        ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f"<sheets>{entries}</sheets>"
+        f"<definedNames>{defined_names}</definedNames>"
+        "</workbook>"
+    )
+
+
+def _write_package_parts(archive: zipfile.ZipFile, sheet_count: int):
+    archive.writestr("[Content_Types].xml", _content_types_xml(sheet_count))
+    archive.writestr("_rels/.rels", _ROOT_RELS)
+    archive.writestr("xl/_rels/workbook.xml.rels", _workbook_rels_xml(sheet_count))
+    archive.writestr("xl/styles.xml", _STYLES)
+
+
+class XlsxStreamWriter:
+    """
+    단일 시트 XLSX 파일을 순차적으로 기록하는 작성기
+    - 시트 XML을 압축 스트림에 바로 기록하므로 메모리 사용량이 행 수와 무관
+    - 기록된 바이트는 drain()으로 꺼내어 전송/저장
+    """
+
+    def __init__(self, headers, sample_rows=(), title=None, sheet_name="Sheet1"):
+        self.sheet_name = sheet_name
+        self._buffer = ChunkBuffer()
+        self._archive = zipfile.ZipFile(self._buffer, mode="w", compression=zipfile.ZIP_DEFLATED)
+        _write_package_parts(self._archive, 1)
+        self._sheet = self._archive.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True)
+        self._sheet_writer = SheetXmlWriter(self._sheet, headers, sample_rows, title=title)
+
+    def write_row(self, values):
+        self._sheet_writer.write_row(values)
+
+    def pending(self) -> int:
+        return self._buffer.pending()
+
+    def drain(self) -> bytes:
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        """시트를 마무리하고 남은 바이트(중앙 디렉터리 포함)를 반환"""
+        self._sheet_writer.finish()
+        self._sheet.close()
+        # 필터 범위는 전체 행 수를 알아야 하므로 workbook.xml은 시트 다음에 기록
+        self._archive.writestr("xl/workbook.xml", _workbook_xml([self._sheet_writer.sheet_info(self.sheet_name)]))
+        self._archive.close()
+        return self._buffer.drain()
+
+
+def write_workbook(target, sheets):
+    """
+    미리 생성해 둔 워크시트 XML 파일들을 하나의 XLSX 파일로 합침
+    sheets: (SheetInfo, 워크시트 XML 파일 경로) 목록 (시트 순서대로)
+    """
+    with zipfile.ZipFile(target, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        _write_package_parts(archive, len(sheets))
+        for index, (_, path) in enumerate(sheets, start=1):
+            with open(path, "rb") as source, archive.open(f"xl/worksheets/sheet{index}.xml", mode="w", force_zip64=True) as part:
+                shutil.copyfileobj(source, part, CHUNK_SIZE * 16)
+        archive.writestr("xl/workbook.xml", _workbook_xml([info for info, _ in sheets]))
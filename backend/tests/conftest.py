@@ -0,0 +1,86 @@
+"""
+테스트 공용 fixture (환경 변수는 tests/environment.py)
+
+사용법 (backend 디렉터리에서 실행):
+    pip install -r requirements-dev.txt
+    python -m pytest -q
+    TEST_DATABASE_URL=postgresql://... python -m pytest -q
+"""
+import socket
+from contextlib import ExitStack
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def database():
+    from database import Base, engine
+
+    Base.metadata.create_all(engine)
+    yield engine
+
+
+@pytest.fixture
+async def client(database):
+    """앱에 직접 요청하는 HTTP 클라이언트 (lifespan 미실행)"""
+    import httpx
+    from database import async_engine
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=120) as http_client:
+        yield http_client
+    # 테스트마다 이벤트 루프가 달라지므로 연결 풀을 비움
+    await async_engine.dispose()
+
+
+@pytest.fixture
+def make_event(database):
+    """테스트용 양식/행사 생성 후 행사 ID 반환"""
+    from sqlalchemy import insert
+    from database import SessionLocal
+    from models import Event, Form
+
+    def create(name: str = "테스트 행사") -> int:
+        with SessionLocal() as session:
+            form_id = session.execute(insert(Form).values(name=name, created_at=datetime.now()).returning(Form.id)).scalar_one()
+            event_id = session.execute(insert(Event).values(name=name, form_id=form_id, inProgress=True).returning(Event.id)).scalar_one()
+            session.commit()
+        return event_id
+
+    return create
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+async def rate_stub(monkeypatch):
+    """
+    금 시세/환율 API 스텁 서버를 띄우고 시세 조회가 스텁을 사용하도록 설정하는 함수
+    rate_stub(**options) -> stats (options는 scripts.rate_stub_server.create_stub_app 인자)
+    """
+    from config import settings
+    from scripts.rate_stub_server import run_stub_server
+    from services.rates import close_http_clients
+
+    # 공용 HTTP 클라이언트는 생성 시점의 타임아웃 설정을 쓰므로 테스트마다 새로 만듦
+    await close_http_clients()
+    with ExitStack() as servers:
+        def start(**options):
+            base_url, stats = servers.enter_context(run_stub_server(_free_port(), **options))
+            monkeypatch.setattr(settings, "RATE_GOLD_ENDPOINT", f"{base_url}/gold")
+            monkeypatch.setattr(settings, "RATE_EXCHANGE_ENDPOINT", f"{base_url}/exchange")
+            return stats
+
+        yield start
+        await close_http_clients()
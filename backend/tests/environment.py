@@ -0,0 +1,22 @@
+"""
+테스트 환경 변수 (pytest.ini 의 -p tests.environment 로 가장 먼저 로드)
+
+backend 패키지의 __init__ 이 라우터를 import 하면서 설정을 읽으므로,
+conftest 보다 먼저 DB URL 등을 지정해야 한다.
+- 기본은 실행마다 새로 만드는 임시 SQLite DB, TEST_DATABASE_URL 을 지정하면 해당 DB 사용
+  (PostgreSQL 검사용, 비어 있는 DB에 테이블을 만들고 데이터를 추가함)
+- 백그라운드 작업(시세 갱신/임시 주문서 정리)은 실행하지 않는다.
+"""
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL") or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+os.environ.pop("READ_DATABASE_URL", None)
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ["RATE_REFRESH_ENABLED"] = "false"
+os.environ["TEMP_ORDER_PURGE_ENABLED"] = "false"
@@ -0,0 +1,59 @@
+import asyncio
+import re
+
+import pytest
+from sqlalchemy import select
+
+pytestmark = pytest.mark.anyio
+
+SAVES = 120
+
+
+def order_payload(event_id: int, index: int) -> dict:
+    return {
+        "event_id": event_id,
+        "status": "Order_Completed",
+        "groomName": f"신랑{index}",
+        "brideName": f"신부{index}",
+        "orderItems": [],
+        "payments": [],
+        "alteration_details": [],
+    }
+
+
+async def test_parallel_saves_issue_unique_contiguous_order_numbers(client, make_event):
+    """동시 저장(바로 저장 / 임시 저장 후 수정) 시 주문번호가 중복/누락 없이 연속으로 발급됨"""
+    from database import SessionLocal
+    from models import Order
+    from services.order_numbers import order_number_prefix
+
+    event_id = make_event("주문번호 동시 발급")
+    prefix = order_number_prefix()
+
+    async def save_directly(index: int):
+        response = await client.post("/order/save", json=order_payload(event_id, index))
+        response.raise_for_status()
+
+    async def save_via_update(index: int):
+        response = await client.post("/order/save", params={"is_temp": True}, json=order_payload(event_id, index))
+        response.raise_for_status()
+        response = await client.put(f"/order/save/{response.json()['order_id']}", json=order_payload(event_id, index))
+        response.raise_for_status()
+
+    await asyncio.gather(*(save_directly(index) if index % 2 == 0 else save_via_update(index) for index in range(SAVES)))
+
+    with SessionLocal() as session:
+        numbers = list(session.scalars(select(Order.orderNumber).where(Order.event_id == event_id)))
+
+    assert None not in numbers
+    assert len(numbers) == SAVES
+    assert len(set(numbers)) == SAVES
+    sequences = sorted(int(re.fullmatch(rf"{prefix}-(\d+)", number).group(1)) for number in numbers)
+    assert sequences == list(range(sequences[0], sequences[0] + SAVES))
+
+
+async def test_temporary_save_does_not_issue_order_number(client, make_event):
+    event_id = make_event("임시 저장")
+    response = await client.post("/order/save", params={"is_temp": True}, json=order_payload(event_id, 0))
+    assert response.status_code == 201
+    assert response.json()["orderNumber"] is None
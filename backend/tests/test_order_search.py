@@ -0,0 +1,51 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def search(client, term: str) -> list:
+    response = await client.get("/orders", params={"search": term, "limit": 100})
+    assert response.status_code == 200, response.text
+    return sorted(order["id"] for order in response.json()["orders"])
+
+
+async def save_order(client, event_id: int, groom_name: str, author_id: int) -> int:
+    payload = {
+        "event_id": event_id,
+        "author_id": author_id,
+        "status": "Order_Completed",
+        "groomName": groom_name,
+        "brideName": "신부",
+        "orderItems": [],
+        "payments": [],
+        "alteration_details": [],
+    }
+    response = await client.post("/order/save", json=payload)
+    response.raise_for_status()
+    return response.json()["order_id"]
+
+
+async def test_search_follows_order_and_author_changes(client, make_event):
+    """짧은 검색어(LIKE) / 3글자 이상 검색어(SQLite FTS5) 모두 주문서/작성자 변경과 삭제를 반영"""
+    event_id = make_event("주문서 검색")
+    response = await client.post("/authors", json={"name": "검색작성자갑"})
+    response.raise_for_status()
+    author_id = response.json()["id"]
+    first = await save_order(client, event_id, "검색김철수", author_id)
+    second = await save_order(client, event_id, "검색이영희", author_id)
+
+    assert await search(client, "철수") == [first]
+    assert await search(client, "검색김철수") == [first]
+    assert await search(client, "검색작성자갑") == [first, second]
+
+    # 작성자 이름 변경 시 해당 작성자의 주문서 검색 문서 갱신
+    response = await client.put(f"/authors/{author_id}", json={"name": "검색작성자을"})
+    response.raise_for_status()
+    assert await search(client, "검색작성자갑") == []
+    assert await search(client, "검색작성자을") == [first, second]
+
+    response = await client.delete(f"/order/{first}")
+    response.raise_for_status()
+    assert await search(client, "검색김철수") == []
+    assert await search(client, "철수") == []
+    assert await search(client, "검색작성자을") == [second]
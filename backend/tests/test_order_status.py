@@ -0,0 +1,61 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def save_order(client, event_id: int) -> int:
+    payload = {
+        "event_id": event_id,
+        "status": "Order_Completed",
+        "groomName": "상태신랑",
+        "brideName": "상태신부",
+        "orderItems": [],
+        "payments": [],
+        "alteration_details": [],
+    }
+    response = await client.post("/order/save", json=payload)
+    response.raise_for_status()
+    return response.json()["order_id"]
+
+
+async def test_status_endpoints_accept_name_or_value_and_return_value(client, make_event):
+    """단건/일괄 상태 변경 모두 이름(In_delivery)과 값(In delivery)을 받고 응답은 주문서 조회 API와 같은 값"""
+    event_id = make_event("주문 상태 변경")
+    order_id = await save_order(client, event_id)
+
+    for order_status in ("In_delivery", "Packaging Completed"):
+        response = await client.put(f"/orders/{order_id}/{order_status}")
+        assert response.status_code == 200, response.text
+    assert response.json()["status"] == "Packaging Completed"
+
+    response = await client.patch("/orders/status", json={"status": "Repair_Received", "ids": [order_id]})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["status"] == "Repair Received"
+    assert [result["status"] for result in body["results"]] == ["Repair Received"]
+
+    response = await client.get("/orders", params={"event_name": "주문 상태 변경"})
+    assert [order["status"] for order in response.json()["orders"]] == ["Repair Received"]
+
+    response = await client.put(f"/orders/{order_id}/nope")
+    assert response.status_code == 400
+
+
+async def test_status_history_and_dwell_times_return_status_values(client, make_event):
+    event_id = make_event("상태 이력")
+    order_id = await save_order(client, event_id)
+    for order_status in ("In_delivery", "Counsel"):
+        response = await client.put(f"/orders/{order_id}/{order_status}")
+        response.raise_for_status()
+
+    response = await client.get(f"/order/{order_id}/status-history")
+    assert response.status_code == 200, response.text
+    assert [entry["status"] for entry in response.json()] == ["Order Completed", "In delivery", "Counsel"]
+
+    response = await client.get(f"/events/{event_id}/status-dwell")
+    assert response.status_code == 200, response.text
+    assert sorted(entry["status"] for entry in response.json()["statuses"]) == ["In delivery", "Order Completed"]
+
+    response = await client.get(f"/events/{event_id}/dashboard")
+    assert response.status_code == 200, response.text
+    assert [entry["status"] for entry in response.json()["by_status"]] == ["Counsel"]
@@ -0,0 +1,91 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+# 스텁 응답 지연 (초)
+LATENCY = 0.05
+# 오늘(고시 전) 이전에 데이터가 없는 일수 (주말/휴일)
+GAP = 2
+
+
+@pytest.fixture
+def dates():
+    """조회할 기준일 목록, 데이터가 없는 날짜, 데이터가 있는 가장 최신 기준일"""
+    from services.rates import candidate_dates
+
+    now = datetime.now()
+    missing = [(now - timedelta(days=day)).strftime("%Y%m%d") for day in range(1, GAP + 1)]
+    return candidate_dates(now), missing, (now - timedelta(days=GAP + 1)).date()
+
+
+async def fetch_concurrent(dates: list) -> tuple:
+    import asyncio
+    from services.rates import fetch_exchange_data, fetch_gold_data, fetch_latest
+
+    return tuple(await asyncio.gather(fetch_latest(fetch_gold_data, dates), fetch_latest(fetch_exchange_data, dates)))
+
+
+async def test_fetch_latest_uses_newest_available_date(rate_stub, dates):
+    """모든 날짜를 동시에 조회하고 데이터가 있는 가장 최신 날짜의 결과 사용"""
+    from scripts.rate_stub_server import gold_price, usd_rate
+
+    candidates, missing, expected = dates
+    rate_stub(latency=LATENCY, missing=missing)
+    gold, exchange = await fetch_concurrent(candidates)
+
+    assert gold["gold_bas_dt"] == expected
+    assert gold["gold_24k"] == gold_price(expected.strftime("%Y%m%d"))
+    assert exchange["exchange_bas_dt"] == expected
+    assert exchange["usd"] == usd_rate(expected.strftime("%Y%m%d"))
+
+
+async def test_fetch_retries_after_temporary_failure(rate_stub, dates):
+    """날짜별 첫 요청이 503이어도 재시도로 같은 결과"""
+    candidates, missing, expected = dates
+    stats = rate_stub(latency=LATENCY, missing=missing, flaky=1)
+    gold, exchange = await fetch_concurrent(candidates)
+
+    assert stats.failures > 0
+    assert gold["gold_bas_dt"] == expected
+    assert exchange["exchange_bas_dt"] == expected
+
+
+async def test_fetch_falls_back_to_older_date_after_timeout(rate_stub, dates, monkeypatch):
+    """가장 최신 날짜의 응답이 멈추면 타임아웃 후 그다음 날짜를 사용하고, 전체 시간은 타임아웃 x 시도 횟수 이내"""
+    from config import settings
+
+    monkeypatch.setattr(settings, "RATE_HTTP_TIMEOUT", 0.5)
+    monkeypatch.setattr(settings, "RATE_HTTP_RETRIES", 1)
+    candidates, missing, expected = dates
+    rate_stub(latency=LATENCY, missing=missing, slow=[expected.strftime("%Y%m%d")], slow_seconds=2)
+
+    started = time.perf_counter()
+    gold, exchange = await fetch_concurrent(candidates)
+    elapsed = time.perf_counter() - started
+
+    fallback = expected - timedelta(days=1)
+    assert gold["gold_bas_dt"] == fallback
+    assert exchange["exchange_bas_dt"] == fallback
+    bound = (settings.RATE_HTTP_TIMEOUT + LATENCY) * (settings.RATE_HTTP_RETRIES + 1) + settings.RATE_HTTP_BACKOFF_SECONDS + 1
+    assert elapsed < bound
+
+
+async def test_update_rate_data_stores_fetched_rate(rate_stub, dates, database):
+    from database import AsyncSessionLocal, async_engine
+    from services import rates
+
+    candidates, missing, expected = dates
+    rate_stub(latency=LATENCY, missing=missing)
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await rates.update_rate_data(db)
+            latest = await rates.get_latest_rate(db)
+    finally:
+        await async_engine.dispose()
+
+    assert result == rates.UPDATED
+    assert latest.gold_bas_dt == expected
+    assert latest.exchange_bas_dt == expected
@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, insert, select
+
+pytestmark = pytest.mark.anyio
+
+# 주문서 수정 1회당 문장 수 상한 (하위 데이터 개수와 무관한 고정 문장들의 합)
+# (임시 주문서를 확정할 때의 주문번호 발급 1문장은 주문번호가 이미 있는 이 검사 경로에서는 실행되지 않음)
+ORDER_STATEMENTS = 2  # 주문서 조회, UPDATE
+STATUS_HISTORY_STATEMENTS = 1  # 상태 변경 이력 INSERT ... SELECT
+ROLLUP_STATEMENTS = 2  # 일별 집계에서 빼고 다시 더함
+CHILD_SELECT_STATEMENTS = 3  # 주문 상품/결제/수선 조회
+CHILD_WRITE_STATEMENTS = 3 * 3  # 테이블(3)별 INSERT/UPDATE/DELETE 최대 1문장씩
+SEARCH_STATEMENTS = 2  # 검색 문서 DELETE + INSERT ... SELECT
+MAX_STATEMENTS = (
+    ORDER_STATEMENTS + STATUS_HISTORY_STATEMENTS + ROLLUP_STATEMENTS
+    + CHILD_SELECT_STATEMENTS + CHILD_WRITE_STATEMENTS + SEARCH_STATEMENTS
+)
+SIZES = (1, 10, 40, 80)
+
+
+@contextmanager
+def count_statements():
+    """블록 안에서 실행된 SQL 문장 목록"""
+    from database import async_engine
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def order_children(make_event):
+    """행사와 수정에 쓸 수선 항목/상품/속성 생성"""
+    from database import SessionLocal
+    from models import Attributes, Category, Event, FormRepair, Product
+
+    event_id = make_event("문장 수 검사")
+    with SessionLocal() as session:
+        form_id = session.scalar(select(Event.form_id).where(Event.id == event_id))
+        category_id = session.execute(insert(Category).values(name="정장", created_at=datetime.now()).returning(Category.id)).scalar_one()
+        repair_ids = session.execute(insert(FormRepair).returning(FormRepair.id), [
+            {"form_id": form_id, "information": f"수선 {index}", "indexNumber": index} for index in range(max(SIZES))
+        ]).scalars().all()
+        product_ids = session.execute(insert(Product).returning(Product.id), [
+            {"name": f"상품 {index}", "category_id": category_id, "price": 100} for index in range(max(SIZES))
+        ]).scalars().all()
+        attribute_id = session.execute(insert(Attributes).values(value="M").returning(Attributes.id)).scalar_one()
+        session.commit()
+
+    def payload(size: int, figure: float) -> dict:
+        return {
+            "event_id": event_id,
+            "status": "Order_Completed",
+            "groomName": "신랑",
+            "brideName": "신부",
+            "orderItems": [
+                {"product_id": product_ids[index], "attributes_id": attribute_id, "quantity": 1, "price": 100 + index}
+                for index in range(size)
+            ],
+            "payments": [
+                {"payer": "결제자", "cashAmount": figure, "cashCurrency": "KRW", "paymentMethod": "ADVANCE"},
+                {"payer": "결제자", "cashAmount": figure, "cashCurrency": "KRW", "paymentMethod": "BALANCE"},
+            ],
+            "alteration_details": [
+                {"form_repair_id": repair_ids[index], "figure": figure, "alterationFigure": figure + 1}
+                for index in range(size)
+            ],
+        }
+
+    return payload, repair_ids
+
+
+async def test_update_order_statement_count_does_not_depend_on_children(client, order_children):
+    """주문서 수정 1회당 SQL 문장 수가 하위 데이터 개수와 무관하게 MAX_STATEMENTS 이하"""
+    from database import SessionLocal
+    from models import AlterationDetails, OrderItems, Payments
+
+    payload, repair_ids = order_children
+    response = await client.post("/order/save", json=payload(1, 1.0))
+    response.raise_for_status()
+    order_id = response.json()["order_id"]
+
+    counts = []
+    # 크기를 늘렸다 줄이며 추가/수정/삭제 경로를 모두 거치고, 마지막에는 같은 내용으로 다시 저장(자동 저장)
+    steps = [(size, float(size)) for size in SIZES] + [(SIZES[1], 2.5), (SIZES[1], 2.5)]
+    for size, figure in steps:
+        with count_statements() as statements:
+            response = await client.put(f"/order/save/{order_id}", json=payload(size, figure))
+        response.raise_for_status()
+        counts.append(len(statements))
+
+    assert max(counts) <= MAX_STATEMENTS, counts
+    # 첫 단계는 생성 시와 같은 내용이라 하위 데이터 변경이 없으므로 제외하고, 늘어나는 단계끼리 비교
+    assert len(set(counts[1:len(SIZES)])) == 1, counts
+
+    with SessionLocal() as session:
+        items = session.scalars(select(OrderItems).where(OrderItems.order_id == order_id).order_by(OrderItems.id)).all()
+        alterations = session.scalars(select(AlterationDetails).where(AlterationDetails.order_id == order_id)).all()
+        payments = session.scalars(select(Payments).where(Payments.order_id == order_id)).all()
+
+    last_size, last_figure = steps[-1]
+    assert [item.price for item in items] == [100 + index for index in range(last_size)]
+    # 수선/결제는 요청에 없는 기존 행을 유지하므로 가장 많았던 개수만큼 남아 있어야 한다
+    assert len(alterations) == max(SIZES)
+    changed = [row for row in alterations if row.form_repair_id in repair_ids[:last_size]]
+    assert all(row.figure == last_figure for row in changed)
+    assert len(payments) == 2
+    assert all(float(row.cashAmount) == last_figure for row in payments)
@@ -5,6 +5,18 @@ const api = axios.create({
   baseURL: process.env.REACT_APP_API_URL,
 });
 
+// 저장/수정 직후 조회는 DB primary에서 처리하도록 서버가 준 고정 만료 시각을 다시 보냄 (복제 지연 대응)
+// 다른 도메인의 API라 쿠키를 쓸 수 없으므로 응답 헤더 값을 저장해 두고 요청 헤더로 전달
+const PRIMARY_STICKY_HEADER = "X-DB-Primary-Until";
+const PRIMARY_STICKY_KEY = "dbPrimaryUntil";
+
+const savePrimarySticky = (response) => {
+  const value = response?.headers?.[PRIMARY_STICKY_HEADER.toLowerCase()];
+  if (value) {
+    localStorage.setItem(PRIMARY_STICKY_KEY, value);
+  }
+};
+
 // Request 인터셉터
 api.interceptors.request.use(
   (config) => {
@@ -17,6 +29,13 @@ api.interceptors.request.use(
     if (token) {
       config.headers["Authorization"] = `Bearer ${token}`;
     }
+
+    const primaryUntil = localStorage.getItem(PRIMARY_STICKY_KEY);
+    if (primaryUntil && Number(primaryUntil) * 1000 > Date.now()) {
+      config.headers[PRIMARY_STICKY_HEADER] = primaryUntil;
+    } else if (primaryUntil) {
+      localStorage.removeItem(PRIMARY_STICKY_KEY);
+    }
     return config;
   },
   (error) => {
@@ -26,7 +45,10 @@ api.interceptors.request.use(
 
 // Response 인터셉터
 api.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    savePrimarySticky(response);
+    return response;
+  },
   async (error) => {
     const originalRequest = error.config;
     if (error.response?.status === 401 && !originalRequest._retry) {